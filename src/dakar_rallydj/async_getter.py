@@ -0,0 +1,172 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import AsyncIterator, Optional, Union, List, Tuple
+
+import pandas as pd
+
+from .getter import DakarAPIClient
+from .proxies import ProxyRegistry
+from .results import LazyFrames, ScoresResult, StagesResult
+from .watcher import ScoreWatcher
+
+
+class AsyncDakarAPIClient:
+    """
+    Asyncio client for accessing Dakar Rally API data.
+
+    Wraps a DakarAPIClient whose proxy shares a single pooled HTTP session.
+    Each request, and the pandas parsing of its response, runs on a bounded
+    worker pool so the event loop is never blocked, and calls across
+    categories and stages can be combined with asyncio.gather().
+    """
+
+    def __init__(self, year: int = 2025, category: str = "A", stage: int = 1,
+                 use_cache: bool = False, max_concurrency: int = 8,
+                 api_template: Optional[str] = None, **cache_kwargs):
+        """
+        Initialize the async Dakar API client.
+
+        Args:
+            year: Default year for API requests
+            category: Default category for API requests
+            stage: Default stage for API requests
+            use_cache: Whether to enable request caching
+            max_concurrency: Maximum number of requests in flight at once
+            api_template: Override the API URL template (e.g. a local stand-in server)
+            **cache_kwargs: Cache configuration options passed to requests_cache
+        """
+        # Size the connection pool to match the number of concurrent requests
+        self.registry = ProxyRegistry(pool_maxsize=max_concurrency)
+        self.client = DakarAPIClient(year=year, category=category, stage=stage,
+                                     use_cache=use_cache, api_template=api_template,
+                                     registry=self.registry, **cache_kwargs)
+
+        self._executor = ThreadPoolExecutor(max_workers=max(1, max_concurrency))
+
+    async def _run(self, func, *args, **kwargs):
+        """Run a blocking client call on the worker pool."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, partial(func, *args, **kwargs))
+
+    @staticmethod
+    def _materialised(func, *args, **kwargs) -> LazyFrames:
+        """Call a getter returning lazy tables, and build them all, off the event loop."""
+        result = func(*args, **kwargs)
+        for _ in result:
+            pass
+        return result
+
+    async def get_category(self, year: Optional[int] = None,
+                           use_cache: Optional[bool] = None, **cache_kwargs) -> pd.DataFrame:
+        """Get category data."""
+        return await self._run(self.client.get_category, year=year,
+                               use_cache=use_cache, **cache_kwargs)
+
+    async def get_groups(self, year: Optional[int] = None,
+                         use_cache: Optional[bool] = None, **cache_kwargs) -> pd.DataFrame:
+        """Get groups data."""
+        return await self._run(self.client.get_groups, year=year,
+                               use_cache=use_cache, **cache_kwargs)
+
+    async def get_clazz(self, year: Optional[int] = None,
+                        category: Optional[Union[str, List[str]]] = None,
+                        use_cache: Optional[bool] = None, **cache_kwargs) -> pd.DataFrame:
+        """Get clazz data for one or more categories, fetched concurrently."""
+        category = category or self.client.category
+        if isinstance(category, str):
+            category = [category]
+
+        dfs = await asyncio.gather(*[
+            self._run(self.client.get_clazz, year=year, category=c,
+                      use_cache=use_cache, **cache_kwargs)
+            for c in category])
+
+        return pd.concat(dfs, ignore_index=True).reset_index(drop=True)
+
+    async def get_withdrawals(self, year: Optional[int] = None,
+                              category: Optional[Union[str, List[str]]] = None,
+                              use_cache: Optional[bool] = None, return_failures: bool = False,
+                              **cache_kwargs):
+        """
+        Get withdrawals data for one or more categories, fetched concurrently.
+
+        As with DakarAPIClient.get_withdrawals(), a failed category does not
+        lose the others; return_failures returns (frames, failures).
+        """
+        year = year or self.client.year
+        category = category or self.client.category
+        if isinstance(category, str):
+            category = [category]
+
+        results = await asyncio.gather(*[
+            self._run(self.client.get_withdrawals, year=year, category=c,
+                      use_cache=use_cache, **cache_kwargs)
+            for c in category], return_exceptions=True)
+
+        frames, failures = [], {}
+        for c, result in zip(category, results):
+            if isinstance(result, Exception):
+                failures[c] = result
+            elif isinstance(result, BaseException):
+                raise result
+            else:
+                frames.append(result)
+
+        return self.client._withdrawals_result(self.client._combine_withdrawals(frames), failures,
+                                               category, year, return_failures)
+
+    async def get_stages(self, year: Optional[int] = None,
+                         category: Optional[str] = None,
+                         use_cache: Optional[bool] = None, **cache_kwargs) -> StagesResult:
+        """Get stages information (start time, surfaces, sections), with every table built."""
+        return await self._run(self._materialised, self.client.get_stages, year=year, category=category,
+                               use_cache=use_cache, **cache_kwargs)
+
+    async def get_waypoints(self, year: Optional[int] = None,
+                            category: Optional[str] = None,
+                            stage: Optional[int] = None,
+                            use_cache: Optional[bool] = None, **cache_kwargs) -> pd.DataFrame:
+        """Get waypoints data for a specific stage and category."""
+        return await self._run(self.client.get_waypoints, year=year, category=category,
+                               stage=stage, use_cache=use_cache, **cache_kwargs)
+
+    async def get_waypoints_bulk(self, categories: Optional[Union[str, List[str]]] = None,
+                                 stages: Optional[List[int]] = None,
+                                 year: Optional[int] = None, max_workers: int = 8,
+                                 use_cache: Optional[bool] = None, **cache_kwargs) -> pd.DataFrame:
+        """Get waypoints data for several categories and stages as a single frame."""
+        return await self._run(self.client.get_waypoints_bulk, categories=categories, stages=stages,
+                               year=year, max_workers=max_workers, use_cache=use_cache, **cache_kwargs)
+
+    async def get_scores(self, year: Optional[int] = None,
+                         category: Optional[str] = None,
+                         stage: Optional[int] = None,
+                         use_cache: Optional[bool] = None, **cache_kwargs) -> ScoresResult:
+        """Get lastScore information (results, times), with every table built."""
+        return await self._run(self._materialised, self.client.get_scores, year=year, category=category,
+                               stage=stage, use_cache=use_cache, **cache_kwargs)
+
+    async def watch_scores(self, categories: Optional[Union[str, List[str]]] = None,
+                           stage: Optional[int] = None, year: Optional[int] = None,
+                           min_interval: float = 5.0, max_interval: float = 120.0,
+                           backoff: float = 2.0, max_polls: Optional[int] = None,
+                           use_cache: Optional[bool] = None, **cache_kwargs) -> AsyncIterator[Tuple[str, pd.DataFrame, pd.DataFrame]]:
+        """Watch live lastScore results, yielding only new or changed rows (see DakarAPIClient.watch_scores)."""
+        watcher = ScoreWatcher(self.client, categories or self.client.category,
+                               stage=stage, year=year, min_interval=min_interval,
+                               max_interval=max_interval, backoff=backoff,
+                               use_cache=use_cache, **cache_kwargs)
+        async for event in watcher.awatch(max_polls=max_polls):
+            yield event
+
+    async def close(self) -> None:
+        """Shut down the worker pool and release pooled connections."""
+        self._executor.shutdown(wait=True)
+        self.registry.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
@@ -0,0 +1,211 @@
+import json
+import os
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+
+class BackfillManifest:
+    """
+    Progress of a backfill, saved as JSON after every finished slice.
+
+    Slices are named like "scores/2024/A/3". Each has a status ("done" or
+    "failed") with details, and the categories and stages found for each year
+    are kept too, so a resumed backfill does not need to rediscover them.
+    """
+
+    VERSION = 1
+
+    def __init__(self, path: str):
+        """
+        Args:
+            path: Manifest file; loaded if it exists
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self.slices: Dict[str, Dict[str, Any]] = {}
+        self.discovered: Dict[str, Dict[str, List[int]]] = {}
+        if os.path.exists(path):
+            with open(path) as f:
+                state = json.load(f)
+            self.slices = state.get("slices", {})
+            self.discovered = state.get("discovered", {})
+
+    def save(self) -> None:
+        """Write the manifest atomically, so a crash never leaves it half written."""
+        with self._lock:
+            state = {"version": self.VERSION, "slices": self.slices, "discovered": self.discovered}
+            directory = os.path.dirname(os.path.abspath(self.path))
+            os.makedirs(directory, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=directory, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w") as f:
+                    json.dump(state, f, indent=1, sort_keys=True)
+                os.replace(tmp, self.path)
+            finally:
+                if os.path.exists(tmp):
+                    os.remove(tmp)
+
+    def done(self, key: str) -> bool:
+        return self.slices.get(key, {}).get("status") == "done"
+
+    def mark(self, key: str, status: str, **info) -> None:
+        """Record a slice's status and save the manifest."""
+        with self._lock:
+            self.slices[key] = {"status": status,
+                                "at": datetime.now(timezone.utc).isoformat(), **info}
+        self.save()
+
+    def discover(self, year: int, category: str, stages: List[int]) -> None:
+        """Record the stages found for a category and save the manifest."""
+        with self._lock:
+            self.discovered.setdefault(str(year), {})[category] = [int(stage) for stage in stages]
+        self.save()
+
+    def summary(self) -> Dict[str, int]:
+        """Number of slices by status."""
+        counts: Dict[str, int] = {}
+        for state in self.slices.values():
+            counts[state["status"]] = counts.get(state["status"], 0) + 1
+        return counts
+
+
+class Backfill:
+    """
+    Resumable backfill of several years into a DakarParquetDataset.
+
+    Categories are discovered with get_category() and each category's stages
+    with get_stages() (which is itself archived), rather than hardcoded. The
+    withdrawals of each year, and the waypoints and scores of each stage, are
+    then fetched concurrently and written as they arrive. Every finished slice
+    is recorded in the manifest, so rerunning after a crash or a failed slice
+    only fetches what is still missing.
+
+    Usage:
+        backfill = Backfill(client, DakarParquetDataset("archive"), "archive/manifest.json")
+        backfill.run(range(2016, 2026))
+    """
+
+    def __init__(self, client, dataset, manifest_path: str, max_workers: int = 8,
+                 **getter_kwargs):
+        """
+        Args:
+            client: DakarAPIClient to get the frames with
+            dataset: DakarParquetDataset to write the tables to
+            manifest_path: Manifest file to record progress in
+            max_workers: Maximum number of slices fetched concurrently
+            **getter_kwargs: Passed to each getter, e.g. use_cache
+        """
+        self.client = client
+        self.dataset = dataset
+        self.manifest = BackfillManifest(manifest_path)
+        self.max_workers = max(1, max_workers)
+        self.getter_kwargs = getter_kwargs
+
+    def _run_slice(self, key: str, task: Callable[[], Dict[str, Any]]) -> bool:
+        """Run a slice, recording its outcome; returns whether it succeeded."""
+        try:
+            info = task() or {}
+        except Exception as e:
+            self.manifest.mark(key, "failed", error=f"{type(e).__name__}: {e}")
+            return False
+        self.manifest.mark(key, "done", **info)
+        return True
+
+    def _categories(self, year: int, categories: Optional[Iterable[str]]) -> List[str]:
+        """Categories of a year, from the manifest or get_category()."""
+        if categories is not None:
+            return list(categories)
+        key = f"categories/{year}"
+        # Every category found is recorded with the slice, whether or not its stages were
+        if self.manifest.done(key):
+            return list(self.manifest.slices[key]["categories"])
+        found = []
+
+        def task():
+            category_df = self.client.get_category(year=year, **self.getter_kwargs)
+            # References are like "2025-A"; the category code is the suffix
+            references = category_df["reference"].dropna().astype(str)
+            found.extend(references.str.rsplit("-", n=1).str[-1].unique().tolist())
+            return {"categories": found}
+
+        self._run_slice(key, task)
+        return found
+
+    def _stages(self, year: int, category: str) -> Optional[List[int]]:
+        """Stages of a category, archiving its stages tables on first discovery; None if that fails."""
+        key = f"stages/{year}/{category}"
+        known = self.manifest.discovered.get(str(year), {}).get(category)
+        if known is not None and self.manifest.done(key):
+            return known
+        found = []
+
+        def task():
+            result = self.client.get_stages(year=year, category=category, **self.getter_kwargs)
+            stages = result.stages
+            found.extend(sorted(int(stage) for stage in stages["stage"].dropna().unique()))
+            files = self.dataset.write_stages(result, year, category)
+            self.manifest.discover(year, category, found)
+            return {"files": len(files), "stages": len(found)}
+
+        return found if self._run_slice(key, task) else None
+
+    def plan(self, years: Iterable[int],
+             categories: Optional[Iterable[str]] = None) -> List[Tuple[str, Callable[[], Dict[str, Any]]]]:
+        """
+        Discover the categories and stages of each year, and list the slices still to fetch.
+
+        Returns:
+            List of (slice key, task) for slices not yet done
+        """
+        client, kwargs = self.client, self.getter_kwargs
+        years = list(years)
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            year_categories = dict(zip(years, executor.map(
+                lambda year: self._categories(year, categories), years)))
+            pairs = [(year, category) for year in years for category in year_categories[year]]
+            stages = dict(zip(pairs, executor.map(lambda pair: self._stages(*pair), pairs)))
+
+        tasks = []
+        for year in years:
+            if year_categories[year]:
+                tasks.append((f"withdrawals/{year}", lambda year=year: self._withdrawals(
+                    year, year_categories[year])))
+        for (year, category), found in stages.items():
+            for stage in found or []:
+                tasks.append((f"waypoints/{year}/{category}/{stage}",
+                              lambda year=year, category=category, stage=stage: {"files": len(
+                                  self.dataset.write("waypoints", client.get_waypoints(
+                                      year=year, category=category, stage=stage, **kwargs), year))}))
+                tasks.append((f"scores/{year}/{category}/{stage}",
+                              lambda year=year, category=category, stage=stage: {"files": len(
+                                  self.dataset.write_scores(client.get_scores(
+                                      year=year, category=category, stage=stage, **kwargs),
+                                      year, category, stage))}))
+        return [(key, task) for key, task in tasks if not self.manifest.done(key)]
+
+    def _withdrawals(self, year: int, categories: List[str]) -> Dict[str, int]:
+        """Write a year's withdrawals, failing the slice unless every category was fetched."""
+        withdrawals, failures = self.client.get_withdrawals(
+            year=year, category=categories, return_failures=True, **self.getter_kwargs)
+        if failures:
+            raise next(iter(failures.values()))
+        return {"files": len(self.dataset.write_withdrawals(withdrawals, year))}
+
+    def run(self, years: Iterable[int], categories: Optional[Iterable[str]] = None) -> Dict[str, int]:
+        """
+        Backfill years, skipping slices the manifest records as done.
+
+        Args:
+            years: Years to backfill
+            categories: Categories to backfill (default: every category of each year)
+
+        Returns:
+            Number of slices in the manifest by status
+        """
+        tasks = self.plan(years, categories)
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            list(executor.map(lambda item: self._run_slice(*item), tasks))
+        return self.manifest.summary()
@@ -0,0 +1,238 @@
+import copy
+import time
+from typing import Iterable, List, Optional
+
+import pandas as pd
+
+from .decoders import (COMPACT_CATEGORIES, CategorySets, compact_long_results,
+                       long_results_ce_from_records)
+from .getter import json_loads
+from .results import LazyFrames
+
+
+def time_getters(client, categories: Optional[List[str]] = None,
+                 stages: Optional[Iterable[int]] = None,
+                 year: Optional[int] = None, repeat: int = 3) -> pd.DataFrame:
+    """
+    Time every getter of a client over a set of categories and stages.
+
+    Run against a replaying client, or one pointed at a FixtureServer,
+    for reproducible, network-free measurements. Parse results are memoised
+    by the client's payload store, so give the client a PayloadStore(maxsize=0)
+    to time the full fetch and parse on every call.
+
+    Args:
+        client: DakarAPIClient to benchmark
+        categories: Categories to fetch; defaults to the client category
+        stages: Stages to fetch; defaults to the client stage
+        year: Year to fetch; defaults to the client year
+        repeat: Number of times to repeat each call
+
+    Returns:
+        DataFrame of call timings with columns
+        getter, category, stage, run, seconds
+    """
+    categories = categories or [client.category]
+    stages = list(stages or [client.stage])
+    year = year or client.year
+
+    calls = [("get_category", None, None), ("get_groups", None, None)]
+    for category in categories:
+        calls += [("get_clazz", category, None),
+                  ("get_withdrawals", category, None),
+                  ("get_stages", category, None)]
+        for stage in stages:
+            calls += [("get_waypoints", category, stage),
+                      ("get_scores", category, stage)]
+
+    timings = []
+    for getter, category, stage in calls:
+        kwargs = {"year": year}
+        if category is not None:
+            kwargs["category"] = category
+        if stage is not None:
+            kwargs["stage"] = stage
+        for run in range(repeat):
+            start = time.perf_counter()
+            result = getattr(client, getter)(**kwargs)
+            if isinstance(result, LazyFrames):
+                # Time building every table, not just the fetch
+                tuple(result)
+            timings.append({"getter": getter, "category": category, "stage": stage,
+                            "run": run, "seconds": time.perf_counter() - start})
+
+    return pd.DataFrame(timings)
+
+
+def time_long_results_ce(client, categories: Optional[List[str]] = None,
+                         stages: Optional[Iterable[int]] = None,
+                         year: Optional[int] = None, repeat: int = 3) -> pd.DataFrame:
+    """
+    Time the legacy and record-decoding long_results_ce routines.
+
+    The lastScore payload for each category and stage is fetched once, then
+    each routine is timed on it, from decoded JSON records to the long table,
+    as called once per category x stage in a sweep.
+
+    Args:
+        client: DakarAPIClient to fetch the lastScore payloads with
+        categories: Categories to fetch; defaults to the client category
+        stages: Stages to fetch; defaults to the client stage
+        year: Year to fetch; defaults to the client year
+        repeat: Number of times to repeat each routine
+
+    Returns:
+        DataFrame of timings with columns
+        routine, category, stage, run, seconds, rows
+    """
+    categories = categories or [client.category]
+    stages = list(stages or [client.stage])
+    year = year or client.year
+    proxy = client._get_request_proxy(None)
+
+    def legacy(records, category, stage):
+        _results_df = pd.json_normalize(records)
+        _, _, _results_df = client.normalize_team_competitors(_results_df, year=year)
+        return client.long_results_ce(_results_df)
+
+    def decoded(records, category, stage):
+        return long_results_ce_from_records(records, year, category, stage)
+
+    timings = []
+    for category in categories:
+        for stage in stages:
+            path = client.SCORE_TEMPLATE.format(year=year, category=category, stage=stage)
+            _, content = client._fetch(path, proxy, refresh=True)
+            records = json_loads(content)
+            for routine, func in (("legacy", legacy), ("decoded", decoded)):
+                for run in range(repeat):
+                    start = time.perf_counter()
+                    df = func(records, category, stage)
+                    timings.append({"routine": routine, "category": category, "stage": stage,
+                                    "run": run, "seconds": time.perf_counter() - start,
+                                    "rows": len(df)})
+
+    return pd.DataFrame(timings)
+
+
+def compact_memory(client, categories: Optional[List[str]] = None,
+                   stages: Optional[Iterable[int]] = None,
+                   year: Optional[int] = None) -> pd.DataFrame:
+    """
+    Report the memory saved by compact long results frames.
+
+    The frames are compacted against category sets of their own. A frame's
+    compact_bytes count its categorical codes but not the shared categories,
+    which are reported once, in a final "category_sets" row, so that the
+    compact_bytes and saved columns add up to the totals for the sweep.
+
+    Args:
+        client: DakarAPIClient to fetch the lastScore payloads with
+        categories: Categories to fetch; defaults to the client category
+        stages: Stages to fetch; defaults to the client stage
+        year: Year to fetch; defaults to the client year
+
+    Returns:
+        DataFrame of deep memory usage with columns
+        table, category, stage, rows, bytes, compact_bytes, saved
+    """
+    categories = categories or [client.category]
+    stages = list(stages or [client.stage])
+    year = year or client.year
+    category_sets = CategorySets()
+
+    report = []
+    for category in categories:
+        for stage in stages:
+            frames = client.get_scores(year=year, category=category, stage=stage)
+            for table, df in (("long_results_cg", frames[0]), ("long_results_ce", frames[1])):
+                size = int(df.memory_usage(deep=True).sum())
+                compact_size = _unshared_bytes(compact_long_results(df, category_sets))
+                report.append({"table": table, "category": category, "stage": stage,
+                               "rows": len(df), "bytes": size, "compact_bytes": compact_size,
+                               "saved": size - compact_size})
+
+    shared = category_sets.memory_usage()
+    report.append({"table": "category_sets", "category": None, "stage": None, "rows": 0,
+                   "bytes": 0, "compact_bytes": shared, "saved": -shared})
+    return pd.DataFrame(report)
+
+
+def _unshared_bytes(df: pd.DataFrame) -> int:
+    """Deep memory usage of a compact frame, without the categories of its shared categoricals."""
+    size = int(df.index.memory_usage(deep=True))
+    for col in df.columns:
+        if col in COMPACT_CATEGORIES:
+            size += int(df[col].cat.codes.nbytes)
+        else:
+            size += int(df[col].memory_usage(deep=True, index=False))
+    return size
+
+
+def time_backends(client, categories: Optional[List[str]] = None,
+                  stages: Optional[Iterable[int]] = None,
+                  year: Optional[int] = None, backends: Iterable[str] = ("pandas", "polars"),
+                  repeat: int = 3) -> pd.DataFrame:
+    """
+    Time the lastScore, waypoint, withdrawal and stage parsers on each backend.
+
+    Every payload is fetched once, then parsed with each backend, building
+    every table. Pass every category and stage of a season to time full-season
+    inputs.
+
+    Args:
+        client: DakarAPIClient to fetch the payloads with
+        categories: Categories to fetch; defaults to the client category
+        stages: Stages to fetch; defaults to the client stage
+        year: Year to fetch; defaults to the client year
+        backends: Backends to time (see DakarAPIClient.BACKENDS)
+        repeat: Number of times to repeat each parse
+
+    Returns:
+        DataFrame of parse timings with columns
+        pipeline, backend, category, stage, run, seconds
+    """
+    categories = categories or [client.category]
+    stages = list(stages or [client.stage])
+    year = year or client.year
+    proxy = client._get_request_proxy(None)
+
+    def content(template, **kwargs):
+        _, payload = client._fetch(template.format(year=year, **kwargs), proxy, refresh=True)
+        return payload
+
+    # pipeline, category, stage, payload, parse(parser client, payload)
+    jobs = []
+    for category in categories:
+        jobs.append(("withdrawals", category, None,
+                     content(client.WITHDRAWAL_TEMPLATE, category=category),
+                     lambda parser, payload, category=category:
+                         parser._parse_withdrawals(payload, category)))
+        jobs.append(("stages", category, None,
+                     content(client.STAGE_TEMPLATE, category=category),
+                     lambda parser, payload: tuple(parser._parse_stages(payload))))
+        for stage in stages:
+            jobs.append(("waypoints", category, stage,
+                         content(client.WAYPOINT_TEMPLATE, category=category, stage=stage),
+                         lambda parser, payload, category=category, stage=stage:
+                             parser._parse_waypoints(payload, year, category, stage)))
+            jobs.append(("scores", category, stage,
+                         content(client.SCORE_TEMPLATE, category=category, stage=stage),
+                         lambda parser, payload, category=category, stage=stage:
+                             tuple(parser._parse_scores(json_loads(payload), year,
+                                                        category, stage, payload))))
+
+    timings = []
+    for backend in backends:
+        # A view of the client that parses with this backend
+        parser = copy.copy(client)
+        parser.backend = backend
+        for pipeline, category, stage, payload, parse in jobs:
+            for run in range(repeat):
+                start = time.perf_counter()
+                parse(parser, payload)
+                timings.append({"pipeline": pipeline, "backend": backend,
+                                "category": category, "stage": stage, "run": run,
+                                "seconds": time.perf_counter() - start})
+
+    return pd.DataFrame(timings)
@@ -0,0 +1,323 @@
+import re
+import threading
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+from pandas.api.types import union_categoricals
+
+# Metrics kept in the long results tables, and scaled from milliseconds to seconds.
+# The ce pattern deliberately keeps the historical "relative`" typo, so ce
+# relative times are not included, as in DakarAPIClient.long_results_ce()
+CG_METRICS = re.compile("position|absolute|relative")
+CE_METRICS = re.compile("position|absolute|relative`|bonus")
+DSS_METRICS = re.compile("position|absolute")
+TIME_METRICS = ("absolute", "relative")
+WAYPOINT = re.compile(r"\.([^\.]+)\.")
+
+
+# Columns of the long results tables stored as shared categoricals or narrow ints in compact mode.
+# `_id` has a value per crew and stage, so it is a categorical over its own frame's values only,
+# rather than growing the shared sets with every payload ever compacted
+COMPACT_CATEGORIES = ["type", "waypoint", "metric", "category"]
+COMPACT_FRAME_CATEGORIES = ["_id"]
+COMPACT_INTS = {"team.bib": np.int32, "value_0": np.int32, "value_1": np.int32,
+                "year": np.int16, "stage": np.int16}
+
+
+def _flatten(key: str, value: Any) -> Iterator[Tuple[str, Any]]:
+    """Flatten nested dicts to dotted keys, as pd.json_normalize() does."""
+    if isinstance(value, dict):
+        for k, v in value.items():
+            yield from _flatten(f"{key}.{k}", v)
+    else:
+        yield key, value
+
+
+def _isna(value: Any) -> bool:
+    """Test for a missing scalar value."""
+    return value is None or (isinstance(value, float) and value != value)
+
+
+def _gather_cells(records: List[dict], prefixes: Tuple[str, ...]
+                  ) -> Tuple[pd.Series, pd.Series, np.ndarray, Dict[str, Tuple[List[int], List[Any]]]]:
+    """
+    Gather the cells of the flattened columns starting with any of `prefixes`.
+
+    Returns:
+        Tuple of (_id series, team.bib series, mask of rows with both set,
+        dict of column -> (rows, values)) where the columns are in
+        pd.json_normalize() order and only non-null cells of valid rows are kept
+    """
+    ids = pd.Series([record.get("_id") for record in records])
+    bibs = pd.Series([(record.get("team") or {}).get("bib") for record in records])
+    valid = (ids.notna() & bibs.notna()).to_numpy()
+
+    cells: Dict[str, Tuple[List[int], List[Any]]] = {}
+    for row, record in enumerate(records):
+        for key, value in record.items():
+            if not key.startswith(prefixes):
+                continue
+            for flat_key, flat_value in _flatten(key, value):
+                rows, values = cells.setdefault(flat_key, ([], []))
+                if valid[row] and not _isna(flat_value):
+                    rows.append(row)
+                    values.append(flat_value)
+
+    return ids, bibs, valid, cells
+
+
+def long_results_cg_from_records(records: List[dict], year: int,
+                                 category: str, stage: int) -> pd.DataFrame:
+    """
+    Decode lastScore records directly into the long_results_cg table.
+
+    Each cg/cs key is parsed once per payload, rather than once per melted row.
+    Values are gathered straight from the JSON records into typed column arrays,
+    and year, category and stage are taken from the request, not from `_id`.
+    The rows, their order and their index match
+    DakarAPIClient.long_results_cg() applied to the normalised payload.
+
+    Args:
+        records: Decoded lastScore JSON records
+        year: Year of the lastScore payload
+        category: Category of the lastScore payload
+        stage: Stage of the lastScore payload
+    """
+    nrows = len(records)
+    ids, bibs, _, cells = _gather_cells(records, ("cg", "cs"))
+
+    index, rows, values = [], [], []
+    types, waypoints, metrics, scaled = [], [], [], []
+    for col, (key, (key_rows, key_values)) in enumerate(cells.items()):
+        if not key_rows or not CG_METRICS.search(key):
+            continue
+        parts = key.split(".")
+        waypoint = WAYPOINT.search(key)
+        n = len(key_rows)
+
+        index.extend(col * nrows + row for row in key_rows)
+        rows.extend(key_rows)
+        values.extend(key_values)
+        types.extend([parts[0]] * n)
+        waypoints.extend([waypoint.group(1) if waypoint else np.nan] * n)
+        metrics.extend([parts[-1]] * n)
+        scaled.extend([parts[-1] in TIME_METRICS] * n)
+
+    # Times are in milliseconds; make them more natural as seconds
+    value_array = np.array(values, dtype=float).reshape(len(values), -1)
+    value_array[np.array(scaled, dtype=bool)] /= 1000
+    value_array = value_array.astype(int)
+
+    rows = np.array(rows, dtype=np.intp)
+    index = pd.Index(index, dtype=int)
+    n = len(rows)
+    return pd.DataFrame({
+        "_id": ids.take(rows).array,
+        "team.bib": bibs.take(rows).array,
+        "type": pd.Series(types, index=index, dtype=object),
+        "waypoint": waypoints,
+        "metric": pd.Series(metrics, index=index, dtype=object),
+        "value_0": value_array[:, 0],
+        "value_1": value_array[:, 1],
+        "year": np.full(n, year, dtype=int),
+        "category": [category] * n,
+        "stage": np.full(n, stage, dtype=int),
+    }, index=index)
+
+
+def long_results_ce_from_records(records: List[dict], year: int,
+                                 category: str, stage: int) -> pd.DataFrame:
+    """
+    Decode lastScore records directly into the long_results_ce table.
+
+    The paired ce values, the scalar ce bonus and the scalar dss values are
+    gathered into a single (n, 2) array, so there is no per-row apply, no
+    melt and no regex pass over `_id`. The rows, their order, their index and
+    the (string) year, category and stage columns match
+    DakarAPIClient.long_results_ce() applied to the normalised payload.
+
+    Args:
+        records: Decoded lastScore JSON records
+        year: Year of the lastScore payload
+        category: Category of the lastScore payload
+        stage: Stage of the lastScore payload
+    """
+    ids, bibs, valid, cells = _gather_cells(records, ("ce", "dss"))
+
+    rows, pairs, metrics, types, scaled = [], [], [], [], []
+    for prefix, pattern, time_metrics in (("ce", CE_METRICS, TIME_METRICS),
+                                          ("dss", DSS_METRICS, ("absolute",))):
+        for key, (key_rows, key_values) in cells.items():
+            if not key.startswith(prefix) or not pattern.search(key):
+                continue
+            metric = key.split(".")[-1]
+            if key == "ce.bonus":
+                # Every crew gets a bonus row, its value used for both pair members;
+                # crews without a bonus are dropped below, but are still numbered
+                bonuses = dict(zip(key_rows, key_values))
+                key_rows = np.flatnonzero(valid).tolist()
+                key_pairs = [(bonuses.get(row, np.nan),) * 2 for row in key_rows]
+            elif prefix == "ce":
+                key_pairs = key_values
+            else:
+                key_pairs = [(value, value) for value in key_values]
+            rows.extend(key_rows)
+            pairs.extend(key_pairs)
+            metrics.extend([metric] * len(key_rows))
+            types.extend([prefix] * len(key_rows))
+            scaled.extend([metric in time_metrics] * len(key_rows))
+
+    # Times are in milliseconds; make them more natural as seconds
+    values = np.array(pairs, dtype=float).reshape(len(pairs), 2)
+    values[np.array(scaled, dtype=bool)] /= 1000
+
+    keep = ~np.isnan(values[:, 0])
+    rows = np.array(rows, dtype=np.intp)[keep]
+    values = values[keep].astype(int)
+    index = pd.Index(np.flatnonzero(keep), dtype=int)
+    n = len(rows)
+    return pd.DataFrame({
+        "_id": ids.take(rows).array,
+        "team.bib": bibs.take(rows).array,
+        "metric": pd.Series(np.array(metrics, dtype=object)[keep], index=index, dtype=object),
+        "value_0": values[:, 0],
+        "value_1": values[:, 1],
+        "type": np.array(types, dtype=object)[keep].tolist(),
+        "year": [str(year)] * n,
+        "category": [category] * n,
+        "stage": [str(stage)] * n,
+    }, index=index)
+
+
+def is_arrival(waypoints: pd.Series) -> pd.Series:
+    """
+    Flag waypoint codes that mark a stage arrival, i.e. contain "AS".
+
+    Matches SQL `waypoint LIKE '%AS%'`, which is case insensitive; missing codes are not arrivals.
+    """
+    return waypoints.astype(object).map(
+        lambda code: isinstance(code, str) and "AS" in code.upper()).astype(bool)
+
+
+class CategorySets:
+    """
+    Append-only category sets shared by compact long results frames.
+
+    Every frame compacted against the same CategorySets uses the same
+    categories for a column, as far as they are known, so compact frames
+    from different categories and stages can be concatenated without
+    falling back to object columns (see concat_compact()).
+
+    The sets only hold low-cardinality columns (see COMPACT_CATEGORIES), but
+    waypoint codes still accumulate season on season; clear() them, or use
+    a CategorySets per season, in long-running processes.
+    """
+
+    def __init__(self):
+        self._values: Dict[str, Dict[Any, None]] = {}
+        self._dtypes: Dict[str, pd.CategoricalDtype] = {}
+        self._lock = threading.Lock()
+
+    def dtype(self, column: str, values: Optional[Iterable] = None) -> pd.CategoricalDtype:
+        """
+        Get the categorical dtype of a column, first adding any new values.
+
+        Args:
+            column: Column name
+            values: Values to add to the column categories
+        """
+        with self._lock:
+            known = self._values.setdefault(column, {})
+            if values is not None:
+                new = [v for v in pd.unique(values) if not _isna(v) and v not in known]
+                if new:
+                    known.update(dict.fromkeys(new))
+                    self._dtypes.pop(column, None)
+            if column not in self._dtypes:
+                self._dtypes[column] = pd.CategoricalDtype(list(known))
+            return self._dtypes[column]
+
+    def clear(self) -> None:
+        """Forget every category; frames compacted earlier keep their own dtypes."""
+        with self._lock:
+            self._values.clear()
+            self._dtypes.clear()
+
+    def memory_usage(self) -> int:
+        """Deep memory usage of the category sets, in bytes."""
+        with self._lock:
+            return sum(int(pd.Index(list(values), dtype=object).memory_usage(deep=True))
+                       for values in self._values.values())
+
+
+# Process-wide category sets used by default, so compact frames from any client line up
+SHARED_CATEGORIES = CategorySets()
+
+
+def _narrow(series: pd.Series, dtype: type) -> pd.Series:
+    """Cast a series to a narrower int dtype, if it has no nulls and its values fit."""
+    if series.isna().any():
+        return series
+    values = series.astype(np.int64)
+    limits = np.iinfo(dtype)
+    if len(values) and (values.min() < limits.min or values.max() > limits.max):
+        return values
+    return values.astype(dtype)
+
+
+def compact_long_results(df: pd.DataFrame,
+                         category_sets: Optional[CategorySets] = None) -> pd.DataFrame:
+    """
+    Compact a long_results_cg or long_results_ce frame.
+
+    The low-cardinality string columns become categoricals over shared
+    category sets, `_id` becomes a categorical over the frame's own values,
+    `team.bib` and the values become int32, and `year` and
+    `stage` (strings in long_results_ce) become int16. Integer columns with
+    nulls or out of range values are left as they are.
+
+    Args:
+        df: Long results frame
+        category_sets: Category sets to share; defaults to SHARED_CATEGORIES
+    """
+    category_sets = category_sets or SHARED_CATEGORIES
+    columns = {}
+    for col in df.columns:
+        if col in COMPACT_CATEGORIES:
+            columns[col] = df[col].astype(category_sets.dtype(col, df[col]))
+        elif col in COMPACT_FRAME_CATEGORIES:
+            columns[col] = df[col].astype("category")
+        elif col in COMPACT_INTS:
+            columns[col] = _narrow(df[col], COMPACT_INTS[col])
+        else:
+            columns[col] = df[col]
+    return pd.DataFrame(columns, index=df.index)
+
+
+def concat_compact(frames: Iterable[pd.DataFrame],
+                   category_sets: Optional[CategorySets] = None, **kwargs) -> pd.DataFrame:
+    """
+    Concatenate compact long results frames, keeping their categorical columns.
+
+    Frames compacted earlier may hold a subset of the current categories,
+    so their categoricals are first recast to the current shared dtypes.
+    Per-frame categoricals such as `_id` are combined with union_categoricals().
+
+    Args:
+        frames: Compact long results frames
+        category_sets: Category sets the frames were compacted with
+        **kwargs: Passed to pd.concat()
+    """
+    category_sets = category_sets or SHARED_CATEGORIES
+    frames = [df.astype({col: category_sets.dtype(col) for col in df.columns
+                         if col in COMPACT_CATEGORIES})
+              for df in frames]
+    combined = pd.concat(frames, **kwargs)
+    if kwargs.get("axis", 0) in (0, "index"):
+        for col in COMPACT_FRAME_CATEGORIES:
+            parts = [df[col] for df in frames if col in df.columns]
+            if (parts and len(parts) == len(frames)
+                    and all(isinstance(part.dtype, pd.CategoricalDtype) for part in parts)):
+                combined[col] = pd.Series(union_categoricals(parts), index=combined.index)
+    return combined
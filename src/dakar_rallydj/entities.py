@@ -0,0 +1,167 @@
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+import pandas as pd
+
+from .decoders import _flatten
+
+
+class _Crew:
+    """Registry entry for a single crew: its team record and flattened rows."""
+
+    __slots__ = ("raw", "team", "competitors", "revision")
+
+    def __init__(self, raw: dict, team: Dict[str, Any], competitors: List[Dict[str, Any]]):
+        self.raw = raw
+        self.team = team
+        self.competitors = competitors
+        self.revision = 0
+
+
+class EntityRegistry:
+    """
+    Teams and competitors, keyed by (year, bib), shared across lastScore payloads.
+
+    Each lastScore record carries its crew's full team record, so the same few
+    hundred crews turn up in every stage of every category. The registry keeps
+    the flattened team and competitor rows of each crew, and only rebuilds them
+    when the crew's team record actually changes. The long results frames refer
+    to a crew by their `team.bib` and `year` columns.
+    """
+
+    def __init__(self):
+        self._crews: Dict[Tuple[int, Any], _Crew] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._crews)
+
+    def __contains__(self, key: Tuple[int, Any]) -> bool:
+        return key in self._crews
+
+    @staticmethod
+    def _build(record: dict) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+        """Flatten the team fields and competitors of a record, as pd.json_normalize() would."""
+        team = {}
+        competitors = None
+        for key, value in record.items():
+            if not key.startswith("team"):
+                continue
+            for flat_key, flat_value in _flatten(key, value):
+                if flat_key == "team.competitors":
+                    competitors = flat_value
+                else:
+                    team[flat_key] = flat_value
+
+        bib = team.get("team.bib")
+        # As with DataFrame.explode(), a crew with no competitors gets an empty row
+        if not isinstance(competitors, list) or not competitors:
+            competitors = [None]
+        rows = []
+        for competitor in competitors:
+            row = {"team.bib": bib}
+            if isinstance(competitor, dict):
+                row.update(_flatten_dict(competitor))
+            rows.append(row)
+        return team, rows
+
+    def update(self, records: List[dict], year: int) -> List[Tuple[int, Any]]:
+        """
+        Add the crews of lastScore records, rebuilding only those that have changed.
+
+        Args:
+            records: Decoded lastScore JSON records
+            year: Year of the records
+
+        Returns:
+            List of the (year, bib) keys of new or changed crews
+        """
+        changed = []
+        with self._lock:
+            for record in records:
+                raw = record.get("team")
+                bib = raw.get("bib") if isinstance(raw, dict) else None
+                if bib is None:
+                    continue
+                key = (year, bib)
+                crew = self._crews.get(key)
+                if crew is not None and crew.raw == raw:
+                    continue
+                team, competitors = self._build(record)
+                if crew is None:
+                    self._crews[key] = _Crew(raw, team, competitors)
+                else:
+                    crew.raw, crew.team, crew.competitors = raw, team, competitors
+                    crew.revision += 1
+                changed.append(key)
+        return changed
+
+    def frames(self, records: List[dict], year: int) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        """
+        Get the teams and competitors frames of lastScore records via the registry.
+
+        The frames are the same as the teams_df and competitors_df returned by
+        DakarAPIClient.normalize_team_competitors(pd.json_normalize(records), year).
+        Registered rows are reused for crews whose team record is unchanged; the
+        registry itself is not updated (see update()).
+
+        Args:
+            records: Decoded lastScore JSON records
+            year: Year of the records
+
+        Returns:
+            Tuple of (teams_df, competitors_df)
+        """
+        teams, competitors = [], []
+        with self._lock:
+            for record in records:
+                raw = record.get("team")
+                crew = self._crews.get((year, raw.get("bib"))) if isinstance(raw, dict) else None
+                if crew is None or crew.raw != raw:
+                    team, rows = self._build(record)
+                else:
+                    team, rows = crew.team, crew.competitors
+                teams.append(team)
+                competitors.extend(rows)
+
+        teams_df = pd.DataFrame(teams)
+        competitors_df = pd.DataFrame(competitors)
+        competitors_df["year"] = year
+        return teams_df, competitors_df
+
+    def teams(self, year: Optional[int] = None) -> pd.DataFrame:
+        """
+        Get one row per registered team.
+
+        Args:
+            year: Only include teams from this year (default: all years)
+        """
+        with self._lock:
+            rows = [{"year": key[0], **crew.team} for key, crew in self._crews.items()
+                    if year is None or key[0] == year]
+        return pd.DataFrame(rows)
+
+    def competitors(self, year: Optional[int] = None) -> pd.DataFrame:
+        """
+        Get one row per registered competitor.
+
+        Args:
+            year: Only include competitors from this year (default: all years)
+        """
+        with self._lock:
+            rows = [{**row, "year": key[0]} for key, crew in self._crews.items()
+                    if year is None or key[0] == year for row in crew.competitors]
+        return pd.DataFrame(rows)
+
+    def revision(self, year: int, bib: Any) -> Optional[int]:
+        """Number of times a crew has changed since it was first registered, if known."""
+        crew = self._crews.get((year, bib))
+        return crew.revision if crew is not None else None
+
+
+def _flatten_dict(record: dict) -> Dict[str, Any]:
+    """Flatten a nested dict to dotted keys."""
+    flat = {}
+    for key, value in record.items():
+        flat.update(_flatten(str(key), value))
+    return flat
@@ -0,0 +1,152 @@
+import hashlib
+import io
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+
+import requests
+
+
+def fixture_file(root: str, path: str) -> str:
+    """File name of the fixture for an API path (e.g. lastScore-2025-A-1)."""
+    return os.path.join(root, f"{path}.json")
+
+
+def path_from_url(url: str) -> str:
+    """Recover the API path from a request URL."""
+    return url.split("?")[0].rstrip("/").rsplit("/", 1)[-1]
+
+
+def record_fixture(root: str, path: str, content: bytes) -> None:
+    """Write a raw payload to a fixture directory."""
+    os.makedirs(root, exist_ok=True)
+    with open(fixture_file(root, path), "wb") as f:
+        f.write(content)
+
+
+class FixtureSession:
+    """requests-like session that serves responses from a fixture directory."""
+
+    def __init__(self, root: str, latency: float = 0.0):
+        self.root = root
+        self.latency = latency
+
+    def get(self, url: str, headers: Optional[dict] = None, **kwargs) -> requests.Response:
+        """Serve the fixture for a URL, honouring If-None-Match validators."""
+        if self.latency:
+            time.sleep(self.latency)
+
+        r = requests.Response()
+        r.url = url
+        fname = fixture_file(self.root, path_from_url(url))
+        if not os.path.exists(fname):
+            r.status_code = 404
+            r._content = b""
+            return r
+
+        with open(fname, "rb") as f:
+            content = f.read()
+        etag = f'"{hashlib.sha1(content).hexdigest()}"'
+        r.headers["ETag"] = etag
+        if headers and headers.get("If-None-Match") == etag:
+            r.status_code = 304
+            r._content = b""
+        else:
+            r.status_code = 200
+            r._content = content
+        return r
+
+    def close(self) -> None:
+        pass
+
+
+class FixtureProxy:
+    """Stand-in for CorsProxy that replays recorded payloads without any network access."""
+
+    def __init__(self, root: str, latency: float = 0.0):
+        """
+        Args:
+            root: Fixture directory, as written by a client in record mode
+            latency: Simulated latency (seconds) added to every request
+        """
+        self.session = FixtureSession(root, latency=latency)
+
+    def xurl(self, url: str, *args, **kwargs) -> str:
+        return url
+
+    def cors_proxy_get(self, url: str, *args, **kwargs) -> requests.Response:
+        return self.session.get(url)
+
+    def furl(self, url: str, *args, **kwargs) -> io.BytesIO:
+        return io.BytesIO(self.cors_proxy_get(url).content)
+
+
+class FixtureServer:
+    """
+    Local HTTP stand-in for the Dakar API that serves a fixture directory.
+
+    Responses carry an ETag and honour If-None-Match, and every request can be
+    delayed by a configurable latency. Point a client at the server with
+    DakarAPIClient(api_template=server.api_template).
+
+    Usage:
+        with FixtureServer("fixtures/2025", latency=0.05) as server:
+            dakar = DakarAPIClient(api_template=server.api_template)
+    """
+
+    def __init__(self, root: str, latency: float = 0.0,
+                 host: str = "127.0.0.1", port: int = 0):
+        """
+        Args:
+            root: Fixture directory, as written by a client in record mode
+            latency: Simulated latency (seconds) added to every request
+            host: Interface to listen on
+            port: Port to listen on (default: any free port)
+        """
+        self.root = root
+        self.latency = latency
+        session = FixtureSession(root, latency=latency)
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                r = session.get(self.path, headers=dict(self.headers))
+                self.send_response(r.status_code)
+                for k, v in r.headers.items():
+                    self.send_header(k, v)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(r.content)))
+                self.end_headers()
+                self.wfile.write(r.content)
+
+            def log_message(self, *args):
+                pass
+
+        self._server = ThreadingHTTPServer((host, port), Handler)
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def api_template(self) -> str:
+        """API URL template for a client pointed at this server."""
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/api/{{path}}"
+
+    def start(self) -> "FixtureServer":
+        """Start serving in a background thread."""
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop serving."""
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
@@ -1,6 +1,35 @@
+import hashlib
+import io
+import threading
+import time
+import warnings
 import pandas as pd
-from typing import Optional, Union, List, Tuple
-from jupyterlite_simple_cors_proxy.cacheproxy import CorsProxy, create_cached_proxy
+import requests
+from concurrent.futures import ThreadPoolExecutor
+from itertools import product
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional, Union, List, Tuple
+from jupyterlite_simple_cors_proxy.cacheproxy import CorsProxy
+
+from .decoders import (compact_long_results, long_results_ce_from_records,
+                       long_results_cg_from_records)
+from .labels import LANG_LABELS, merge_lang_labels
+from .entities import EntityRegistry
+from .fixtures import FixtureProxy, path_from_url, record_fixture
+from . import polars_backend
+from .proxies import ProxyRegistry
+from .results import LazyFrames, ScoresResult, StagesResult, once
+from .resilience import ClientMetrics, RetryPolicy, TokenBucket
+from .singleflight import SingleFlight
+from .snapshot import Snapshot
+from .store import PayloadStore
+from .watcher import ScoreWatcher
+from .withdrawals import WithdrawalTracker
+
+# Use the faster orjson decoder if it is available
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
 
 
 class DakarAPIClient:
@@ -17,8 +46,43 @@ class DakarAPIClient:
     WAYPOINT_TEMPLATE = "waypoint-{year}-{category}-{stage}"
     SCORE_TEMPLATE = "lastScore-{year}-{category}-{stage}"
 
+    # Bulk fetch endpoints: name -> (getter method, parameters used in the key)
+    ENDPOINTS = {
+        "category": ("get_category", ("year",)),
+        "groups": ("get_groups", ("year",)),
+        "clazz": ("get_clazz", ("year", "category")),
+        "withdrawals": ("get_withdrawals", ("year", "category")),
+        "stages": ("get_stages", ("year", "category")),
+        "waypoints": ("get_waypoints", ("year", "category", "stage")),
+        "scores": ("get_scores", ("year", "category", "stage")),
+    }
+
+    # Bump a parser's version whenever its output changes,
+    # so that frames memoised by earlier versions are not reused
+    PARSER_VERSIONS = {
+        "category": 1,
+        "groups": 1,
+        "clazz": 1,
+        "withdrawals": 1,
+        "stages": 1,
+        "waypoints": 1,
+        "waypoint_items": 1,
+        "scores": 2,
+    }
+
+    # Parsing backends
+    BACKENDS = ("pandas", "polars")
+
     def __init__(self, year: int = 2025, category: str = "A", stage: int = 1,
-                 use_cache: bool = False, **cache_kwargs):
+                 use_cache: bool = False, api_template: Optional[str] = None,
+                 registry: Optional[ProxyRegistry] = None,
+                 store: Optional[PayloadStore] = None, prefer_store: bool = False,
+                 fast_decode: bool = True, record_dir: Optional[str] = None,
+                 replay_dir: Optional[str] = None,
+                 retry_policy: Optional[RetryPolicy] = None,
+                 rate_limiter: Optional[TokenBucket] = None,
+                 wide_labels: bool = True, entities: Optional[EntityRegistry] = None,
+                 backend: str = "pandas", **cache_kwargs):
         """
         Initialize the Dakar API client.
         
@@ -27,17 +91,114 @@ class DakarAPIClient:
             category: Default category for API requests
             stage: Default stage for API requests
             use_cache: Whether to enable request caching
+            api_template: Override the API URL template (e.g. a local stand-in server)
+            registry: Proxy registry to share pooled sessions with other clients;
+                by default the client owns a registry of its own
+            store: Store for raw payloads and memoised parse results
+                (default: an in-memory store)
+            prefer_store: Serve payloads already in the store rather than refetching them
+            fast_decode: Build frames directly from decoded JSON records where
+                possible, rather than via pd.read_json()
+            record_dir: Record every fetched payload to this fixture directory
+            replay_dir: Replay payloads from this fixture directory instead of
+                making any network requests
+            retry_policy: Retry policy for failed requests (default: RetryPolicy())
+            rate_limiter: Token bucket shared by all requests (default: no limit)
+            wide_labels: Add a column per locale of language labels to the category,
+                groups, clazz and stages frames; if False, keep the label key column
+                instead and get the labels from get_labels()
+            entities: Registry of teams and competitors by (year, bib) to share
+                with other clients (default: a registry of the client's own)
+            backend: Backend for the lastScore, waypoint, withdrawal and stage
+                parsers: "pandas", or "polars" to run them on Arrow-backed Polars
+                frames (needs polars and pyarrow); results are always pandas
             **cache_kwargs: Cache configuration options passed to requests_cache
         """
         self.year = year
         self.category = category
         self.stage = stage
 
+        if api_template is not None:
+            self.DAKAR_API_TEMPLATE = api_template
+
+        # Proxies (and their pooled sessions) are memoised by cache configuration
+        self._owns_registry = registry is None
+        self.registry = registry if registry is not None else ProxyRegistry()
+
         # Initialize the proxy with caching if requested
-        if use_cache:
-            self.proxy = create_cached_proxy(**cache_kwargs)
-        else:
-            self.proxy = CorsProxy()
+        self.proxy = self.registry.get(use_cache, **cache_kwargs)
+
+        # Record / replay fixture directories for offline runs
+        self.record_dir = record_dir
+        self.replay_dir = replay_dir
+        if replay_dir is not None:
+            self.proxy = FixtureProxy(replay_dir)
+
+        # Raw payloads, and the frames parsed from them, by content hash
+        self.store = store if store is not None else PayloadStore()
+        self.prefer_store = prefer_store
+        self.fast_decode = fast_decode
+        self.wide_labels = wide_labels
+
+        if backend not in self.BACKENDS:
+            raise ValueError(f"Unknown backend {backend!r}; use one of {self.BACKENDS}")
+        if backend == "polars":
+            polars_backend._require_polars()
+        self.backend = backend
+
+        # Teams and competitors by (year, bib), across every lastScore payload
+        self.entities = entities if entities is not None else EntityRegistry()
+        # Hash of the lastScore payload whose crews were last registered, by API path
+        self._crew_digests: Dict[str, str] = {}
+        self.withdrawal_tracker = WithdrawalTracker(self)
+
+        # Retries, rate limiting and request counters by endpoint template
+        self.retry_policy = retry_policy if retry_policy is not None else RetryPolicy()
+        self.rate_limiter = rate_limiter
+        self.metrics = ClientMetrics()
+
+        # Parsed results served from a snapshot, if any (see from_snapshot())
+        self.snapshot: Optional[Snapshot] = None
+
+        # Concurrent identical fetches (and parses) share a single in-flight call
+        self._inflight = SingleFlight()
+
+        # Change detection state for conditional lastScore requests, by URL
+        self._score_state: Dict[str, dict] = {}
+        self._score_lock = threading.Lock()
+
+    @classmethod
+    def from_snapshot(cls, path: str, arrow_dtypes: bool = False, **kwargs) -> "DakarAPIClient":
+        """
+        Create a client whose getters are served from a snapshot.
+
+        Results held in the snapshot (see snapshot.save_snapshot()) are memory
+        mapped on first use rather than fetched and parsed; anything else,
+        including results saved with another parser version, wide_labels
+        or backend, is fetched as usual. The default year is the snapshot's year.
+
+        Args:
+            path: Snapshot directory
+            arrow_dtypes: Serve Arrow-backed columns, copying nothing out of the snapshot
+            **kwargs: Passed to DakarAPIClient()
+        """
+        snapshot = Snapshot(path, arrow_dtypes=arrow_dtypes)
+        if snapshot.year is not None:
+            kwargs.setdefault("year", snapshot.year)
+        client = cls(**kwargs)
+        client.snapshot = snapshot
+        return client
+
+    def close(self) -> None:
+        """Release pooled connections and cache backends owned by this client."""
+        if self._owns_registry:
+            self.registry.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
 
     @staticmethod
     def _coldropper(df: pd.DataFrame, cols: Optional[list] = None) -> None:
@@ -48,29 +209,27 @@ class DakarAPIClient:
         df.drop(columns=dropcols, inplace=True)
 
     @staticmethod
-    def mergeInLangLabels(df: pd.DataFrame, col: str, key: str = "shortLabel") -> pd.DataFrame:
-        """Merge language labels into the main DataFrame."""
-        # Unpack the lists of labels into their own rows
-        longLabels = pd.json_normalize(df[col].explode())
-
-        # Drop empty rows
-        longLabels.dropna(axis="index", how="all", inplace=True)
+    def mergeInLangLabels(df: pd.DataFrame, col: str, key: str = "shortLabel",
+                          widen: bool = True) -> pd.DataFrame:
+        """
+        Merge language labels into the main DataFrame.
 
-        # Reshape to wide format
-        wideLabels = longLabels.pivot(
-            index='variable',
-            columns='locale',
-            values='text',
-        ).reset_index()
+        Labels are collected in the process-wide label dictionary and looked up
+        from there by the key column; see labels.merge_lang_labels().
+        """
+        return merge_lang_labels(df, col, key=key, widen=widen)
 
-        # Merge data back
-        _df = pd.merge(df, wideLabels, left_on=key, right_on='variable')
+    def get_labels(self, variables: Optional[Iterable[str]] = None) -> pd.DataFrame:
+        """
+        Get the language labels seen so far as a normalised table.
 
-        # Clean up
-        _df.drop("variable", axis=1, inplace=True)
-        _df.drop(col, axis=1, inplace=True, errors="ignore")
+        Args:
+            variables: Variables to include (default: all)
 
-        return _df
+        Returns:
+            DataFrame with columns variable, locale, text
+        """
+        return LANG_LABELS.table(variables)
 
     @staticmethod
     def normalize_team_competitors(df: pd.DataFrame, year: int = 2025) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
@@ -116,6 +275,216 @@ class DakarAPIClient:
         path = template.format(**kwargs)
         return self.DAKAR_API_TEMPLATE.format(path=path)
 
+    def _endpoint_template(self, path: str) -> str:
+        """Identify the endpoint template an API path was built from."""
+        name = path.split("-")[0]
+        for template in (self.CATEGORY_TEMPLATE, self.GROUPS_TEMPLATE, self.CLAZZ_TEMPLATE,
+                         self.WITHDRAWAL_TEMPLATE, self.STAGE_TEMPLATE,
+                         self.WAYPOINT_TEMPLATE, self.SCORE_TEMPLATE):
+            if template.split("-")[0] == name:
+                return template
+        return name
+
+    def _request(self, url: str, proxy: CorsProxy,
+                 headers: Optional[dict] = None) -> requests.Response:
+        """
+        Make a rate limited GET request, retrying failures according to the retry policy.
+
+        Retries, throttled waits and failures are counted in self.metrics
+        against the endpoint template of the request.
+        """
+        endpoint = self._endpoint_template(path_from_url(url))
+        policy = self.retry_policy
+
+        attempt = 0
+        while True:
+            if self.rate_limiter is not None:
+                waited = self.rate_limiter.acquire()
+                if waited:
+                    self.metrics.record(endpoint, "throttled")
+                    self.metrics.record(endpoint, "throttled_seconds", waited)
+
+            self.metrics.record(endpoint, "requests")
+            r, error = None, None
+            try:
+                r = proxy.session.get(proxy.xurl(url), headers=headers)
+            except requests.RequestException as e:
+                error = e
+
+            retryable = error is not None or r.status_code in policy.retry_statuses
+            if not retryable or attempt >= policy.max_retries:
+                if error is not None:
+                    self.metrics.record(endpoint, "failures")
+                    raise error
+                if r.status_code >= 400:
+                    self.metrics.record(endpoint, "failures")
+                return r
+
+            self.metrics.record(endpoint, "retries")
+            time.sleep(policy.delay(attempt, r))
+            attempt += 1
+
+    def _fetch(self, path: str, proxy: CorsProxy,
+               refresh: bool = False) -> Tuple[str, Optional[bytes]]:
+        """
+        Get the raw payload for an API path, recording it in the payload store.
+
+        Args:
+            path: API path
+            proxy: Proxy to make the request with
+            refresh: Always fetch, even if prefer_store is set
+
+        Returns:
+            Tuple of (payload hash, content); if the payload is served from
+            the store, content is None and is only loaded if it needs parsing
+        """
+        if self.prefer_store and not refresh:
+            digest = self.store.ref(path)
+            if digest is not None:
+                return digest, None
+
+        r = self._request(self.DAKAR_API_TEMPLATE.format(path=path), proxy)
+        r.raise_for_status()
+        if self.record_dir is not None:
+            record_fixture(self.record_dir, path, r.content)
+        return self.store.put(path, r.content), r.content
+
+    def _poll(self, url: str, proxy: CorsProxy,
+              state: Optional[dict] = None) -> Tuple[Optional[list], dict]:
+        """
+        Conditionally fetch and decode a payload, given the state of a previous poll.
+
+        Sends If-None-Match / If-Modified-Since validators from the previous
+        response where the server provided them. If the server does not honour
+        them, falls back to comparing a hash of the payload. Record `_updatedAt`
+        values are not relied on, as records can change without them moving.
+
+        Args:
+            url: URL to poll
+            proxy: Proxy to make the request with
+            state: State returned by the previous poll of the URL, if any
+
+        Returns:
+            Tuple of (records, state): records is None if the server answered
+            304 Not Modified or the payload hash is unchanged since the previous poll.
+        """
+        previous = state or {}
+
+        headers = {}
+        if previous.get("etag"):
+            headers["If-None-Match"] = previous["etag"]
+        if previous.get("last_modified"):
+            headers["If-Modified-Since"] = previous["last_modified"]
+
+        r = self._request(url, proxy, headers=headers)
+        if r.status_code == 304 and previous:
+            return None, previous
+        r.raise_for_status()
+        if self.record_dir is not None:
+            record_fixture(self.record_dir, path_from_url(url), r.content)
+
+        state = {
+            "etag": r.headers.get("ETag"),
+            "last_modified": r.headers.get("Last-Modified"),
+            "digest": hashlib.sha1(r.content).hexdigest(),
+        }
+        if previous and state["digest"] == previous.get("digest"):
+            return None, {**previous, **state}
+
+        return json_loads(r.content), state
+
+    @staticmethod
+    def _copy_result(result: Union[pd.DataFrame, Tuple[pd.DataFrame, ...], LazyFrames]) -> Union[pd.DataFrame, Tuple[pd.DataFrame, ...], LazyFrames]:
+        """Copy a memoised parse result so callers can modify it freely."""
+        if isinstance(result, tuple):
+            return tuple(df.copy() for df in result)
+        return result.copy()
+
+    def _parsed(self, parser: str, path: str, proxy: CorsProxy,
+                parse: Callable[[bytes], Any]) -> Any:
+        """
+        Fetch an API path and parse its payload, memoising the parse result.
+
+        Results are memoised by parser name and version, path and payload hash,
+        so an unchanged payload is only ever parsed once by a given parser version.
+        Concurrent calls for the same path through the same proxy (and so the same
+        cache settings) wait on a single in-flight fetch and parse. Results held
+        in the client's snapshot, if any, are served from it instead.
+        """
+        if self.snapshot is not None:
+            result = self.snapshot.get(parser, path, self._snapshot_settings(parser))
+            if result is not None:
+                return result
+
+        # Proxies are memoised by cache configuration, so identify them by id
+        result, _ = self._inflight.do(
+            (parser, path, id(proxy)),
+            lambda: self._fetch_and_parse(parser, path, proxy, parse))
+        return self._copy_result(result)
+
+    def _snapshot_settings(self, parser: str) -> Dict[str, Any]:
+        """Settings a parser's results depend on, which a snapshot result must match to be served."""
+        return {"version": self.PARSER_VERSIONS[parser], "wide_labels": self.wide_labels,
+                "backend": self.backend}
+
+    def _in_snapshot(self, parser: str, path: str) -> bool:
+        """Whether the client's snapshot holds a parser's result for an API path, parsed as this client would."""
+        return (self.snapshot is not None
+                and self.snapshot.holds(parser, path, self._snapshot_settings(parser)))
+
+    def _memo_key(self, parser: str, path: str, digest: str) -> Tuple:
+        """Parse result key; frames without label columns, or from another backend, are memoised separately."""
+        version = self.PARSER_VERSIONS[parser]
+        if not self.wide_labels:
+            parser = f"{parser}:narrow_labels"
+        if self.backend != "pandas":
+            parser = f"{parser}:{self.backend}"
+        return (parser, version, path, digest)
+
+    def _fetch_and_parse(self, parser: str, path: str, proxy: CorsProxy,
+                         parse: Callable[[bytes], Any]) -> Any:
+        """Fetch an API path and parse its payload, or get the memoised parse result."""
+        digest, content = self._fetch(path, proxy)
+        key = self._memo_key(parser, path, digest)
+
+        result = self.store.get_parsed(key)
+        if result is None:
+            if content is None:
+                content = self.store.get(digest)
+            if content is None:
+                # The raw payload is no longer held in the store, so refetch it
+                digest, content = self._fetch(path, proxy, refresh=True)
+                key = self._memo_key(parser, path, digest)
+            result = parse(content)
+            self.store.put_parsed(key, result)
+
+        return result
+
+    @staticmethod
+    def _explode_records(records: list, col: str, index: Iterable) -> pd.Series:
+        """
+        Explode a list field of JSON records into a Series, as DataFrame.explode() would.
+
+        Raises ValueError if any record does not hold a non-empty list,
+        so that callers can fall back to the pd.read_json() path.
+        """
+        values, values_index = [], []
+        for idx, record in zip(index, records):
+            items = record[col]
+            if not isinstance(items, list) or not items:
+                raise ValueError(f"Cannot explode {col} values directly")
+            values.extend(items)
+            values_index.extend([idx] * len(items))
+        return pd.Series(values, index=values_index, dtype=object)
+
+    def _parse_category(self, content: bytes) -> pd.DataFrame:
+        """Parse a category payload."""
+        category_df = pd.read_json(io.BytesIO(content))
+        category_df = self.mergeInLangLabels(category_df, "categoryLangs",
+                                              widen=self.wide_labels)
+        category_df.sort_values(by=["reference"], inplace=True)
+        return category_df
+
     def get_category(self, year: Optional[int] = None,
                      use_cache: Optional[bool] = None, **cache_kwargs) -> pd.DataFrame:
         """
@@ -131,11 +500,18 @@ class DakarAPIClient:
         # Create request-specific proxy if cache settings are different
         proxy = self._get_request_proxy(use_cache, **cache_kwargs)
 
-        url = self._get_url(self.CATEGORY_TEMPLATE, year=year)
-        category_df = pd.read_json(proxy.furl(url))
-        category_df = self.mergeInLangLabels(category_df, "categoryLangs")
-        category_df.sort_values(by=["reference"], inplace=True)
-        return category_df
+        path = self.CATEGORY_TEMPLATE.format(year=year)
+        return self._parsed("category", path, proxy, self._parse_category)
+
+    def _parse_groups(self, content: bytes) -> pd.DataFrame:
+        """Parse a groups payload."""
+        groups_df = pd.read_json(io.BytesIO(content))
+        groups_df = self.mergeInLangLabels(groups_df, "categoryGroupLangs",
+                                            widen=self.wide_labels)
+        self._coldropper(groups_df, ["liveDisplay", "updatedAt",
+                                     "refueling", "_key", "_updatedAt"])
+        groups_df.sort_values(by=["_origin", "position"], inplace=True)
+        return groups_df
 
     def get_groups(self, year: Optional[int] = None,
                    use_cache: Optional[bool] = None, **cache_kwargs) -> pd.DataFrame:
@@ -152,29 +528,14 @@ class DakarAPIClient:
         # Create request-specific proxy if cache settings are different
         proxy = self._get_request_proxy(use_cache, **cache_kwargs)
 
-        url = self._get_url(self.GROUPS_TEMPLATE, year=year)
-        groups_df = pd.read_json(proxy.furl(url))
-        groups_df = self.mergeInLangLabels(groups_df, "categoryGroupLangs")
-        self._coldropper(groups_df, ["liveDisplay", "updatedAt",
-                                     "refueling", "_key", "_updatedAt"])
-        groups_df.sort_values(by=["_origin", "position"], inplace=True)
-        return groups_df
-
-    def _get_clazz_single(self, year: Optional[int] = None,
-                          category: Optional[str] = None,
-                          proxy: Optional[CorsProxy] = None) -> pd.DataFrame:
-        """
-        Get clazz data for a single category.
-        
-        Internal method used by get_clazz.
-        """
-        year = year or self.year
-        category = category or self.category
-        proxy = proxy or self.proxy
+        path = self.GROUPS_TEMPLATE.format(year=year)
+        return self._parsed("groups", path, proxy, self._parse_groups)
 
-        url = self._get_url(self.CLAZZ_TEMPLATE, year=year, category=category)
-        clazz_df = pd.read_json(proxy.furl(url))
-        clazz_df = self.mergeInLangLabels(clazz_df, "categoryClazzLangs")
+    def _parse_clazz(self, content: bytes, category: str) -> pd.DataFrame:
+        """Parse a clazz payload for a single category."""
+        clazz_df = pd.read_json(io.BytesIO(content))
+        clazz_df = self.mergeInLangLabels(clazz_df, "categoryClazzLangs",
+                                           widen=self.wide_labels)
 
         # Add category info
         clazz_df['category'] = category
@@ -190,6 +551,22 @@ class DakarAPIClient:
         clazz_df.sort_values(by=["shortLabel"], inplace=True)
         return clazz_df
 
+    def _get_clazz_single(self, year: Optional[int] = None,
+                          category: Optional[str] = None,
+                          proxy: Optional[CorsProxy] = None) -> pd.DataFrame:
+        """
+        Get clazz data for a single category.
+        
+        Internal method used by get_clazz.
+        """
+        year = year or self.year
+        category = category or self.category
+        proxy = proxy or self.proxy
+
+        path = self.CLAZZ_TEMPLATE.format(year=year, category=category)
+        return self._parsed("clazz", path, proxy,
+                            lambda content: self._parse_clazz(content, category))
+
     def get_clazz(self, year: Optional[int] = None,
                   category: Optional[Union[str, List[str]]] = None,
                   use_cache: Optional[bool] = None, **cache_kwargs) -> pd.DataFrame:
@@ -228,16 +605,34 @@ class DakarAPIClient:
         """Get waypoints data for a specific stage and category."""
         year = year or self.year
         category = category or self.category
-        stage = stage or self.stage
+        stage = stage if stage is not None else self.stage
 
         proxy = self._get_request_proxy(use_cache, **cache_kwargs)
 
-        url = self._get_url(self.WAYPOINT_TEMPLATE, year=year,
-                            category=category, stage=stage)
-        waypoint_df = pd.read_json(proxy.furl(url))
-        stage_code = waypoint_df.iloc[0]["_origin"]
-
-        waypoint_df = pd.json_normalize(waypoint_df["waypoints"].explode())
+        path = self.WAYPOINT_TEMPLATE.format(year=year, category=category, stage=stage)
+        return self._parsed("waypoints", path, proxy,
+                            lambda content: self._parse_waypoints(content, year, category, stage))
+
+    def _parse_waypoints(self, content: bytes, year: int, category: str, stage: int) -> pd.DataFrame:
+        """Parse a waypoints payload for a single category and stage."""
+        if self.backend == "polars":
+            return polars_backend.parse_waypoints(content, year, category, stage)
+
+        waypoints = None
+        if self.fast_decode:
+            try:
+                records = json_loads(content)
+                stage_code = records[0]["_origin"]
+                waypoints = self._explode_records(records, "waypoints", range(len(records)))
+            except (KeyError, IndexError, TypeError, ValueError):
+                waypoints = None
+
+        if waypoints is None:
+            waypoint_df = pd.read_json(io.BytesIO(content))
+            stage_code = waypoint_df.iloc[0]["_origin"]
+            waypoints = waypoint_df["waypoints"].explode()
+
+        waypoint_df = pd.json_normalize(waypoints)
         waypoint_df["year"] = year
         waypoint_df["stage"] = stage
         waypoint_df["category"] = category
@@ -250,6 +645,108 @@ class DakarAPIClient:
         waypoint_df.sort_values(by=["stage", "checkpoint"], inplace=True)
         return waypoint_df
 
+    def _content(self, path: str, proxy: CorsProxy) -> bytes:
+        """Get the raw payload for an API path, from the store if it is held there."""
+        digest, content = self._fetch(path, proxy)
+        if content is None:
+            content = self.store.get(digest)
+        if content is None:
+            _, content = self._fetch(path, proxy, refresh=True)
+        return content
+
+    def _parse_waypoint_items(self, content: bytes) -> Tuple[list, list]:
+        """
+        Decode a waypoints payload to its waypoint items, and the stage code of each.
+
+        get_waypoints_bulk() memoises these per payload, and normalises the
+        items of all its payloads in one pass.
+        """
+        records = None
+        if self.fast_decode:
+            try:
+                records = json_loads(content)
+            except ValueError:
+                records = None
+        if not isinstance(records, list):
+            records = pd.read_json(io.BytesIO(content)).to_dict("records")
+
+        items, stage_codes = [], []
+        for record in records:
+            waypoints = record.get("waypoints")
+            if isinstance(waypoints, list):
+                items.extend(waypoints)
+                stage_codes.extend([record.get("_origin")] * len(waypoints))
+        return items, stage_codes
+
+    def get_waypoints_bulk(self, categories: Optional[Union[str, List[str]]] = None,
+                           stages: Optional[Iterable[int]] = None,
+                           year: Optional[int] = None, max_workers: int = 8,
+                           use_cache: Optional[bool] = None, **cache_kwargs) -> pd.DataFrame:
+        """
+        Get waypoints data for several categories and stages as a single frame.
+
+        The payloads are fetched concurrently, and the waypoints of all of them
+        are normalised in one pass rather than frame by frame. Each payload's
+        decoded waypoints are memoised like any parse result. Frames held in
+        the client's snapshot, and frames parsed by the polars backend, are
+        used as they are.
+
+        Args:
+            categories: Category or list of categories; defaults to the client category
+            stages: Stages to get; defaults to the client stage
+            year: Year; defaults to the client year
+            max_workers: Maximum number of concurrent requests
+            use_cache: Override default caching behavior for these requests
+            **cache_kwargs: Override cache settings for these requests
+
+        Returns:
+            DataFrame with the get_waypoints() columns, indexed by
+            (category, stage, checkpoint)
+        """
+        year = year or self.year
+        categories = categories or self.category
+        if isinstance(categories, str):
+            categories = [categories]
+        stages = list(stages) if stages is not None else [self.stage]
+        proxy = self._get_request_proxy(use_cache, **cache_kwargs)
+
+        def get(key: Tuple[str, int]) -> Union[pd.DataFrame, Tuple[list, list]]:
+            category, stage = key
+            path = self.WAYPOINT_TEMPLATE.format(year=year, category=category, stage=stage)
+            if self.backend == "polars" or self._in_snapshot("waypoints", path):
+                return self._parsed("waypoints", path, proxy,
+                                    lambda content: self._parse_waypoints(content, year, category, stage))
+            return self._parsed("waypoint_items", path, proxy, self._parse_waypoint_items)
+
+        keys = list(product(categories, stages))
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+            results = list(executor.map(get, keys))
+
+        frames, waypoints = [], []
+        meta = {"stage": [], "category": [], "stage_code": []}
+        for (category, stage), result in zip(keys, results):
+            if isinstance(result, pd.DataFrame):
+                frames.append(result)
+                continue
+            items, stage_codes = result
+            waypoints.extend(items)
+            meta["stage"].extend([stage] * len(items))
+            meta["category"].extend([category] * len(items))
+            meta["stage_code"].extend(stage_codes)
+
+        if waypoints or not frames:
+            waypoint_df = pd.json_normalize(waypoints)
+            waypoint_df["year"] = year
+            for col, values in meta.items():
+                waypoint_df[col] = values
+            self._coldropper(waypoint_df, ["groups", "isFirstDss"])
+            frames.append(waypoint_df)
+
+        waypoint_df = pd.concat(frames, ignore_index=True) if len(frames) > 1 else frames[0]
+        waypoint_df.sort_values(by=["category", "stage", "checkpoint"], kind="stable", inplace=True)
+        waypoint_df.set_index(["category", "stage", "checkpoint"], inplace=True)
+        return waypoint_df
+
     def _get_withdrawals_single(self, year: Optional[int] = None,
                                 category: Optional[str] = None,
                                 proxy: Optional[CorsProxy] = None) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
@@ -258,12 +755,43 @@ class DakarAPIClient:
         category = category or self.category
         proxy = proxy or self.proxy
 
-        url = self._get_url(self.WITHDRAWAL_TEMPLATE,
-                            year=year, category=category)
-        withdrawal_df = pd.read_json(proxy.furl(url))
-        withdrawal_df.set_index("stage", drop=False, inplace=True)
-        withdrawals_by_stage = withdrawal_df["list"].explode()
+        path = self.WITHDRAWAL_TEMPLATE.format(year=year, category=category)
+        return self._parsed("withdrawals", path, proxy,
+                            lambda content: self._parse_withdrawals(content, category))
+
+    def _parse_withdrawals(self, content: bytes, category: str) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+        """Parse a withdrawals payload for a single category."""
+        if self.backend == "polars":
+            return polars_backend.parse_withdrawals(content, category)
+
+        withdrawals_by_stage = None
+        if self.fast_decode:
+            try:
+                records = json_loads(content)
+                stages = [record["stage"] for record in records]
+                if not all(isinstance(stage, int) for stage in stages):
+                    raise ValueError("Stage numbers are not integers")
+                withdrawals_by_stage = self._explode_records(records, "list", stages)
+            except (KeyError, TypeError, ValueError):
+                withdrawals_by_stage = None
+
+        if withdrawals_by_stage is None:
+            withdrawal_df = pd.read_json(io.BytesIO(content))
+            withdrawal_df.set_index("stage", drop=False, inplace=True)
+            withdrawals_by_stage = withdrawal_df["list"].explode()
+
+        return self._withdrawal_frames(withdrawals_by_stage, category)
 
+    @staticmethod
+    def _withdrawal_frames(withdrawals_by_stage: pd.Series,
+                           category: str) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+        """
+        Build the withdrawals, withdrawn competitors and withdrawn teams frames.
+
+        Args:
+            withdrawals_by_stage: Withdrawal entries, indexed by stage
+            category: Category of the withdrawals
+        """
         withdrawals_by_stage_index = withdrawals_by_stage.index
         withdrawals_by_stage_df = pd.json_normalize(withdrawals_by_stage)
         withdrawals_by_stage_df["stage"] = withdrawals_by_stage_index
@@ -306,22 +834,56 @@ class DakarAPIClient:
 
     def get_withdrawals(self, year: Optional[int] = None,
                         category: Optional[Union[str, List[str]]] = None,
-                        use_cache: Optional[bool] = None, **cache_kwargs) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
-        """Get withdrawals data for one or more categories."""
+                        use_cache: Optional[bool] = None, incremental: bool = False,
+                        return_failures: bool = False, **cache_kwargs):
+        """
+        Get withdrawals data for one or more categories.
+
+        A category that fails to fetch or parse does not abort the others: the
+        frames of the categories that succeeded are returned, and a warning
+        names the failed ones. If every category fails, the first error is raised.
+
+        Args:
+            year: Year; defaults to the client year
+            category: Category or list of categories; defaults to the client category
+            use_cache: Override default caching behavior for this request
+            incremental: Only parse stage entries not processed by an earlier
+                incremental call, and return just the rows they add; the
+                cumulative frames are kept in self.withdrawal_tracker.frames()
+            return_failures: Return the failures rather than warning or raising
+            **cache_kwargs: Override cache settings for this request
+
+        Returns:
+            Tuple of (withdrawals_df, withdrawn_competitors_df, withdrawn_teams_df);
+            with return_failures, a tuple of (frames, failures), where failures
+            maps each failed category to its exception, as in fetch_many()
+        """
         year = year or self.year
         category = category or self.category
         proxy = self._get_request_proxy(use_cache, **cache_kwargs)
-
         if isinstance(category, str):
             category = [category]
 
-        df_list1, df_list2, df_list3 = [], [], []
+        failures: Dict[str, Exception] = {}
+        if incremental:
+            frames = self.withdrawal_tracker.poll(year, category, proxy, failures=failures)
+        else:
+            results = []
+            for cat in category:
+                try:
+                    results.append(self._get_withdrawals_single(year, cat, proxy))
+                except Exception as e:
+                    failures[cat] = e
+            frames = self._combine_withdrawals(results)
+        return self._withdrawals_result(frames, failures, category, year, return_failures)
 
-        for cat in category:
-            df1, df2, df3 = self._get_withdrawals_single(year, cat, proxy)
-            df_list1.append(df1)
-            df_list2.append(df2)
-            df_list3.append(df3)
+    @staticmethod
+    def _combine_withdrawals(results: List[Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]]
+                             ) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+        """Concatenate and sort the withdrawal frames of several categories."""
+        if not results:
+            return pd.DataFrame(), pd.DataFrame(), pd.DataFrame()
+        df_list1, df_list2, df_list3 = zip(*results)
 
         combined_df1 = pd.concat(df_list1, ignore_index=True).sort_values(
             ["stage", "bib", "reason"]).reset_index(drop=True)
@@ -332,44 +894,56 @@ class DakarAPIClient:
 
         return combined_df1, combined_df2, combined_df3
 
+    @staticmethod
+    def _withdrawals_result(frames: Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame],
+                            failures: Dict[str, Exception], categories: List[str], year: int,
+                            return_failures: bool):
+        """Return withdrawal frames, with their failures, or warn of them, or raise if all failed."""
+        if return_failures:
+            return frames, failures
+        if failures:
+            if len(failures) == len(categories):
+                raise next(iter(failures.values()))
+            warnings.warn(f"Withdrawals of categories {sorted(failures)} for {year} failed: "
+                          + "; ".join(f"{cat}: {e!r}" for cat, e in failures.items()),
+                          RuntimeWarning, stacklevel=3)
+        return frames
+
     @staticmethod
     def _flatten_grounds_data(df: pd.DataFrame) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
         """Flatten nested grounds data into a wide DataFrame format."""
-        flattened_data = []
-        percentage_data = []
+        section_fields = ['code', 'section', 'start', 'finish', 'color', "type"]
+        percentage_fields = ['code', 'percentage', 'color', "type"]
+        flattened_data = {field: [] for field in section_fields}
+        percentage_data = {field: [] for field in percentage_fields}
         surface_types = []
-        _surface_types = []
+        _surface_types = set()
 
         df.sort_values("code", inplace=True)
 
-        for _, row in df.iterrows():
-            ground_data = row['grounds']
+        # Stream the (code, grounds) records rather than building a Series per row
+        for code, ground_data in zip(df["code"].tolist(), df["grounds"].tolist()):
             translations = {f"text_{lang['locale']}": lang['text']
                             for lang in ground_data['groundLangs']}
             _stype = translations["text_en"].lower()
+            color = ground_data['color']
 
-            percentage_data.append({
-                'code': row['code'],
-                'percentage': ground_data['percentage'],
-                'color': ground_data['color'],
-                "type": _stype
-            })
+            percentage_data['code'].append(code)
+            percentage_data['percentage'].append(ground_data['percentage'])
+            percentage_data['color'].append(color)
+            percentage_data['type'].append(_stype)
 
             if _stype not in _surface_types:
-                _surface_types.append(_stype)
+                _surface_types.add(_stype)
                 surface_types.append({"type": _stype, **translations})
 
             for section in ground_data['sections']:
-                section_record = {
-                    'code': row['code'],
-                    'ground_name': ground_data['name'],
-                    'section': section['section'],
-                    'start': section['start'],
-                    'finish': section['finish'],
-                    'color': ground_data['color'],
-                    "type": _stype
-                }
-                flattened_data.append(section_record)
+                flattened_data['code'].append(code)
+                flattened_data['section'].append(section['section'])
+                flattened_data['start'].append(section['start'])
+                flattened_data['finish'].append(section['finish'])
+                flattened_data['color'].append(color)
+                flattened_data['type'].append(_stype)
 
         section_df = pd.DataFrame(flattened_data)
         percentage_df = pd.DataFrame(percentage_data)
@@ -388,47 +962,78 @@ class DakarAPIClient:
 
     def get_stages(self, year: Optional[int] = None,
                    category: Optional[str] = None,
-                   use_cache: Optional[bool] = None, **cache_kwargs) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame, pd.DataFrame, pd.DataFrame]:
-        """Get stages information (start time, surfaces, sections)."""
+                   use_cache: Optional[bool] = None, **cache_kwargs) -> StagesResult:
+        """
+        Get stages information (start time, surfaces, sections).
+
+        The payload is fetched straight away, but each table is only built on
+        first access, as an attribute (stages, sectors, stage_surfaces,
+        section_surfaces, surfaces) or by unpacking the result like a tuple.
+        """
         year = year or self.year
         category = category or self.category
         proxy = self._get_request_proxy(use_cache, **cache_kwargs)
 
-        url = self._get_url(self.STAGE_TEMPLATE, year=year, category=category)
-        stage_df = pd.read_json(proxy.furl(url))
-
-        stage_df["variable"] = "stage.name." + stage_df["code"]
-        stage_df = self.mergeInLangLabels(
-            stage_df, "stageLangs", key="variable")
-        stage_df['stage_code'] = stage_df['code']
-        stage_df["stage"] = stage_df["stage"].astype(int)
-        stage_df.sort_values("startDate", inplace=True)
-        stage_df.reset_index(drop=True, inplace=True)
-
-        sectors_df = pd.json_normalize(stage_df["sectors"].explode())
-        sectors_df['stage_code'] = sectors_df['code'].str[:2] + '000'
-        sectors_df['sector_number'] = sectors_df.groupby(
-            'stage_code').cumcount() + 1
-
-        stage_cols = ['stage_code', 'stage', 'date', 'startDate', 'endDate', 'isCancelled',
-                      'generalDisplay', 'isDelayed', 'marathon', 'length', 'type', 'timezone',
-                      'stageWithBonus', 'mapCategoryDisplay', 'podiumDisplay', '_bind',
-                      'ar', 'en', 'es', 'fr']
-        stage_df = stage_df[stage_cols]
-
-        competitive_sectors = sectors_df[['grounds', 'code']].dropna(
-            axis="index").explode('grounds').reset_index(drop=True)
-
-        sectors_df = sectors_df[["stage_code", "code", "id", "sector_number", "powerStage",
-                                 "length", "startTime", "type", "arrivalTime"]]
-
-        sectors_df.sort_values("code", inplace=True)
-        sectors_df.reset_index(drop=True, inplace=True)
-
-        section_surfaces, stage_surfaces, surfaces = self._flatten_grounds_data(
-            competitive_sectors)
-
-        return stage_df, sectors_df, stage_surfaces, section_surfaces, surfaces
+        path = self.STAGE_TEMPLATE.format(year=year, category=category)
+        return self._parsed("stages", path, proxy, self._parse_stages)
+
+    def _parse_stages(self, content: bytes) -> StagesResult:
+        """Parse a stages payload for a single category, building each table on first access."""
+        if self.backend == "polars":
+            # Polars builds every table in one pass, on first access to any of them
+            frames = once(lambda: polars_backend.parse_stages(content, self.wide_labels))
+            return StagesResult({name: (lambda i=i: frames()[i])
+                                 for i, name in enumerate(StagesResult.NAMES)})
+
+        @once
+        def stages():
+            stage_df = pd.read_json(io.BytesIO(content))
+
+            stage_df["variable"] = "stage.name." + stage_df["code"]
+            stage_df = self.mergeInLangLabels(
+                stage_df, "stageLangs", key="variable", widen=self.wide_labels)
+            stage_df['stage_code'] = stage_df['code']
+            stage_df["stage"] = stage_df["stage"].astype(int)
+            stage_df.sort_values("startDate", inplace=True)
+            stage_df.reset_index(drop=True, inplace=True)
+            return stage_df
+
+        @once
+        def sectors():
+            sectors_df = pd.json_normalize(stages()["sectors"].explode())
+            sectors_df['stage_code'] = sectors_df['code'].str[:2] + '000'
+            sectors_df['sector_number'] = sectors_df.groupby(
+                'stage_code').cumcount() + 1
+            return sectors_df
+
+        def stage_table():
+            stage_cols = ['stage_code', 'stage', 'date', 'startDate', 'endDate', 'isCancelled',
+                          'generalDisplay', 'isDelayed', 'marathon', 'length', 'type', 'timezone',
+                          'stageWithBonus', 'mapCategoryDisplay', 'podiumDisplay', '_bind']
+            stage_cols += ['ar', 'en', 'es', 'fr'] if self.wide_labels else ['variable']
+            return stages()[stage_cols]
+
+        def sector_table():
+            sectors_df = sectors()[["stage_code", "code", "id", "sector_number", "powerStage",
+                                    "length", "startTime", "type", "arrivalTime"]]
+
+            sectors_df = sectors_df.sort_values("code")
+            sectors_df.reset_index(drop=True, inplace=True)
+            return sectors_df
+
+        @once
+        def grounds():
+            competitive_sectors = sectors()[['grounds', 'code']].dropna(
+                axis="index").explode('grounds').reset_index(drop=True)
+            return self._flatten_grounds_data(competitive_sectors)
+
+        return StagesResult({
+            "stages": stage_table,
+            "sectors": sector_table,
+            "stage_surfaces": lambda: grounds()[1],
+            "section_surfaces": lambda: grounds()[0],
+            "surfaces": lambda: grounds()[2],
+        })
 
     @staticmethod
     def long_results_ce(_results: pd.DataFrame) -> pd.DataFrame:
@@ -525,32 +1130,232 @@ class DakarAPIClient:
 
         return melted
 
+    def _parse_scores(self, records: list, year: int, category: str,
+                      stage: int, content: Optional[bytes] = None) -> ScoresResult:
+        """
+        Parse lastScore records into long results, team and competitor frames, each on first access.
+
+        The raw content, if given, is read directly by the polars backend.
+        """
+        # Crews are only renormalised if not registered with the same team record;
+        # the registry itself is updated by get_scores(), not here
+        entities = self.entities
+        crews = once(lambda: entities.frames(records, year))
+
+        # Decode the results straight from the records rather than melting them
+        if self.backend == "polars":
+            scores = once(lambda: polars_backend.scores_frame(content, records))
+            decode_cg = lambda: polars_backend.long_results_cg(scores(), year, category, stage)
+            decode_ce = lambda: polars_backend.long_results_ce(scores(), year, category, stage)
+        else:
+            decode_cg = lambda: long_results_cg_from_records(records, year, category, stage)
+            decode_ce = lambda: long_results_ce_from_records(records, year, category, stage)
+        return ScoresResult({
+            "long_results_cg": decode_cg,
+            "long_results_ce": decode_ce,
+            "teams": lambda: crews()[0],
+            "competitors": lambda: crews()[1],
+        })
+
     def get_scores(self, year: Optional[int] = None,
                    category: Optional[str] = None,
                    stage: Optional[int] = None,
-                   use_cache: Optional[bool] = None, **cache_kwargs) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame, pd.DataFrame, pd.DataFrame]:
-        """Get lastScore information (results, times)."""
+                   use_cache: Optional[bool] = None,
+                   conditional: bool = False, compact: bool = False,
+                   **cache_kwargs) -> ScoresResult:
+        """
+        Get lastScore information (results, times).
+
+        Returns the long_results_cg and long_results_ce frames, which refer to
+        crews by their `team.bib` and `year`, and the teams and competitors
+        frames of the stage. The crews of every payload fetched, whether parsed,
+        memoised or served from a snapshot, are added to the client's `entities`
+        registry, whose teams and competitors span every stage fetched so far.
+
+        The payload is fetched straight away, but each table is only built on
+        first access, as an attribute (long_results_cg, long_results_ce, teams,
+        competitors) or by unpacking the result like a tuple.
+
+        Args:
+            year: Override default year
+            category: Override default category
+            stage: Override default stage
+            use_cache: Override default caching behavior for this request
+            conditional: If True, use conditional requests and change detection
+                and, if the payload is unchanged since the last conditional call,
+                return the previously parsed frames (the same objects) unparsed
+            compact: If True, return the long results frames with categorical
+                string columns, over shared category sets where they have few
+                values, and narrow int columns;
+                see decoders.compact_long_results() and decoders.concat_compact()
+            **cache_kwargs: Override cache settings for this request
+        """
         year = year or self.year
         category = category or self.category
-        stage = stage or self.stage
+        stage = stage if stage is not None else self.stage
         proxy = self._get_request_proxy(use_cache, **cache_kwargs)
 
-        url = self._get_url(self.SCORE_TEMPLATE, year=year, category=category, stage=stage)
-        _results_df = pd.json_normalize(proxy.cors_proxy_get(url).json())
+        if not conditional:
+            path = self.SCORE_TEMPLATE.format(year=year, category=category, stage=stage)
+            frames = self._parsed("scores", path, proxy,
+                                  lambda content: self._parse_scores(json_loads(content),
+                                                                     year, category, stage,
+                                                                     content))
+            self._register_crews(path, proxy, year)
+        else:
+            url = self._get_url(self.SCORE_TEMPLATE, year=year, category=category, stage=stage)
+            frames, _ = self._inflight.do(("conditional", url, id(proxy)),
+                                          lambda: self._get_scores_conditional(url, proxy, year,
+                                                                               category, stage))
 
-        teams_df, competitors_df, _results_df = self.normalize_team_competitors(_results_df)
+        if compact:
+            frames = frames.map({"long_results_cg": compact_long_results,
+                                 "long_results_ce": compact_long_results})
+        return frames
 
-        long_results_df = self.long_results_cg(_results_df)
-        long_results2_df = self.long_results_ce(_results_df)
+    def _register_crews(self, path: str, proxy: CorsProxy, year: int) -> None:
+        """
+        Add the crews of the latest lastScore payload for a path to the entity registry.
 
-        return long_results_df, long_results2_df, teams_df, competitors_df
+        Runs on every get_scores() call, however its frames were got, but
+        a payload is only decoded for this the first time the client sees it.
+        """
+        digest = self.store.ref(path)
+        if digest is None:
+            # Served from the snapshot, without fetching the payload
+            if self.snapshot is not None and self._crew_digests.get(path) != "snapshot":
+                crews = self.snapshot.crews(path)
+                if crews is not None:
+                    self.entities.update(crews, year)
+                    self._crew_digests[path] = "snapshot"
+            return
+        if self._crew_digests.get(path) == digest:
+            return
+
+        content = self.store.get(digest)
+        if content is None:
+            content = self._content(path, proxy)
+        self.entities.update(json_loads(content), year)
+        self._crew_digests[path] = digest
+
+    def _get_scores_conditional(self, url: str, proxy: CorsProxy, year: int, category: str,
+                                stage: int) -> ScoresResult:
+        """Poll a lastScore URL, parsing and recording its frames only if it has changed."""
+        with self._score_lock:
+            previous = self._score_state.get(url)
+        records, state = self._poll(url, proxy, previous)
+        if records is not None:
+            self.entities.update(records, year)
+            state["frames"] = self._parse_scores(records, year, category, stage)
+        with self._score_lock:
+            self._score_state[url] = state
+
+        return state["frames"]
+
+    def watch_scores(self, categories: Optional[Union[str, List[str]]] = None,
+                     stage: Optional[int] = None, year: Optional[int] = None,
+                     min_interval: float = 5.0, max_interval: float = 120.0,
+                     backoff: float = 2.0, max_polls: Optional[int] = None,
+                     use_cache: Optional[bool] = None, **cache_kwargs) -> Iterator[Tuple[str, pd.DataFrame, pd.DataFrame]]:
+        """
+        Watch live lastScore results, yielding only new or changed rows.
+
+        The polling interval backs off towards max_interval while results stay
+        unchanged, and resets to min_interval when they change.
+
+        Args:
+            categories: Category or list of categories to watch
+            stage: Override default stage
+            year: Override default year
+            min_interval: Polling interval (seconds) while results are changing
+            max_interval: Longest polling interval (seconds) when results are quiet
+            backoff: Factor the interval grows by after each quiet poll
+            max_polls: Stop after this many polls (default: poll forever)
+            use_cache: Override default caching behavior for the polls
+            **cache_kwargs: Override cache settings for the polls
+
+        Yields:
+            (category, cg_changes, ce_changes), where the change frames hold the
+            long_results_cg / long_results_ce rows that are new or changed
+        """
+        watcher = ScoreWatcher(self, categories or self.category, stage=stage, year=year,
+                               min_interval=min_interval, max_interval=max_interval,
+                               backoff=backoff, use_cache=use_cache, **cache_kwargs)
+        return watcher.watch(max_polls=max_polls)
+
+    def _fetch_key(self, endpoint: str, year: Optional[int] = None,
+                   category: Optional[str] = None,
+                   stage: Optional[int] = None) -> Tuple[str, Optional[int], Optional[str], Optional[int]]:
+        """Normalise a bulk fetch request to an (endpoint, year, category, stage) key."""
+        if endpoint not in self.ENDPOINTS:
+            raise ValueError(
+                f"Unknown endpoint: {endpoint}. Available endpoints: {', '.join(self.ENDPOINTS)}")
+        _, params = self.ENDPOINTS[endpoint]
+        year = year or self.year
+        category = (category or self.category) if "category" in params else None
+        stage = (stage if stage is not None else self.stage) if "stage" in params else None
+        return endpoint, year, category, stage
+
+    def fetch_many(self, keys: Optional[Iterable[Tuple]] = None,
+                   endpoints: Optional[List[str]] = None,
+                   years: Optional[List[int]] = None,
+                   categories: Optional[List[str]] = None,
+                   stages: Optional[Iterable[int]] = None,
+                   max_workers: int = 8,
+                   use_cache: Optional[bool] = None, **cache_kwargs) -> Tuple[Dict[Tuple, Any], Dict[Tuple, Exception]]:
+        """
+        Fetch several endpoints concurrently over a bounded thread pool.
+
+        Requests are either given explicitly as (endpoint, year, category, stage)
+        keys, or generated as the product of endpoints, years, categories and stages.
+        Endpoints that do not take a category or stage are only fetched once.
+
+        Args:
+            keys: Explicit list of (endpoint, year, category, stage) tuples
+            endpoints: Endpoint names to sweep (see ENDPOINTS)
+            years: Years to sweep; defaults to the client year
+            categories: Categories to sweep; defaults to the client category
+            stages: Stages to sweep; defaults to the client stage
+            max_workers: Maximum number of concurrent requests
+            use_cache: Override default caching behavior for these requests
+            **cache_kwargs: Override cache settings for these requests
+
+        Returns:
+            Tuple of (results, failures) dicts, both keyed by
+            (endpoint, year, category, stage). A failed request is reported
+            in failures with its exception and does not abort the batch.
+        """
+        if keys is None:
+            keys = product(endpoints or list(self.ENDPOINTS),
+                               years or [self.year],
+                               categories or [self.category],
+                               stages or [self.stage])
+
+        # Normalise and de-duplicate, preserving request order
+        keys = list(dict.fromkeys(self._fetch_key(*k) for k in keys))
+
+        def _fetch(key):
+            endpoint, year, category, stage = key
+            getter, params = self.ENDPOINTS[endpoint]
+            kwargs = {p: v for p, v in zip(("year", "category", "stage"), key[1:])
+                      if p in params}
+            return getattr(self, getter)(use_cache=use_cache, **kwargs, **cache_kwargs)
+
+        results, failures = {}, {}
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+            futures = {key: executor.submit(_fetch, key) for key in keys}
+            for key, future in futures.items():
+                try:
+                    results[key] = future.result()
+                except Exception as e:
+                    failures[key] = e
+
+        return results, failures
 
     def _get_request_proxy(self, use_cache: Optional[bool], **cache_kwargs) -> CorsProxy:
         """Get appropriate proxy for the request based on cache settings."""
-        if use_cache is None or not cache_kwargs:
+        if self.replay_dir is not None or use_cache is None or not cache_kwargs:
             return self.proxy
 
-        # Create new proxy with specific cache settings for this request
-        if use_cache:
-            return create_cached_proxy(**cache_kwargs)
-        return CorsProxy()
+        # Reuse the pooled proxy for these specific cache settings
+        return self.registry.get(use_cache, **cache_kwargs)
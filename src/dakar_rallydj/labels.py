@@ -0,0 +1,119 @@
+import threading
+from typing import Dict, Iterable, List, Optional
+
+import pandas as pd
+
+
+class LabelDictionary:
+    """
+    Language labels by variable, holding locale -> text for each.
+
+    Label lists such as `categoryLangs` or `stageLangs` are added to the
+    dictionary as payloads are parsed, so the labels, which barely change
+    across categories and years, accumulate in one place. Label columns are
+    then attached to a frame by an indexed lookup on its key column rather
+    than by a pivot and merge.
+    """
+
+    def __init__(self):
+        self._labels: Dict[str, Dict[str, str]] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._labels)
+
+    def __contains__(self, variable: str) -> bool:
+        return variable in self._labels
+
+    def update(self, label_lists: Iterable) -> Dict[str, List[str]]:
+        """
+        Add lists of {variable, locale, text} labels to the dictionary.
+
+        Args:
+            label_lists: Iterable of label lists, e.g. a `...Langs` column;
+                values that are not lists are skipped
+
+        Returns:
+            Dict of the variables seen, in order of appearance, to their locales
+        """
+        seen: Dict[str, List[str]] = {}
+        with self._lock:
+            for labels in label_lists:
+                if not isinstance(labels, list):
+                    continue
+                for label in labels:
+                    if not isinstance(label, dict) or label.get("variable") is None:
+                        continue
+                    variable, locale = label["variable"], label.get("locale")
+                    self._labels.setdefault(variable, {})[locale] = label.get("text")
+                    seen.setdefault(variable, []).append(locale)
+        return seen
+
+    def lookup(self, variables: pd.Series, locale: str) -> pd.Series:
+        """Look up the text in one locale for each of a series of variables."""
+        texts = {}
+        for variable in variables.unique():
+            text = self._labels.get(variable, {}).get(locale)
+            if text is not None:
+                texts[variable] = text
+        return variables.map(texts)
+
+    def table(self, variables: Optional[Iterable[str]] = None) -> pd.DataFrame:
+        """
+        Get labels as a normalised long table.
+
+        Args:
+            variables: Variables to include (default: all)
+
+        Returns:
+            DataFrame with columns variable, locale, text
+        """
+        with self._lock:
+            variables = list(self._labels) if variables is None else variables
+            rows = [(variable, locale, text)
+                    for variable in variables
+                    for locale, text in self._labels.get(variable, {}).items()]
+        return pd.DataFrame(rows, columns=["variable", "locale", "text"])
+
+    def clear(self) -> None:
+        """Forget all labels."""
+        with self._lock:
+            self._labels.clear()
+
+
+# Process-wide label dictionary shared by every client
+LANG_LABELS = LabelDictionary()
+
+
+def merge_lang_labels(df: pd.DataFrame, col: str, key: str = "shortLabel",
+                      labels: Optional[LabelDictionary] = None,
+                      widen: bool = True) -> pd.DataFrame:
+    """
+    Attach the language labels held in a column of label lists to a frame.
+
+    The labels are added to the label dictionary, then one column per locale
+    found in `col` is looked up by the `key` column. As with a pivot and inner
+    merge, rows whose key has no labels in `col` are dropped, the index is
+    reset, and the `variable` and `col` columns are dropped. Labels for a
+    locale missing from `col` but known from an earlier payload are filled in.
+
+    Args:
+        df: Frame holding the label lists
+        col: Column of label lists
+        key: Column of variables to look the labels up by
+        labels: Label dictionary to use (default: LANG_LABELS)
+        widen: If False, keep the key column and add no label columns, leaving
+            the labels in the dictionary's normalised table()
+    """
+    labels = labels if labels is not None else LANG_LABELS
+    seen = labels.update(df[col])
+
+    _df = df[df[key].isin(list(seen))].reset_index(drop=True)
+    if widen:
+        locales = sorted({locale for locales in seen.values() for locale in locales})
+        for locale in locales:
+            _df[locale] = labels.lookup(_df[key], locale)
+        _df.drop("variable", axis=1, inplace=True, errors="ignore")
+    _df.drop(col, axis=1, inplace=True, errors="ignore")
+
+    return _df
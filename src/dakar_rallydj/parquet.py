@@ -0,0 +1,313 @@
+import os
+import tempfile
+from itertools import product
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+import pandas as pd
+
+
+class DakarParquetDataset:
+    """
+    Getter tables saved as a Parquet dataset, partitioned by year/category/stage.
+
+    Each table is a directory of Hive style partitions, e.g.
+    `long_results_cg/year=2025/category=A/stage=3/part-0.parquet`, holding one
+    file per partition, which is replaced whenever the partition is written
+    again. Partition values are kept in the paths, not in the files, so other
+    Parquet readers see the same columns.
+
+    read() skips whole files whose partition does not match the year,
+    category, stage or partition column filters, and hands the remaining
+    filters and columns to the Parquet engine, which skips row groups by
+    their statistics and only decodes the requested columns. As fastparquet
+    applies filters to row groups only, the rows read are filtered again.
+
+    Files are written and read with pandas, using the given engine:
+    fastparquet or pyarrow, whichever is installed for engine="auto".
+
+    Usage:
+        dataset = DakarParquetDataset("dakar_2025")
+        dataset.export(client, categories=["A", "M"], stages=range(1, 13))
+        dataset.read("long_results_cg", category="M", stage=12,
+                     columns=["team.bib", "metric", "value_0"],
+                     filters=[("metric", "==", "position")])
+    """
+
+    # Partition columns of each table, in path order; frames lacking any are
+    # given them from the write() arguments
+    PARTITIONS: Dict[str, List[str]] = {
+        "long_results_cg": ["year", "category", "stage"],
+        "long_results_ce": ["year", "category", "stage"],
+        "teams": ["year", "category", "stage"],
+        "competitors": ["year", "category", "stage"],
+        "waypoints": ["year", "category", "stage"],
+        "stages": ["year", "category"],
+        "sectors": ["year", "category"],
+        "stage_surfaces": ["year", "category"],
+        "section_surfaces": ["year", "category"],
+        "surfaces": ["year", "category"],
+        "withdrawals": ["year", "_category", "stage"],
+        "withdrawn_competitors": ["year"],
+        "withdrawn_teams": ["year"],
+    }
+    # Partition columns read back as integers
+    INTEGER_PARTITIONS = ("year", "stage")
+    FILE_NAME = "part-0.parquet"
+
+    def __init__(self, root: str, engine: str = "auto", compression: Optional[str] = "snappy"):
+        """
+        Args:
+            root: Dataset directory
+            engine: Parquet engine: "auto", "fastparquet" or "pyarrow"
+            compression: Compression codec for written files
+        """
+        self.root = root
+        self.engine = engine
+        self.compression = compression
+
+    @staticmethod
+    def _path_value(value: Any) -> Any:
+        """Format a partition value for a path, as an integer where it is one."""
+        if isinstance(value, str):
+            return int(value) if value.isdigit() else value
+        if hasattr(value, "item"):
+            value = value.item()
+        if isinstance(value, float) and value.is_integer():
+            value = int(value)
+        return value
+
+    def _partition_dir(self, table: str, partition: Sequence[Tuple[str, Any]]) -> str:
+        return os.path.join(self.root, table,
+                            *[f"{col}={self._path_value(value)}" for col, value in partition])
+
+    def _write_file(self, df: pd.DataFrame, directory: str) -> str:
+        """Write a partition's file, replacing any previous one atomically."""
+        os.makedirs(directory, exist_ok=True)
+        path = os.path.join(directory, self.FILE_NAME)
+        fd, tmp = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        os.close(fd)
+        try:
+            df.to_parquet(tmp, engine=self.engine, compression=self.compression, index=False)
+            os.replace(tmp, path)
+        finally:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+        return path
+
+    def write(self, table: str, df: pd.DataFrame, year: Optional[int] = None,
+              category: Optional[str] = None, stage: Optional[int] = None) -> List[str]:
+        """
+        Write a getter frame to its table, one file per partition.
+
+        Args:
+            table: Table name (see PARTITIONS)
+            df: Frame as returned by a getter
+            year: Year of the frame's rows, if not in the frame
+            category: Category of the frame's rows, if not in the frame
+            stage: Stage of the frame's rows, if not in the frame
+
+        Returns:
+            Paths of the files written
+        """
+        if table not in self.PARTITIONS:
+            raise ValueError(f"Unknown table {table!r}; expected one of {list(self.PARTITIONS)}")
+        partition_cols = self.PARTITIONS[table]
+        if any(name is not None for name in df.index.names):
+            df = df.reset_index()
+        df = df.copy()
+        for col, value in zip(partition_cols, [year, category, stage]):
+            if col not in df.columns:
+                if value is None:
+                    raise ValueError(f"{table} rows need a {col} value")
+                df[col] = value
+        if df.empty:
+            return []
+
+        paths = []
+        for values, part in df.groupby(partition_cols, sort=False, dropna=False):
+            values = values if isinstance(values, tuple) else (values,)
+            paths.append(self._write_file(part.drop(columns=partition_cols).reset_index(drop=True),
+                                          self._partition_dir(table, list(zip(partition_cols, values)))))
+        return paths
+
+    def write_scores(self, result, year: int, category: str, stage: int) -> List[str]:
+        """Write the tables of a get_scores() result."""
+        paths = []
+        for table, df in zip(["long_results_cg", "long_results_ce", "teams", "competitors"], result):
+            paths += self.write(table, df, year, category, stage)
+        return paths
+
+    def write_stages(self, result, year: int, category: str) -> List[str]:
+        """Write the tables of a get_stages() result."""
+        paths = []
+        for table, df in zip(["stages", "sectors", "stage_surfaces", "section_surfaces", "surfaces"], result):
+            paths += self.write(table, df, year, category)
+        return paths
+
+    def write_withdrawals(self, frames: Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame],
+                          year: int) -> List[str]:
+        """Write the frames of a get_withdrawals() result."""
+        paths = []
+        for table, df in zip(["withdrawals", "withdrawn_competitors", "withdrawn_teams"], frames):
+            paths += self.write(table, df, year)
+        return paths
+
+    def export(self, client, categories: Optional[Union[str, List[str]]] = None,
+               stages: Optional[Iterable[int]] = None, year: Optional[int] = None,
+               **getter_kwargs) -> List[str]:
+        """
+        Fetch a season's getter output and write every table.
+
+        Args:
+            client: DakarAPIClient to get the frames with
+            categories: Category or list of categories; defaults to the client category
+            stages: Stages to write scores and waypoints for; defaults to the client stage
+            year: Year; defaults to the client year
+            **getter_kwargs: Passed to each getter, e.g. use_cache
+
+        Returns:
+            Paths of the files written
+        """
+        year = year or client.year
+        categories = categories or client.category
+        if isinstance(categories, str):
+            categories = [categories]
+        stages = list(stages) if stages is not None else [client.stage]
+
+        # Withdrawn crews are written a year at a time, so a partial result would drop some
+        withdrawals, failures = client.get_withdrawals(year=year, category=categories,
+                                                       return_failures=True, **getter_kwargs)
+        if failures:
+            raise next(iter(failures.values()))
+        paths = self.write_withdrawals(withdrawals, year)
+        for category in categories:
+            paths += self.write_stages(client.get_stages(year=year, category=category, **getter_kwargs),
+                                       year, category)
+        paths += self.write("waypoints", client.get_waypoints_bulk(categories, stages, year=year,
+                                                                   **getter_kwargs), year)
+        for category, stage in product(categories, stages):
+            paths += self.write_scores(client.get_scores(year=year, category=category, stage=stage,
+                                                         **getter_kwargs), year, category, stage)
+        return paths
+
+    def _partition_value(self, col: str, text: str) -> Any:
+        return int(text) if col in self.INTEGER_PARTITIONS and text.lstrip("-").isdigit() else text
+
+    def partitions(self, table: str) -> Iterator[Tuple[Dict[str, Any], str]]:
+        """Yield the ({column: value}, path) of each partition file of a table."""
+        partition_cols = self.PARTITIONS[table]
+        table_dir = os.path.join(self.root, table)
+        if not os.path.isdir(table_dir):
+            return
+        for directory, _, files in sorted(os.walk(table_dir)):
+            if self.FILE_NAME not in files:
+                continue
+            parts = os.path.relpath(directory, table_dir).split(os.sep)
+            values = dict(part.split("=", 1) for part in parts if "=" in part)
+            if list(values) != partition_cols:
+                continue
+            yield ({col: self._partition_value(col, text) for col, text in values.items()},
+                   os.path.join(directory, self.FILE_NAME))
+
+    @staticmethod
+    def _matches(value: Any, op: str, operand: Any) -> bool:
+        """Evaluate a (column, op, value) filter on a partition value."""
+        if op in ("=", "=="):
+            return value == operand
+        if op == "!=":
+            return value != operand
+        if op == "in":
+            return value in operand
+        if op == "not in":
+            return value not in operand
+        if op == "<":
+            return value < operand
+        if op == "<=":
+            return value <= operand
+        if op == ">":
+            return value > operand
+        if op == ">=":
+            return value >= operand
+        raise ValueError(f"Unsupported filter operator {op!r}")
+
+    @staticmethod
+    def _filter_rows(df: pd.DataFrame, filters: List[Tuple[str, str, Any]]) -> pd.DataFrame:
+        """Keep the rows of a frame for which every (column, op, value) filter holds."""
+        mask = pd.Series(True, index=df.index)
+        for col, op, operand in filters:
+            values = df[col]
+            if op in ("=", "=="):
+                mask &= values == operand
+            elif op == "!=":
+                mask &= values != operand
+            elif op == "in":
+                mask &= values.isin(operand)
+            elif op == "not in":
+                mask &= ~values.isin(operand)
+            elif op == "<":
+                mask &= values < operand
+            elif op == "<=":
+                mask &= values <= operand
+            elif op == ">":
+                mask &= values > operand
+            elif op == ">=":
+                mask &= values >= operand
+            else:
+                raise ValueError(f"Unsupported filter operator {op!r}")
+        return df if mask.all() else df[mask].reset_index(drop=True)
+
+    def read(self, table: str, year: Optional[Union[int, List[int]]] = None,
+             category: Optional[Union[str, List[str]]] = None,
+             stage: Optional[Union[int, List[int]]] = None,
+             columns: Optional[List[str]] = None,
+             filters: Optional[List[Tuple[str, str, Any]]] = None) -> pd.DataFrame:
+        """
+        Read a table, only touching the files and row groups that can match.
+
+        Args:
+            table: Table name (see PARTITIONS)
+            year: Year or years to read (default: all)
+            category: Category or categories to read (default: all)
+            stage: Stage or stages to read (default: all)
+            columns: Columns to read (default: all)
+            filters: (column, op, value) row filters, all of which must hold;
+                filters on partition columns select files, others are used by
+                the Parquet engine to skip row groups, then applied to the rows
+
+        Returns:
+            DataFrame with the partition columns last
+        """
+        partition_cols = self.PARTITIONS[table]
+        filters = list(filters or [])
+        for col, values in zip(["year", "category", "stage"], [year, category, stage]):
+            if values is not None:
+                col = col if col in partition_cols else f"_{col}"
+                if col in partition_cols:
+                    filters.append((col, "in", values if isinstance(values, (list, tuple, set))
+                                    else [values]))
+        partition_filters = [f for f in filters if f[0] in partition_cols]
+        row_filters = [f for f in filters if f[0] not in partition_cols] or None
+        file_columns = None
+        if columns is not None:
+            # Read the filtered columns too, to filter the rows by
+            file_columns = list(dict.fromkeys(
+                [c for c in columns if c not in partition_cols]
+                + [col for col, _, _ in row_filters or []]))
+
+        frames = []
+        for values, path in self.partitions(table):
+            if not all(self._matches(values[col], op, operand)
+                       for col, op, operand in partition_filters):
+                continue
+            df = pd.read_parquet(path, engine=self.engine, columns=file_columns, filters=row_filters)
+            if row_filters:
+                df = self._filter_rows(df, row_filters)
+            for col, value in values.items():
+                if columns is None or col in columns:
+                    df[col] = value
+            frames.append(df)
+
+        if not frames:
+            return pd.DataFrame(columns=columns)
+        df = pd.concat(frames, ignore_index=True)
+        return df[columns] if columns is not None else df
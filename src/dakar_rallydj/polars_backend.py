@@ -0,0 +1,329 @@
+"""
+Polars implementations of the parsing pipelines, for DakarAPIClient(backend="polars").
+
+Each parser reads the raw JSON payload with Polars' native reader, runs the same
+transformations as the pandas parsers on Arrow-backed Polars frames, using
+Polars' multi-threaded expressions and without the intermediate pandas
+copies, and converts the results to pandas at the boundary.
+
+Results have the same columns and values as the pandas parsers, but a
+default RangeIndex and the dtypes pandas infers from Arrow. Sorts are stable,
+so rows that tie on the sort keys keep their payload order.
+"""
+import io
+from typing import Iterator, List, Optional, Tuple
+
+import pandas as pd
+
+try:
+    import polars as pl
+except ImportError:
+    pl = None
+
+from .decoders import CE_METRICS, CG_METRICS, DSS_METRICS
+from .labels import LANG_LABELS
+
+CG_COLUMNS = ["_id", "team.bib", "type", "waypoint", "metric", "value_0", "value_1",
+              "year", "category", "stage"]
+CE_COLUMNS = ["_id", "team.bib", "metric", "value_0", "value_1", "type",
+              "year", "category", "stage"]
+
+
+def _require_polars() -> None:
+    if pl is None:
+        raise ImportError("The polars backend needs polars (and pyarrow) installed")
+
+
+def _read(content: bytes) -> "pl.DataFrame":
+    """Read a JSON payload, inferring the schema from every record."""
+    return pl.read_json(io.BytesIO(content), infer_schema_length=None)
+
+
+def _flat_exprs(name: str, dtype, expr: "pl.Expr") -> Iterator["pl.Expr"]:
+    """Expressions for the leaf fields of a (possibly nested) struct column, with dotted names."""
+    if isinstance(dtype, pl.Struct):
+        for field in dtype.fields:
+            yield from _flat_exprs(f"{name}.{field.name}", field.dtype,
+                                   expr.struct.field(field.name))
+    else:
+        yield expr.alias(name)
+
+
+def _unnest_all(df: "pl.DataFrame", columns: Optional[List[str]] = None) -> "pl.DataFrame":
+    """
+    Recursively unnest struct columns to dotted column names, as pd.json_normalize() does.
+
+    Args:
+        df: Frame to unnest
+        columns: Struct columns to unnest (default: all)
+    """
+    exprs = []
+    for name, dtype in df.schema.items():
+        if columns is None or name in columns:
+            exprs.extend(_flat_exprs(name, dtype, pl.col(name)))
+        else:
+            exprs.append(pl.col(name))
+    return df.select(exprs)
+
+
+def _to_pandas(df: "pl.DataFrame") -> pd.DataFrame:
+    """Convert a result to pandas at the boundary."""
+    return df.to_pandas()
+
+
+def parse_waypoints(content: bytes, year: int, category: str, stage: int) -> pd.DataFrame:
+    """Parse a waypoints payload for a single category and stage."""
+    _require_polars()
+    df = _read(content)
+    stage_code = df.get_column("_origin")[0]
+    waypoint_df = _unnest_all(
+        df.select("waypoints").explode("waypoints").unnest("waypoints"))
+
+    waypoint_df = waypoint_df.with_columns(
+        pl.lit(year).alias("year"),
+        pl.lit(stage).alias("stage"),
+        pl.lit(category).alias("category"),
+        pl.lit(stage_code).alias("stage_code"),
+    )
+    waypoint_df = waypoint_df.drop(["groups", "isFirstDss"], strict=False)
+    waypoint_df = waypoint_df.sort(["stage", "checkpoint"], maintain_order=True)
+    return _to_pandas(waypoint_df)
+
+
+def parse_withdrawals(content: bytes, category: str) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+    """Parse a withdrawals payload for a single category."""
+    _require_polars()
+    withdrawals_by_stage_df = (
+        _read(content).select("stage", "list").explode("list")
+        .unnest("list").pipe(_unnest_all)
+    )
+    # The stage follows the withdrawal fields, as in the pandas parser
+    withdrawals_by_stage_df = withdrawals_by_stage_df.select(
+        pl.exclude("stage"), pl.col("stage"))
+
+    # Process competitor withdrawals
+    withdrawn_competitors_df = (
+        withdrawals_by_stage_df.select("stage", "bib", "reason", "team.competitors")
+        .explode("team.competitors")
+        .unnest("team.competitors")
+        .pipe(_unnest_all)
+    )
+
+    # Process team withdrawals
+    team_cols = [c for c in withdrawals_by_stage_df.columns
+                 if c.startswith("team") and c != "team.competitors"]
+    withdrawn_teams_df = withdrawals_by_stage_df.select(team_cols).sort(
+        "team.bib", maintain_order=True)
+
+    # Process withdrawals summary
+    withdrawals_df = (
+        withdrawn_competitors_df.select("stage", "bib", "reason")
+        .unique(maintain_order=True)
+        .with_columns(pl.lit(category).alias("_category"))
+        .sort(["stage", "reason"], maintain_order=True)
+    )
+
+    # Clean up competitor data
+    withdrawn_competitors_df = withdrawn_competitors_df.drop("stage", "reason").sort(
+        "bib", maintain_order=True)
+
+    return (_to_pandas(withdrawals_df), _to_pandas(withdrawn_competitors_df),
+            _to_pandas(withdrawn_teams_df))
+
+
+def _lang_labels(df: "pl.DataFrame", col: str, key: str, widen: bool) -> "pl.DataFrame":
+    """Attach language labels by the key column, as labels.merge_lang_labels() does."""
+    seen = LANG_LABELS.update(df.get_column(col).to_list())
+    df = df.filter(pl.col(key).is_in(list(seen)))
+    if widen:
+        locales = sorted({locale for locales in seen.values() for locale in locales})
+        keys = pd.Series(list(seen))
+        df = df.with_columns(
+            pl.col(key).replace_strict(
+                dict(zip(keys, LANG_LABELS.lookup(keys, locale))), default=None,
+                return_dtype=pl.String).alias(locale)
+            for locale in locales)
+        df = df.drop("variable", strict=False)
+    return df.drop(col, strict=False)
+
+
+def _parse_dates(df: "pl.DataFrame", col: str) -> "pl.DataFrame":
+    """Parse a date column if every value parses, as pd.read_json() would."""
+    try:
+        return df.with_columns(pl.col(col).str.to_datetime(time_unit="ns"))
+    except Exception:
+        return df
+
+
+def parse_stages(content: bytes, wide_labels: bool = True) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+    """Parse a stages payload for a single category."""
+    _require_polars()
+    stage_df = _parse_dates(_read(content), "date")
+
+    stage_df = stage_df.with_columns(
+        ("stage.name." + pl.col("code")).alias("variable"))
+    stage_df = _lang_labels(stage_df, "stageLangs", "variable", wide_labels)
+    stage_df = stage_df.with_columns(pl.col("code").alias("stage_code"),
+                                     pl.col("stage").cast(pl.Int64))
+    stage_df = stage_df.sort("startDate", maintain_order=True)
+
+    sectors_df = _unnest_all(
+        stage_df.select("sectors").explode("sectors").unnest("sectors"))
+    sectors_df = sectors_df.with_columns(
+        (pl.col("code").str.slice(0, 2) + "000").alias("stage_code"))
+    sectors_df = sectors_df.with_columns(
+        (pl.int_range(pl.len()).over("stage_code") + 1).alias("sector_number"))
+
+    stage_cols = ['stage_code', 'stage', 'date', 'startDate', 'endDate', 'isCancelled',
+                  'generalDisplay', 'isDelayed', 'marathon', 'length', 'type', 'timezone',
+                  'stageWithBonus', 'mapCategoryDisplay', 'podiumDisplay', '_bind']
+    stage_cols += ['ar', 'en', 'es', 'fr'] if wide_labels else ['variable']
+    stage_table = stage_df.select(stage_cols)
+
+    sector_table = sectors_df.select(
+        "stage_code", "code", "id", "sector_number", "powerStage",
+        "length", "startTime", "type", "arrivalTime").sort("code", maintain_order=True)
+
+    # Flatten the grounds of the competitive sectors
+    grounds = (
+        sectors_df.select("grounds", "code").drop_nulls()
+        .explode("grounds").drop_nulls().unnest("grounds")
+        .sort("code", maintain_order=True)
+        .with_columns(
+            pl.col("groundLangs").list.eval(
+                pl.element().filter(pl.element().struct.field("locale") == "en")
+                .struct.field("text")
+            ).list.first().str.to_lowercase().alias("type"))
+    )
+
+    percentage_df = grounds.select("code", "percentage", "color", "type")
+
+    surface_types = []
+    for row in grounds.select("type", "groundLangs").unique(
+            "type", keep="first", maintain_order=True).iter_rows():
+        _stype, langs = row
+        surface_types.append({"type": _stype,
+                              **{f"text_{lang['locale']}": lang["text"] for lang in langs}})
+    surfaces_df = pd.DataFrame(surface_types)
+
+    section_df = (
+        grounds.select("code", "color", "type", "sections")
+        .explode("sections").unnest("sections")
+        .select("code", "section", "start", "finish", "color", "type")
+        .unique(maintain_order=True)
+        .sort(["code", "section"], maintain_order=True)
+    )
+
+    return (_to_pandas(stage_table), _to_pandas(sector_table), _to_pandas(percentage_df),
+            _to_pandas(section_df), surfaces_df)
+
+
+def scores_frame(content: Optional[bytes] = None,
+                 records: Optional[List[dict]] = None) -> "pl.DataFrame":
+    """
+    Read a lastScore payload, from its raw content if available, or else its decoded records.
+
+    The frame is shared by long_results_cg() and long_results_ce().
+    """
+    _require_polars()
+    if content is not None:
+        return _read(content)
+    return pl.from_dicts(records, infer_schema_length=None)
+
+
+def _results_frame(scores: "pl.DataFrame", prefixes: Tuple[str, ...]) -> "pl.DataFrame":
+    """Frame of the _id, team.bib and flattened result columns of a lastScore frame."""
+    results = [col for col in scores.columns if col.startswith(prefixes)]
+    df = scores.select(pl.col("_id"), pl.col("team").struct.field("bib").alias("team.bib"),
+                       *results)
+    df = _unnest_all(df, results)
+    return df.filter(pl.col("_id").is_not_null() & pl.col("team.bib").is_not_null())
+
+
+def _column_order(df: "pl.DataFrame", columns: List[str]) -> List[str]:
+    """
+    Order flattened result columns as pd.json_normalize() does, by first appearance.
+
+    Polars merges fields first seen in later records into each struct, so columns
+    are ordered by the first row they hold a value in, then by their frame order.
+    """
+    if df.is_empty():
+        return columns
+    first = df.select(pl.col(columns).is_not_null().arg_max()).row(0)
+    return [col for _, _, col in sorted(zip(first, range(len(columns)), columns))]
+
+
+def _long_pairs(df: "pl.DataFrame", columns: dict) -> "pl.DataFrame":
+    """
+    Unpivot (value_0, value_1) pair columns to long rows, in column-major order as melt() does.
+
+    Args:
+        df: Frame of _id, team.bib and the flattened result columns
+        columns: Expression giving a list of two floats, by column name
+    """
+    wide = df.select("_id", "team.bib", *[expr.alias(col) for col, expr in columns.items()])
+    long_df = wide.unpivot(index=["_id", "team.bib"], variable_name="variable",
+                           value_name="value").drop_nulls("value")
+    parts = pl.col("variable").str.split(".")
+    return long_df.with_columns(
+        parts.list.first().alias("type"),
+        pl.col("variable").str.extract(r"\.([^\.]+)\.").alias("waypoint"),
+        parts.list.last().alias("metric"),
+        pl.col("value").list.get(0, null_on_oob=True).alias("value_0"),
+        pl.col("value").list.get(1, null_on_oob=True).alias("value_1"),
+    ).drop_nulls("value_0")
+
+
+def _paired(col: str) -> "pl.Expr":
+    return pl.col(col).cast(pl.List(pl.Float64))
+
+
+def _doubled(col: str) -> "pl.Expr":
+    return pl.concat_list([pl.col(col).cast(pl.Float64)] * 2)
+
+
+def _seconds(scaled: "pl.Expr") -> list:
+    """Value expressions with times in milliseconds converted to whole seconds."""
+    return [pl.when(scaled).then(pl.col(c) / 1000).otherwise(pl.col(c)).cast(pl.Int64).alias(c)
+            for c in ("value_0", "value_1")]
+
+
+def long_results_cg(scores: "pl.DataFrame", year: int, category: str, stage: int) -> pd.DataFrame:
+    """Build the long_results_cg table from a lastScore frame (see scores_frame())."""
+    df = _results_frame(scores, ("cg", "cs"))
+    results = [col for col in df.columns if col.startswith(("cg", "cs"))]
+    columns = {col: _paired(col) for col in _column_order(df, results)
+               if CG_METRICS.search(col)}
+    if not columns:
+        return pd.DataFrame(columns=CG_COLUMNS)
+
+    long_df = _long_pairs(df, columns).with_columns(
+        _seconds(pl.col("metric").is_in(["absolute", "relative"]))
+    ).with_columns(
+        pl.lit(year, pl.Int64).alias("year"),
+        pl.lit(category).alias("category"),
+        pl.lit(stage, pl.Int64).alias("stage"),
+    )
+    return _to_pandas(long_df.select(CG_COLUMNS))
+
+
+def long_results_ce(scores: "pl.DataFrame", year: int, category: str, stage: int) -> pd.DataFrame:
+    """Build the long_results_ce table from a lastScore frame (see scores_frame())."""
+    df = _results_frame(scores, ("ce", "dss"))
+    order = _column_order(df, [col for col in df.columns if col.startswith(("ce", "dss"))])
+    # The ce bonus and the dss values are scalars, used for both pair members
+    columns = {col: _doubled(col) if col == "ce.bonus" else _paired(col)
+               for col in order if col.startswith("ce") and CE_METRICS.search(col)}
+    columns.update({col: _doubled(col) for col in order
+                    if col.startswith("dss") and DSS_METRICS.search(col)})
+    if not columns:
+        return pd.DataFrame(columns=CE_COLUMNS)
+
+    scaled = (((pl.col("type") == "ce") & pl.col("metric").is_in(["absolute", "relative"]))
+              | ((pl.col("type") == "dss") & (pl.col("metric") == "absolute")))
+    long_df = _long_pairs(df, columns).with_columns(_seconds(scaled)).with_columns(
+        pl.lit(str(year)).alias("year"),
+        pl.lit(category).alias("category"),
+        pl.lit(str(stage)).alias("stage"),
+    )
+    return _to_pandas(long_df.select(CE_COLUMNS))
@@ -0,0 +1,87 @@
+import threading
+from typing import Any, Dict, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+from jupyterlite_simple_cors_proxy.cacheproxy import CorsProxy, create_cached_proxy
+
+
+def _hashable(value: Any) -> Any:
+    """Convert a cache setting value into a hashable, order-independent form."""
+    if isinstance(value, dict):
+        return tuple(sorted((k, _hashable(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple, set, frozenset)):
+        items = [_hashable(v) for v in value]
+        return tuple(sorted(items, key=repr) if isinstance(value, (set, frozenset)) else items)
+    try:
+        hash(value)
+        return value
+    except TypeError:
+        return repr(value)
+
+
+class ProxyRegistry:
+    """
+    Memoise CORS proxies, and their pooled HTTP sessions, by cache configuration.
+
+    Every distinct (use_cache, **cache_kwargs) configuration maps to a single
+    proxy whose session keeps connections alive across calls, rather than
+    a fresh proxy, session and cache backend being created per request.
+    """
+
+    def __init__(self, pool_maxsize: int = 10):
+        """
+        Args:
+            pool_maxsize: Maximum number of pooled connections per host
+        """
+        self.pool_maxsize = pool_maxsize
+        self._proxies: Dict[Tuple, CorsProxy] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def cache_key(use_cache: bool = False, **cache_kwargs) -> Tuple:
+        """Normalise a cache configuration to a registry key."""
+        if not use_cache:
+            # Cache settings are irrelevant without a cache, but the
+            # proxy selection options still distinguish proxies
+            cache_kwargs = {k: v for k, v in cache_kwargs.items()
+                            if k in ("proxy", "api_key")}
+        return bool(use_cache), _hashable(cache_kwargs)
+
+    def _create(self, use_cache: bool, **cache_kwargs) -> CorsProxy:
+        """Create a proxy whose session uses a pooled connection adapter."""
+        if use_cache:
+            proxy = create_cached_proxy(**cache_kwargs)
+        else:
+            proxy = CorsProxy(**cache_kwargs)
+            # The uncached proxy otherwise uses the bare requests module,
+            # which opens a new connection for every request
+            proxy.session = requests.Session()
+
+        adapter = HTTPAdapter(pool_connections=self.pool_maxsize,
+                              pool_maxsize=self.pool_maxsize)
+        proxy.session.mount("http://", adapter)
+        proxy.session.mount("https://", adapter)
+        return proxy
+
+    def get(self, use_cache: bool = False, **cache_kwargs) -> CorsProxy:
+        """Get the shared proxy for a cache configuration, creating it if required."""
+        key = self.cache_key(use_cache, **cache_kwargs)
+        with self._lock:
+            proxy = self._proxies.get(key)
+            if proxy is None:
+                # CorsProxy pops proxy options from the kwargs, so pass a copy
+                proxy = self._create(use_cache, **dict(cache_kwargs))
+                self._proxies[key] = proxy
+            return proxy
+
+    def close(self) -> None:
+        """Close all pooled sessions (and cache backends) and empty the registry."""
+        with self._lock:
+            proxies = list(self._proxies.values())
+            self._proxies.clear()
+        for proxy in proxies:
+            proxy.session.close()
+
+    def __len__(self) -> int:
+        return len(self._proxies)
@@ -0,0 +1,103 @@
+import random
+import threading
+import time
+from collections import Counter, defaultdict
+from typing import Dict, Iterable, Optional
+
+import pandas as pd
+import requests
+
+
+class RetryPolicy:
+    """Retry failed requests with exponential backoff and jitter."""
+
+    def __init__(self, max_retries: int = 3, backoff: float = 0.5,
+                 max_backoff: float = 30.0, jitter: float = 0.5,
+                 retry_statuses: Iterable[int] = (429, 500, 502, 503, 504)):
+        """
+        Args:
+            max_retries: Maximum number of retries after the first attempt
+            backoff: Delay (seconds) before the first retry; doubled for each retry after
+            max_backoff: Longest delay (seconds) between retries
+            jitter: Fraction of each delay that is randomised, to spread out retries
+            retry_statuses: HTTP status codes that are retried
+        """
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.retry_statuses = frozenset(retry_statuses)
+
+    def delay(self, attempt: int, response: Optional[requests.Response] = None) -> float:
+        """Delay (seconds) before retrying a failed attempt (counted from 0)."""
+        delay = min(self.max_backoff, self.backoff * 2 ** attempt)
+        delay *= 1 - self.jitter * random.random()
+
+        # Respect any Retry-After (in seconds) sent with a throttled response
+        retry_after = response.headers.get("Retry-After") if response is not None else None
+        if retry_after is not None and retry_after.isdigit():
+            delay = max(delay, min(self.max_backoff, float(retry_after)))
+        return delay
+
+
+class TokenBucket:
+    """Token bucket rate limiter, safe to share between threads and clients."""
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        """
+        Args:
+            rate: Sustained number of requests allowed per second
+            capacity: Maximum burst of requests (default: one second's worth)
+        """
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """Take a token, waiting for one if necessary; returns the time (seconds) waited."""
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity,
+                                   self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return waited
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+            waited += wait
+
+
+class ClientMetrics:
+    """Thread-safe request counters by endpoint template."""
+
+    def __init__(self):
+        self._counters: Dict[str, Counter] = defaultdict(Counter)
+        self._lock = threading.Lock()
+
+    def record(self, endpoint: str, event: str, value: float = 1) -> None:
+        """Add to a counter (e.g. requests, retries, throttled, failures) for an endpoint."""
+        with self._lock:
+            self._counters[endpoint][event] += value
+
+    def get(self, endpoint: str, event: str) -> float:
+        """Get the current value of a counter."""
+        with self._lock:
+            return self._counters[endpoint][event]
+
+    def reset(self) -> None:
+        """Clear all counters."""
+        with self._lock:
+            self._counters.clear()
+
+    def to_frame(self) -> pd.DataFrame:
+        """Counters as a DataFrame, one row per endpoint template."""
+        with self._lock:
+            counters = {endpoint: dict(c) for endpoint, c in self._counters.items()}
+        df = pd.DataFrame.from_dict(counters, orient="index").fillna(0)
+        df.index.name = "endpoint"
+        return df.sort_index()
@@ -0,0 +1,112 @@
+import threading
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterator, List, Tuple, Union
+
+import pandas as pd
+
+
+def once(func: Callable[[], Any]) -> Callable[[], Any]:
+    """Memoise a step shared by several table builders, so it runs at most once."""
+    return lru_cache(maxsize=None)(func)
+
+
+class LazyFrames:
+    """
+    Named tables of a single payload, each computed only on first access.
+
+    Tables are available as attributes, by name or position with [], and
+    by iteration in NAMES order, so a result still unpacks like the tuple
+    of frames getters used to return:
+
+        stages_df, sectors_df, *_ = client.get_stages()
+        teams_df = client.get_scores().teams
+
+    Pickling materialises every table, so results can be persisted, but
+    PayloadStore only holds them in memory to keep them lazy.
+    """
+
+    NAMES: Tuple[str, ...] = ()
+
+    def __init__(self, builders: Dict[str, Callable[[], pd.DataFrame]]):
+        """
+        Args:
+            builders: Zero argument callable building each table, by name
+        """
+        self._builders = builders
+        self._frames: Dict[str, pd.DataFrame] = {}
+        self._lock = threading.RLock()
+
+    def _get(self, name: str) -> pd.DataFrame:
+        """Get a table by name, building it if it has not been built yet."""
+        with self._lock:
+            if name not in self._frames:
+                self._frames[name] = self._builders[name]()
+            return self._frames[name]
+
+    def __getattr__(self, name: str) -> pd.DataFrame:
+        if name.startswith("_") or name not in type(self).NAMES:
+            raise AttributeError(f"{type(self).__name__} has no table {name!r}")
+        return self._get(name)
+
+    def __getitem__(self, item: Union[int, slice, str]) -> Union[pd.DataFrame, Tuple[pd.DataFrame, ...]]:
+        if isinstance(item, str):
+            if item not in self.NAMES:
+                raise KeyError(item)
+            return self._get(item)
+        if isinstance(item, slice):
+            return tuple(self._get(name) for name in self.NAMES[item])
+        return self._get(self.NAMES[item])
+
+    def __iter__(self) -> Iterator[pd.DataFrame]:
+        for name in self.NAMES:
+            yield self._get(name)
+
+    def __len__(self) -> int:
+        return len(self.NAMES)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(materialised={self.materialised()})"
+
+    def __getstate__(self) -> dict:
+        return {"frames": {name: self._get(name) for name in self.NAMES}}
+
+    def __setstate__(self, state: dict) -> None:
+        self._builders = {}
+        self._frames = state["frames"]
+        self._lock = threading.RLock()
+
+    def materialised(self) -> List[str]:
+        """Names of the tables built so far."""
+        return [name for name in self.NAMES if name in self._frames]
+
+    def copy(self) -> "LazyFrames":
+        """
+        Get a result whose tables are copies of this result's tables.
+
+        Tables are still only built, here, on first access through either result.
+        """
+        return type(self)({name: (lambda name=name: self._get(name).copy())
+                           for name in self.NAMES})
+
+    def map(self, funcs: Dict[str, Callable[[pd.DataFrame], pd.DataFrame]]) -> "LazyFrames":
+        """
+        Get a result with functions applied to some of its tables, still lazily.
+
+        Args:
+            funcs: Function to apply to each named table
+        """
+        return type(self)({name: (lambda name=name: funcs[name](self._get(name))
+                                  if name in funcs else self._get(name))
+                           for name in self.NAMES})
+
+
+class StagesResult(LazyFrames):
+    """Tables of a stages payload."""
+
+    NAMES = ("stages", "sectors", "stage_surfaces", "section_surfaces", "surfaces")
+
+
+class ScoresResult(LazyFrames):
+    """Tables of a lastScore payload."""
+
+    NAMES = ("long_results_cg", "long_results_ce", "teams", "competitors")
@@ -0,0 +1,48 @@
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Hashable, Tuple
+
+
+class SingleFlight:
+    """
+    Coalesce concurrent calls that share a key into a single in-flight call.
+
+    The first caller for a key runs the call; callers arriving with the same key
+    while it is in flight wait for it and receive the same result (or exception).
+    Nothing is cached once the call completes.
+    """
+
+    def __init__(self):
+        self._calls: Dict[Hashable, Future] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: Hashable, func: Callable[[], Any]) -> Tuple[Any, bool]:
+        """
+        Run func, or wait for an in-flight call with the same key.
+
+        Returns:
+            Tuple of (result, shared): shared is True if the result
+            came from another caller's in-flight call
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = Future()
+                self._calls[key] = call
+
+        if not leader:
+            return call.result(), True
+
+        try:
+            call.set_result(func())
+        except BaseException as e:
+            call.set_exception(e)
+        finally:
+            with self._lock:
+                del self._calls[key]
+
+        return call.result(), False
+
+    def __len__(self) -> int:
+        return len(self._calls)
@@ -0,0 +1,257 @@
+import json
+import os
+import threading
+from itertools import product
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+import pandas as pd
+
+try:
+    import pyarrow as pa
+except ImportError:
+    pa = None
+
+from .results import LazyFrames, ScoresResult, StagesResult
+
+RESULT_TYPES = {"StagesResult": StagesResult, "ScoresResult": ScoresResult}
+
+
+def _require_pyarrow() -> None:
+    if pa is None:
+        raise ImportError("Snapshots need pyarrow installed")
+
+
+def _entry_name(parser: str, path: str) -> str:
+    return f"{parser}/{path}"
+
+
+def _copy_on_write() -> bool:
+    """Whether pandas copy-on-write is on: always from pandas 3, an option before."""
+    if int(pd.__version__.split(".")[0]) >= 3:
+        return True
+    return pd.options.mode.copy_on_write is True
+
+
+class Snapshot:
+    """
+    Parsed getter results saved as memory-mappable Arrow IPC (Feather v2) files.
+
+    A snapshot directory holds a manifest.json, listing each result by parser
+    and API path, and one uncompressed Arrow IPC file per table. Each result
+    records the settings it was parsed with (parser version, wide_labels and
+    backend); a client with other settings treats it as missing. Tables are
+    memory mapped when first used, so loading a snapshot reads no data up
+    front, numeric columns are not copied, and worker processes serving the
+    same snapshot share the mapped pages through the OS page cache.
+
+    Under pandas copy-on-write (always on from pandas 3) frames are handed out
+    as shallow copies, which callers can modify freely without copying or
+    touching the snapshot. Without it, frames are handed out as deep copies,
+    as the mapped buffers are read-only.
+
+    Use save_snapshot() to write a snapshot, and DakarAPIClient.from_snapshot()
+    to serve the getters from one.
+    """
+
+    MANIFEST = "manifest.json"
+    VERSION = 2
+
+    def __init__(self, path: str, arrow_dtypes: bool = False):
+        """
+        Args:
+            path: Snapshot directory
+            arrow_dtypes: Return Arrow-backed (pd.ArrowDtype) columns, so that no
+                column is copied out of the mapped files; by default columns are
+                converted to the dtypes the getters return
+        """
+        _require_pyarrow()
+        self.path = path
+        self.arrow_dtypes = arrow_dtypes
+        with open(os.path.join(path, self.MANIFEST)) as f:
+            manifest = json.load(f)
+        self.year: Optional[int] = manifest.get("year")
+        self.entries: Dict[str, dict] = manifest["entries"]
+        self._tables: Dict[str, pd.DataFrame] = {}
+        self._crews: Dict[str, List[dict]] = {}
+        self._lock = threading.Lock()
+
+    def holds(self, parser: str, path: str, settings: Dict[str, Any]) -> bool:
+        """Whether the snapshot holds a parser's result for an API path, parsed with the given settings."""
+        entry = self.entries.get(_entry_name(parser, path))
+        return entry is not None and entry.get("settings") == settings
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def _table(self, file: str) -> pd.DataFrame:
+        """Memory map a table file, once, and convert it to a frame."""
+        with self._lock:
+            if file not in self._tables:
+                source = pa.memory_map(os.path.join(self.path, file), "r")
+                table = pa.ipc.open_file(source).read_all()
+                df = table.to_pandas(split_blocks=True,
+                                     types_mapper=pd.ArrowDtype if self.arrow_dtypes else None)
+                if not self.arrow_dtypes:
+                    # Arrow strings come back as str; restore the columns saved with object dtype
+                    meta = table.schema.pandas_metadata or {}
+                    objects = [col["name"] for col in meta.get("columns", [])
+                               if col.get("numpy_type") == "object" and col.get("name") in df.columns
+                               and df[col["name"]].dtype != object]
+                    if objects:
+                        df = df.astype({col: object for col in objects})
+                self._tables[file] = df
+            return self._tables[file].copy(deep=not _copy_on_write())
+
+    def get(self, parser: str, path: str, settings: Dict[str, Any]) -> Optional[Any]:
+        """
+        Get the result a getter's parser produced for an API path, if it is in the snapshot.
+
+        Args:
+            parser: Parser name
+            path: API path
+            settings: Settings the result must have been parsed with
+                (see DakarAPIClient._snapshot_settings())
+
+        Returns:
+            DataFrame, tuple of frames, or a LazyFrames result whose tables
+            are mapped on first access; None if the snapshot does not hold it,
+            or holds it parsed with other settings
+        """
+        if not self.holds(parser, path, settings):
+            return None
+        entry = self.entries[_entry_name(parser, path)]
+        tables = entry["tables"]
+        kind = entry["kind"]
+        if kind == "frame":
+            return self._table(tables["frame"])
+        if kind == "tuple":
+            return tuple(self._table(tables[str(i)]) for i in range(len(tables)))
+        return RESULT_TYPES[kind]({name: (lambda file=file: self._table(file))
+                                   for name, file in tables.items()})
+
+
+    def crews(self, path: str) -> Optional[List[dict]]:
+        """
+        Get the team records of a lastScore payload in the snapshot, for the entity registry.
+
+        Returns:
+            List of records holding just their team fields, or None if the
+            snapshot does not hold them
+        """
+        entry = self.entries.get(_entry_name("scores", path))
+        if entry is None or "crews" not in entry:
+            return None
+        with self._lock:
+            if path not in self._crews:
+                with open(os.path.join(self.path, entry["crews"])) as f:
+                    self._crews[path] = json.load(f)
+            return self._crews[path]
+
+
+def _write_table(df: pd.DataFrame, file: str) -> None:
+    """Write a frame as an uncompressed Arrow IPC file, which can be memory mapped."""
+    table = pa.Table.from_pandas(df, preserve_index=None)
+    with pa.OSFile(file, "wb") as sink:
+        with pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+
+
+def _write_result(root: str, parser: str, path: str, result: Any,
+                  settings: Dict[str, Any]) -> dict:
+    """Write the tables of a getter result, parsed with the given settings; returns its manifest entry."""
+    if isinstance(result, pd.DataFrame):
+        kind, frames = "frame", {"frame": result}
+    elif isinstance(result, LazyFrames):
+        kind, frames = type(result).__name__, dict(zip(result.NAMES, result))
+    else:
+        kind, frames = "tuple", {str(i): df for i, df in enumerate(result)}
+
+    directory = os.path.join(parser, path)
+    os.makedirs(os.path.join(root, directory), exist_ok=True)
+    tables = {}
+    for name, df in frames.items():
+        file = os.path.join(directory, f"{name}.arrow")
+        _write_table(df, os.path.join(root, file))
+        tables[name] = file
+    return {"parser": parser, "path": path, "kind": kind, "tables": tables, "settings": settings}
+
+
+def _write_crews(root: str, path: str, content: bytes) -> str:
+    """Write the team fields of each record of a lastScore payload; returns the file."""
+    crews = [{key: value for key, value in record.items() if key.startswith("team")}
+             for record in json.loads(content)]
+    file = os.path.join("scores", path, "crews.json")
+    with open(os.path.join(root, file), "w") as f:
+        json.dump(crews, f)
+    return file
+
+
+def save_snapshot(client, path: str, categories: Optional[Union[str, List[str]]] = None,
+                  stages: Optional[Iterable[int]] = None, year: Optional[int] = None,
+                  **getter_kwargs) -> Snapshot:
+    """
+    Save the parsed results of every getter for a year as a snapshot.
+
+    Args:
+        client: DakarAPIClient to get the results with
+        path: Snapshot directory; entries already in it are kept unless replaced
+        categories: Category or list of categories; defaults to the client category
+        stages: Stages to save waypoints and scores for; defaults to the client stage
+        year: Year; defaults to the client year
+        **getter_kwargs: Passed to each getter, e.g. use_cache
+
+    Returns:
+        The saved Snapshot
+    """
+    _require_pyarrow()
+    year = year or client.year
+    categories = categories or client.category
+    if isinstance(categories, str):
+        categories = [categories]
+    stages = list(stages) if stages is not None else [client.stage]
+
+    manifest_path = os.path.join(path, Snapshot.MANIFEST)
+    entries = {}
+    if os.path.exists(manifest_path):
+        with open(manifest_path) as f:
+            entries = json.load(f)["entries"]
+
+    def add(parser: str, api_path: str, result: Any) -> None:
+        entries[_entry_name(parser, api_path)] = _write_result(
+            path, parser, api_path, result, client._snapshot_settings(parser))
+
+    proxy = client._get_request_proxy(**_proxy_kwargs(getter_kwargs))
+    add("category", client.CATEGORY_TEMPLATE.format(year=year),
+        client.get_category(year=year, **getter_kwargs))
+    add("groups", client.GROUPS_TEMPLATE.format(year=year),
+        client.get_groups(year=year, **getter_kwargs))
+    for category in categories:
+        kwargs = dict(year=year, category=category, **getter_kwargs)
+        # As memoised per category, before get_clazz() and get_withdrawals() combine them
+        add("clazz", client.CLAZZ_TEMPLATE.format(year=year, category=category),
+            client._get_clazz_single(year, category, proxy))
+        add("withdrawals", client.WITHDRAWAL_TEMPLATE.format(year=year, category=category),
+            client._get_withdrawals_single(year, category, proxy))
+        add("stages", client.STAGE_TEMPLATE.format(year=year, category=category),
+            client.get_stages(**kwargs))
+    for category, stage in product(categories, stages):
+        kwargs = dict(year=year, category=category, stage=stage, **getter_kwargs)
+        add("waypoints", client.WAYPOINT_TEMPLATE.format(year=year, category=category, stage=stage),
+            client.get_waypoints(**kwargs))
+        score_path = client.SCORE_TEMPLATE.format(year=year, category=category, stage=stage)
+        add("scores", score_path, client.get_scores(**kwargs))
+        # The crews too, so that clients served from the snapshot can register them
+        entries[_entry_name("scores", score_path)]["crews"] = _write_crews(
+            path, score_path, client._content(score_path, proxy))
+
+    tmp = manifest_path + ".tmp"
+    with open(tmp, "w") as f:
+        json.dump({"version": Snapshot.VERSION, "year": year, "entries": entries}, f, indent=1)
+    os.replace(tmp, manifest_path)
+    return Snapshot(path)
+
+
+def _proxy_kwargs(getter_kwargs: Dict[str, Any]) -> Dict[str, Any]:
+    """Split the use_cache flag from the cache settings, as the getters take them."""
+    kwargs = dict(getter_kwargs)
+    return {"use_cache": kwargs.pop("use_cache", None), **kwargs}
@@ -0,0 +1,126 @@
+import hashlib
+import json
+import os
+import pickle
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from .results import LazyFrames
+
+
+class PayloadStore:
+    """
+    Content-addressed store of raw API payloads and the frames parsed from them.
+
+    Raw payloads are stored by the hash of their content, with a reference from
+    each API path to the hash of its latest payload. Parsed results are memoised
+    by (parser, parser version, path, payload hash), so an unchanged payload is
+    never parsed twice by the same version of a parser.
+
+    With no path, both layers are held in bounded in-memory LRU caches. With a
+    path, they are also persisted to disk so that they survive between sessions:
+
+        path/refs.json              API path -> payload hash
+        path/raw/<hash>.json        raw payload bytes
+        path/parsed/<key>.pkl       pickled parse results
+
+    Lazy results (LazyFrames) are only memoised in memory, as pickling them
+    would build every table. In a later session they are parsed again from
+    the stored raw payload, still a table at a time, on first access.
+    """
+
+    def __init__(self, path: Optional[str] = None, maxsize: int = 256):
+        """
+        Args:
+            path: Directory to persist the store in (default: memory only)
+            maxsize: Maximum number of raw payloads and parse results held in memory
+        """
+        self.path = path
+        self.maxsize = maxsize
+        self._refs: Dict[str, str] = {}
+        self._raw: "OrderedDict[str, bytes]" = OrderedDict()
+        self._parsed: "OrderedDict[Tuple, Any]" = OrderedDict()
+        self._lock = threading.RLock()
+
+        if path is not None:
+            os.makedirs(os.path.join(path, "raw"), exist_ok=True)
+            os.makedirs(os.path.join(path, "parsed"), exist_ok=True)
+            refs_path = os.path.join(path, "refs.json")
+            if os.path.exists(refs_path):
+                with open(refs_path) as f:
+                    self._refs = json.load(f)
+
+    @staticmethod
+    def digest(content: bytes) -> str:
+        """Hash raw payload content."""
+        return hashlib.sha1(content).hexdigest()
+
+    def _remember(self, cache: OrderedDict, key, value) -> None:
+        """Add an item to an in-memory LRU cache, evicting the oldest if full."""
+        cache[key] = value
+        cache.move_to_end(key)
+        while len(cache) > self.maxsize:
+            cache.popitem(last=False)
+
+    def put(self, path: str, content: bytes) -> str:
+        """Store the raw payload for an API path; returns its hash."""
+        digest = self.digest(content)
+        with self._lock:
+            self._remember(self._raw, digest, content)
+            changed = self._refs.get(path) != digest
+            self._refs[path] = digest
+
+            if self.path is not None:
+                raw_path = os.path.join(self.path, "raw", f"{digest}.json")
+                if not os.path.exists(raw_path):
+                    with open(raw_path, "wb") as f:
+                        f.write(content)
+                if changed:
+                    with open(os.path.join(self.path, "refs.json"), "w") as f:
+                        json.dump(self._refs, f)
+
+        return digest
+
+    def ref(self, path: str) -> Optional[str]:
+        """Get the hash of the latest payload stored for an API path."""
+        return self._refs.get(path)
+
+    def get(self, digest: str) -> Optional[bytes]:
+        """Get a raw payload by its hash."""
+        with self._lock:
+            content = self._raw.get(digest)
+            if content is None and self.path is not None:
+                raw_path = os.path.join(self.path, "raw", f"{digest}.json")
+                if os.path.exists(raw_path):
+                    with open(raw_path, "rb") as f:
+                        content = f.read()
+                    self._remember(self._raw, digest, content)
+            return content
+
+    @staticmethod
+    def _parsed_name(key: Tuple) -> str:
+        """File name for a parse result key."""
+        return hashlib.sha1(repr(key).encode()).hexdigest() + ".pkl"
+
+    def get_parsed(self, key: Tuple) -> Optional[Any]:
+        """Get a memoised parse result by (parser, version, path, hash) key."""
+        with self._lock:
+            result = self._parsed.get(key)
+            if result is None and self.path is not None:
+                parsed_path = os.path.join(self.path, "parsed", self._parsed_name(key))
+                if os.path.exists(parsed_path):
+                    with open(parsed_path, "rb") as f:
+                        result = pickle.load(f)
+            if result is not None:
+                self._remember(self._parsed, key, result)
+            return result
+
+    def put_parsed(self, key: Tuple, result: Any) -> None:
+        """Memoise a parse result by (parser, version, path, hash) key."""
+        with self._lock:
+            self._remember(self._parsed, key, result)
+            if self.path is not None and not isinstance(result, LazyFrames):
+                parsed_path = os.path.join(self.path, "parsed", self._parsed_name(key))
+                with open(parsed_path, "wb") as f:
+                    pickle.dump(result, f)
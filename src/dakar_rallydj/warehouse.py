@@ -0,0 +1,474 @@
+import hashlib
+import json
+import sqlite3
+import threading
+from datetime import datetime, timezone
+from itertools import product
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+import pandas as pd
+
+from .decoders import is_arrival
+
+
+class TableSpec:
+    """
+    Declared schema of a warehouse table.
+
+    Columns not declared here are added, untyped, the first time a frame
+    brings them, so the warehouse keeps every field the API returns.
+    """
+
+    def __init__(self, key: Sequence[str], partition: Sequence[str],
+                 columns: Optional[Dict[str, str]] = None,
+                 sequence: Optional[Sequence[str]] = None,
+                 prune: bool = True,
+                 indexes: Optional[Sequence[Sequence[str]]] = None,
+                 arrival: Optional[str] = None):
+        """
+        Args:
+            key: Natural primary key columns
+            partition: Columns identifying a partition, in (year, category, stage)
+                order; partitions are the unit of change detection
+            columns: Declared column types, in addition to the key columns
+            sequence: If given, a `seq` key column numbers the rows sharing
+                these columns, for rows with no natural key of their own
+            prune: Delete rows missing from a reloaded partition; tables whose
+                rows are shared across partitions (e.g. teams) are only upserted
+            indexes: Column lists to build secondary indexes on
+            arrival: Column of waypoint codes to derive an `is_arrival` flag from
+        """
+        self.key = list(key)
+        self.partition = list(partition)
+        self.columns = dict(columns or {})
+        self.sequence = list(sequence) if sequence else None
+        self.prune = prune
+        self.indexes = [list(index) for index in indexes or []]
+        self.arrival = arrival
+        if arrival is not None:
+            self.columns.setdefault("is_arrival", "INTEGER")
+
+
+INTEGER_KEYS = {"year": "INTEGER", "stage": "INTEGER", "team_bib": "INTEGER",
+                "bib": "INTEGER", "seq": "INTEGER", "checkpoint": "INTEGER"}
+
+
+def _spec(key: Sequence[str], partition: Sequence[str], **kwargs) -> TableSpec:
+    """Table spec whose key columns are typed TEXT unless they hold integers."""
+    columns = {col: INTEGER_KEYS.get(col, "TEXT") for col in key}
+    columns.update(kwargs.pop("columns", {}))
+    return TableSpec(key, partition, columns=columns, **kwargs)
+
+
+class DakarWarehouse:
+    """
+    SQLite warehouse of getter output, with a declared schema and natural keys.
+
+    Frames are loaded a partition at a time, e.g. one (year, category, stage)
+    of long results. A hash of each loaded partition is kept, so reloading an
+    unchanged partition writes nothing, and a changed partition is upserted
+    row by row, only rewriting rows whose values have actually changed. A
+    refresh after a new stage therefore costs in proportion to the change,
+    not to the season.
+
+    The tables carry composite indexes for the common long results filters,
+    and an `is_arrival` flag decoded from the waypoint code on load, in place
+    of `waypoint LIKE '%AS%'` scans. Each stage's arrival and overall
+    classification are materialised in stage_arrivals and
+    overall_classification as the stage loads, for top-N queries via top().
+
+    Usage:
+        with DakarWarehouse("dakar_results_2025.sqlite") as warehouse:
+            warehouse.refresh(client, categories=["A", "M"], stages=range(1, 13))
+            warehouse.query("SELECT * FROM long_results WHERE stage = ?", (3,))
+    """
+
+    SCHEMA: Dict[str, TableSpec] = {
+        "category": _spec(["year", "reference"], ["year"]),
+        "groups": _spec(["year", "_origin", "reference"], ["year"]),
+        "clazz": _spec(["year", "category", "reference"], ["year", "category"]),
+        "stages": _spec(["year", "category", "stage_code"], ["year", "category"],
+                        columns={"stage": "INTEGER", "length": "INTEGER"}),
+        "sectors": _spec(["year", "category", "code"], ["year", "category"],
+                         columns={"stage_code": "TEXT", "sector_number": "INTEGER"}),
+        "stage_surfaces": _spec(["year", "category", "code", "type"], ["year", "category"],
+                                columns={"percentage": "REAL"}),
+        "section_surfaces": _spec(["year", "category", "code", "type", "section"], ["year", "category"],
+                                  columns={"section": "INTEGER", "start": "REAL", "finish": "REAL"}),
+        "surfaces": _spec(["year", "category", "type"], ["year", "category"]),
+        "waypoints": _spec(["year", "category", "stage", "checkpoint"], ["year", "category", "stage"],
+                           columns={"code": "TEXT", "kilometerPoint": "REAL"}, arrival="code"),
+        "long_results": _spec(["year", "category", "stage", "team_bib", "type", "waypoint", "metric"],
+                              ["year", "category", "stage"],
+                              columns={"value_0": "INTEGER", "value_1": "INTEGER"}, arrival="waypoint",
+                              indexes=[["category", "stage", "type", "metric", "is_arrival", "value_0"],
+                                       ["team_bib"]]),
+        "long_results2": _spec(["year", "category", "stage", "team_bib", "type", "metric"],
+                               ["year", "category", "stage"],
+                               columns={"value_0": "INTEGER", "value_1": "INTEGER"},
+                               indexes=[["category", "stage", "type", "metric", "value_0"], ["team_bib"]]),
+        "results_teams": _spec(["year", "team_bib"], ["year", "category", "stage"], prune=False,
+                               indexes=[["team_bib"]]),
+        "results_competitors": _spec(["year", "team_bib", "seq"], ["year", "category", "stage"],
+                                     sequence=["team_bib"], prune=False),
+        "withdrawals": _spec(["year", "_category", "stage", "bib", "reason"], ["year", "_category"]),
+        "withdrawn_competitors": _spec(["year", "bib", "seq"], ["year"], sequence=["bib"], prune=False),
+        "withdrawn_teams": _spec(["year", "team_bib"], ["year"], prune=False),
+    }
+
+    # Tables rebuilt, a stage at a time, whenever a stage's long results or teams change:
+    # the stage (cs) and overall (cg) classification at each arrival waypoint
+    MATERIALISED = {"stage_arrivals": "cs", "overall_classification": "cg"}
+    MATERIALISE_FROM = ("long_results", "results_teams")
+    MATERIALISED_COLUMNS = ("year INTEGER, category TEXT, stage INTEGER, team_bib INTEGER, "
+                            "waypoint TEXT, clazz TEXT, position INTEGER, time INTEGER, gap INTEGER, "
+                            "PRIMARY KEY (year, category, stage, team_bib, waypoint)")
+    # Team columns that hold a crew's class, in order of preference
+    CLAZZ_COLUMNS = ("tinyLabel", "team_clazz")
+
+    # Mixed into partition hashes, so a schema change reloads every partition
+    SCHEMA_VERSION = 2
+
+    def __init__(self, path: str = ":memory:"):
+        """
+        Args:
+            path: SQLite database path
+        """
+        self.path = path
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.RLock()
+        self._columns: Dict[str, List[str]] = {}
+        with self.conn:
+            self.conn.execute(
+                "CREATE TABLE IF NOT EXISTS _partitions ("
+                "tbl TEXT NOT NULL, partition TEXT NOT NULL, digest TEXT NOT NULL, "
+                "rows INTEGER, loaded_at TEXT, PRIMARY KEY (tbl, partition))")
+            for table in self.SCHEMA:
+                self._ensure_table(table, [])
+            for table in self.MATERIALISED:
+                self.conn.execute(f"CREATE TABLE IF NOT EXISTS {table} ({self.MATERIALISED_COLUMNS})")
+                self.conn.execute(f"CREATE INDEX IF NOT EXISTS ix_{table}_position "
+                                  f"ON {table} (year, category, stage, position)")
+                self.conn.execute(f"CREATE INDEX IF NOT EXISTS ix_{table}_clazz_position "
+                                  f"ON {table} (year, category, stage, clazz, position)")
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    @staticmethod
+    def _quote(name: str) -> str:
+        return '"' + name.replace('"', '""') + '"'
+
+    def _ensure_table(self, table: str, columns: Iterable[str]) -> None:
+        """Create a table from its spec if need be, and add any new columns."""
+        spec = self.SCHEMA[table]
+        if table not in self._columns:
+            declared = ", ".join(f"{self._quote(col)} {typ}" for col, typ in spec.columns.items())
+            key = ", ".join(self._quote(col) for col in spec.key)
+            self.conn.execute(f"CREATE TABLE IF NOT EXISTS {self._quote(table)} "
+                              f"({declared}, PRIMARY KEY ({key}))")
+            self._columns[table] = [row[1] for row in
+                                    self.conn.execute(f"PRAGMA table_info({self._quote(table)})")]
+        for col in columns:
+            if col not in self._columns[table]:
+                typ = spec.columns.get(col, "")
+                self.conn.execute(f"ALTER TABLE {self._quote(table)} ADD COLUMN {self._quote(col)} {typ}")
+                self._columns[table].append(col)
+        # Indexes are built once all their columns exist, e.g. is_arrival in an older warehouse
+        for index in spec.indexes:
+            if all(col in self._columns[table] for col in index):
+                self.conn.execute(
+                    f"CREATE INDEX IF NOT EXISTS {self._quote('ix_' + table + '_' + '_'.join(index))} "
+                    f"ON {self._quote(table)} ({', '.join(self._quote(col) for col in index)})")
+
+    @staticmethod
+    def _sql_value(value: Any) -> Any:
+        """Convert a cell to a value sqlite3 can bind."""
+        if value is None or isinstance(value, (str, int, float, bytes)):
+            return value
+        if isinstance(value, (list, dict)):
+            return json.dumps(value, default=str)
+        if isinstance(value, (pd.Timestamp, datetime)):
+            return value.isoformat()
+        if pd.api.types.is_scalar(value) and pd.isna(value):
+            return None
+        if hasattr(value, "item"):
+            return value.item()
+        return str(value)
+
+    def _prepare(self, table: str, df: pd.DataFrame, values: Dict[str, Any]) -> pd.DataFrame:
+        """Rename columns as the tables do, and add the partition and sequence columns."""
+        spec = self.SCHEMA[table]
+        if any(name is not None for name in df.index.names):
+            df = df.reset_index()
+        df = df.rename(columns=lambda col: str(col).replace(".", "_"))
+        df = df.loc[:, ~df.columns.duplicated()].copy()
+        for col, value in values.items():
+            if col in spec.key and col not in df.columns:
+                df[col] = value
+        if spec.arrival is not None and spec.arrival in df.columns:
+            df["is_arrival"] = is_arrival(df[spec.arrival])
+        if spec.sequence:
+            df["seq"] = df.groupby(spec.sequence, dropna=False).cumcount()
+        # Integer key columns, which some frames hold as strings
+        for col in spec.key:
+            if spec.columns.get(col) == "INTEGER" and col in df.columns \
+                    and not pd.api.types.is_numeric_dtype(df[col]):
+                try:
+                    df[col] = pd.to_numeric(df[col])
+                except (TypeError, ValueError):
+                    pass
+        return df.drop_duplicates(subset=spec.key, keep="last")
+
+    def _rows(self, df: pd.DataFrame) -> List[tuple]:
+        """Rows of a frame as tuples of bindable values."""
+        columns = []
+        for col in df.columns:
+            values = df[col].astype(object)
+            columns.append([self._sql_value(v) for v in values.tolist()])
+        return list(zip(*columns))
+
+    @staticmethod
+    def _partition_label(values: Sequence[Any]) -> str:
+        return "/".join("" if v is None else str(v) for v in values)
+
+    def _load_partition(self, table: str, df: pd.DataFrame, partition: Tuple) -> int:
+        """Upsert one partition of a table; returns the number of rows written or deleted."""
+        spec = self.SCHEMA[table]
+        columns = list(df.columns)
+        rows = self._rows(df)
+        label = self._partition_label(partition)
+        digest = hashlib.sha1(repr((self.SCHEMA_VERSION, columns, rows)).encode()).hexdigest()
+
+        with self._lock:
+            previous = self.conn.execute(
+                "SELECT digest FROM _partitions WHERE tbl = ? AND partition = ?",
+                (table, label)).fetchone()
+            if previous is not None and previous[0] == digest:
+                return 0
+
+            with self.conn:
+                self._ensure_table(table, columns)
+                quoted = [self._quote(col) for col in columns]
+                values = [col for col in columns if col not in spec.key]
+                update = ", ".join(f"{self._quote(col)} = excluded.{self._quote(col)}" for col in values)
+                changed = " OR ".join(f"{self._quote(table)}.{self._quote(col)} IS NOT excluded.{self._quote(col)}"
+                                      for col in values)
+                sql = (f"INSERT INTO {self._quote(table)} ({', '.join(quoted)}) "
+                       f"VALUES ({', '.join('?' * len(columns))}) "
+                       f"ON CONFLICT ({', '.join(self._quote(col) for col in spec.key)}) ")
+                sql += f"DO UPDATE SET {update} WHERE {changed}" if values else "DO NOTHING"
+                changes = self.conn.total_changes
+                self.conn.executemany(sql, rows)
+                written = self.conn.total_changes - changes
+
+                if spec.prune:
+                    written += self._prune(table, df, partition)
+
+                self.conn.execute(
+                    "INSERT OR REPLACE INTO _partitions VALUES (?, ?, ?, ?, ?)",
+                    (table, label, digest, len(rows), datetime.now(timezone.utc).isoformat()))
+            return written
+
+    def _prune(self, table: str, df: pd.DataFrame, partition: Tuple) -> int:
+        """Delete rows of a partition whose keys are not in a reloaded frame; returns the rows deleted."""
+        spec = self.SCHEMA[table]
+        key = [self._quote(col) for col in spec.key]
+        self.conn.execute("DROP TABLE IF EXISTS temp._keys")
+        self.conn.execute(f"CREATE TEMP TABLE _keys ({', '.join(key)})")
+        self.conn.executemany(f"INSERT INTO temp._keys VALUES ({', '.join('?' * len(key))})",
+                              self._rows(df[spec.key]))
+        where = " AND ".join(f"{self._quote(col)} IS ?" for col in spec.partition)
+        deleted = self.conn.execute(
+            f"DELETE FROM {self._quote(table)} WHERE {where} AND "
+            f"({', '.join(key)}) NOT IN (SELECT {', '.join(key)} FROM temp._keys)",
+            [self._sql_value(v) for v in partition]).rowcount
+        self.conn.execute("DROP TABLE temp._keys")
+        return deleted
+
+    def load(self, table: str, df: pd.DataFrame, year: Optional[int] = None,
+             category: Optional[str] = None, stage: Optional[int] = None) -> int:
+        """
+        Upsert a getter frame into a warehouse table, a partition at a time.
+
+        Partition values not given as arguments are taken from the frame's own
+        columns, so e.g. a multi-stage waypoints frame is loaded stage by stage.
+
+        Args:
+            table: Table name (see SCHEMA)
+            df: Frame as returned by a getter
+            year: Year of the frame's rows, if not in the frame
+            category: Category of the frame's rows, if not in the frame
+            stage: Stage of the frame's rows, if not in the frame
+
+        Returns:
+            Number of rows inserted, updated or deleted
+        """
+        if table not in self.SCHEMA:
+            raise ValueError(f"Unknown table {table!r}; expected one of {list(self.SCHEMA)}")
+        spec = self.SCHEMA[table]
+        given = dict(zip(["year", "category", "stage"], [year, category, stage]))
+        values = {}
+        for col, arg in zip(spec.partition, ["year", "category", "stage"]):
+            if given[arg] is not None:
+                values[col] = given[arg]
+        df = self._prepare(table, df, values)
+        if df.empty:
+            return 0
+
+        missing = [col for col in spec.partition if col not in values]
+        for col in missing:
+            if col not in df.columns:
+                raise ValueError(f"{table} rows need a {col} value")
+        if not missing:
+            parts = [(tuple(values[col] for col in spec.partition), df)]
+        else:
+            parts = []
+            for group, part in df.groupby(missing, sort=False, dropna=False):
+                group = group if isinstance(group, tuple) else (group,)
+                known = {**values, **dict(zip(missing, group))}
+                parts.append((tuple(known[col] for col in spec.partition), part))
+
+        written = 0
+        for partition, part in parts:
+            count = self._load_partition(table, part, partition)
+            if count and table in self.MATERIALISE_FROM:
+                self.materialise(*partition)
+            written += count
+        return written
+
+    def materialise(self, year: int, category: str, stage: int) -> None:
+        """
+        Rebuild the stage_arrivals and overall_classification rows of a stage.
+
+        Each row holds a crew's position, time and gap (value_0 of the
+        position, absolute and relative metrics) at an arrival waypoint, along
+        with their class from results_teams, if known.
+        """
+        clazz = next((f"t.{self._quote(col)}" for col in self.CLAZZ_COLUMNS
+                      if col in self._columns["results_teams"]), "NULL")
+        with self._lock, self.conn:
+            for table, result_type in self.MATERIALISED.items():
+                self.conn.execute(f"DELETE FROM {table} WHERE year = ? AND category = ? AND stage = ?",
+                                  (year, category, stage))
+                self.conn.execute(
+                    f"INSERT INTO {table} "
+                    f"SELECT l.year, l.category, l.stage, l.team_bib, l.waypoint, {clazz}, "
+                    "MAX(CASE WHEN l.metric = 'position' THEN l.value_0 END), "
+                    "MAX(CASE WHEN l.metric = 'absolute' THEN l.value_0 END), "
+                    "MAX(CASE WHEN l.metric = 'relative' THEN l.value_0 END) "
+                    "FROM long_results l LEFT JOIN results_teams t "
+                    "ON t.year = l.year AND t.team_bib = l.team_bib "
+                    "WHERE l.year = ? AND l.category = ? AND l.stage = ? "
+                    "AND l.type = ? AND l.is_arrival = 1 "
+                    "GROUP BY l.team_bib, l.waypoint",
+                    (year, category, stage, result_type))
+
+    def top(self, year: int, category: str, stage: int, n: int = 10,
+            clazz: Optional[str] = None, overall: bool = False) -> pd.DataFrame:
+        """
+        Get the top crews at the arrival of a stage, from the materialised tables.
+
+        Args:
+            year: Year
+            category: Category
+            stage: Stage
+            n: Number of crews
+            clazz: Only include crews of this class
+            overall: Rank by overall classification rather than stage result
+        """
+        table = "overall_classification" if overall else "stage_arrivals"
+        sql = f"SELECT * FROM {table} WHERE year = ? AND category = ? AND stage = ?"
+        params: List[Any] = [year, category, stage]
+        if clazz is not None:
+            sql += " AND clazz = ?"
+            params.append(clazz)
+        # Crews without a position at the arrival, e.g. yet to finish, come last
+        return self.query(sql + " ORDER BY position IS NULL, position LIMIT ?", params + [n])
+
+    def load_scores(self, result, year: int, category: str, stage: int) -> Dict[str, int]:
+        """Load the tables of a get_scores() result; returns rows written by table."""
+        long_results_cg, long_results_ce, teams, competitors = result
+        return {
+            "long_results": self.load("long_results", long_results_cg, year, category, stage),
+            "long_results2": self.load("long_results2", long_results_ce, year, category, stage),
+            "results_teams": self.load("results_teams", teams, year, category, stage),
+            "results_competitors": self.load("results_competitors", competitors, year, category, stage),
+        }
+
+    def load_stages(self, result, year: int, category: str) -> Dict[str, int]:
+        """Load the tables of a get_stages() result; returns rows written by table."""
+        return {table: self.load(table, df, year, category)
+                for table, df in zip(["stages", "sectors", "stage_surfaces",
+                                      "section_surfaces", "surfaces"], result)}
+
+    def load_withdrawals(self, frames: Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame],
+                         year: int) -> Dict[str, int]:
+        """Load the frames of a get_withdrawals() result; returns rows written by table."""
+        return {table: self.load(table, df, year)
+                for table, df in zip(["withdrawals", "withdrawn_competitors", "withdrawn_teams"], frames)}
+
+    def refresh(self, client, categories: Optional[Union[str, List[str]]] = None,
+                stages: Optional[Iterable[int]] = None, year: Optional[int] = None,
+                **getter_kwargs) -> Dict[str, int]:
+        """
+        Fetch a season's getter output and load it, writing only what has changed.
+
+        Args:
+            client: DakarAPIClient to get the frames with
+            categories: Category or list of categories; defaults to the client category
+            stages: Stages to load scores and waypoints for; defaults to the client stage
+            year: Year; defaults to the client year
+            **getter_kwargs: Passed to each getter, e.g. use_cache
+
+        Returns:
+            Number of rows written, by table
+        """
+        year = year or client.year
+        categories = categories or client.category
+        if isinstance(categories, str):
+            categories = [categories]
+        stages = list(stages) if stages is not None else [client.stage]
+
+        written: Dict[str, int] = {}
+
+        def add(counts: Dict[str, int]) -> None:
+            for table, count in counts.items():
+                written[table] = written.get(table, 0) + count
+
+        add({"category": self.load("category", client.get_category(year=year, **getter_kwargs), year),
+             "groups": self.load("groups", client.get_groups(year=year, **getter_kwargs), year),
+             "clazz": self.load("clazz", client.get_clazz(year=year, category=categories,
+                                                          **getter_kwargs), year)})
+        add(self.load_withdrawals(client.get_withdrawals(year=year, category=categories,
+                                                         **getter_kwargs), year))
+        for category in categories:
+            add(self.load_stages(client.get_stages(year=year, category=category, **getter_kwargs),
+                                 year, category))
+        add({"waypoints": self.load("waypoints", client.get_waypoints_bulk(
+            categories, stages, year=year, **getter_kwargs), year)})
+        for category, stage in product(categories, stages):
+            add(self.load_scores(client.get_scores(year=year, category=category, stage=stage,
+                                                   **getter_kwargs), year, category, stage))
+        return written
+
+    def query(self, sql: str, params: Sequence[Any] = ()) -> pd.DataFrame:
+        """Run a query against the warehouse and return the result as a frame."""
+        with self._lock:
+            return pd.read_sql_query(sql, self.conn, params=params)
+
+    def partitions(self, table: Optional[str] = None) -> pd.DataFrame:
+        """Get the loaded partitions, with their hash, row count and load time."""
+        sql = "SELECT * FROM _partitions"
+        params: Tuple = ()
+        if table is not None:
+            sql += " WHERE tbl = ?"
+            params = (table,)
+        return self.query(sql + " ORDER BY tbl, partition", params)
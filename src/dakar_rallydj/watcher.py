@@ -0,0 +1,163 @@
+import asyncio
+import time
+from typing import Dict, Iterator, AsyncIterator, List, Optional, Tuple, Union
+
+import pandas as pd
+
+from .decoders import long_results_ce_from_records, long_results_cg_from_records
+
+
+class ScoreWatcher:
+    """
+    Poll lastScore endpoints for one stage, emitting only new or changed result rows.
+
+    Each poll uses conditional requests, so a quiet endpoint costs a header
+    exchange. When a payload has changed, its long results rows are compared
+    against the previously seen values; records can change without their
+    `_updatedAt` moving, so every record is decoded. The polling interval
+    backs off while nothing changes and tightens again as soon as something does.
+
+    A category that fails to poll, e.g. a request that still fails after the
+    client's retries, does not end the watch: its error is kept in `failures`
+    until it next polls successfully, and as its state is left as it was, the
+    changes are picked up by a later poll.
+    """
+
+    CG_KEYS = ["team.bib", "type", "waypoint", "metric"]
+    CE_KEYS = ["team.bib", "type", "metric"]
+    VALUE_COLS = ["value_0", "value_1"]
+
+    def __init__(self, client, categories: Union[str, List[str]],
+                 stage: Optional[int] = None, year: Optional[int] = None,
+                 min_interval: float = 5.0, max_interval: float = 120.0,
+                 backoff: float = 2.0, use_cache: Optional[bool] = None,
+                 **cache_kwargs):
+        """
+        Args:
+            client: DakarAPIClient used to make the requests
+            categories: Category or list of categories to watch
+            stage: Stage to watch; defaults to the client stage
+            year: Year to watch; defaults to the client year
+            min_interval: Polling interval (seconds) while results are changing
+            max_interval: Longest polling interval (seconds) when results are quiet
+            backoff: Factor the interval grows by after each quiet poll
+            use_cache: Override default caching behavior for the polls
+            **cache_kwargs: Override cache settings for the polls
+        """
+        self.client = client
+        self.categories = [categories] if isinstance(categories, str) else list(categories)
+        self.stage = stage if stage is not None else client.stage
+        self.year = year or client.year
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self.interval = min_interval
+        self.proxy = client._get_request_proxy(use_cache, **cache_kwargs)
+
+        # Per category: conditional request state, and last seen values by key
+        self._state: Dict[str, dict] = {}
+        self._cg: Dict[str, pd.DataFrame] = {}
+        self._ce: Dict[str, pd.DataFrame] = {}
+        # Categories whose latest poll failed, with the exception
+        self.failures: Dict[str, Exception] = {}
+
+    @classmethod
+    def _diff(cls, previous: Optional[pd.DataFrame], new: pd.DataFrame,
+              keys: List[str]) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        """
+        Find rows of new whose key is unseen, or whose values differ from previous.
+
+        Returns:
+            Tuple of (changes, updated previous values indexed by key)
+        """
+        indexed = new.set_index(keys)
+        if previous is None or previous.empty:
+            return new, indexed[cls.VALUE_COLS]
+
+        old = previous.reindex(indexed.index)
+        changed = (old[cls.VALUE_COLS].isna().any(axis=1) |
+                   (old[cls.VALUE_COLS] != indexed[cls.VALUE_COLS]).any(axis=1)).to_numpy()
+
+        changes = new[changed]
+        previous = pd.concat([
+            previous.drop(indexed.index[changed], errors="ignore"),
+            indexed.loc[changed, cls.VALUE_COLS]
+        ])
+        return changes, previous
+
+    def _poll_category(self, category: str) -> Optional[Tuple[pd.DataFrame, pd.DataFrame]]:
+        """
+        Poll a single category; returns the changed (cg, ce) rows, or None.
+
+        The poll state and seen values are only updated once the payload has
+        been decoded, so a payload that fails to decode is decoded again next time.
+        """
+        url = self.client._get_url(self.client.SCORE_TEMPLATE, year=self.year,
+                                   category=category, stage=self.stage)
+        previous = self._state.get(category)
+        records, state = self.client._poll(url, self.proxy, previous)
+        if records is None:
+            self._state[category] = state
+            return None
+
+        cg_changes, cg = self._diff(
+            self._cg.get(category),
+            long_results_cg_from_records(records, self.year, category, self.stage),
+            self.CG_KEYS)
+        ce_changes, ce = self._diff(
+            self._ce.get(category),
+            long_results_ce_from_records(records, self.year, category, self.stage),
+            self.CE_KEYS)
+        self._state[category], self._cg[category], self._ce[category] = state, cg, ce
+
+        if cg_changes.empty and ce_changes.empty:
+            return None
+        return cg_changes, ce_changes
+
+    def poll(self) -> List[Tuple[str, pd.DataFrame, pd.DataFrame]]:
+        """
+        Poll every watched category once and adapt the polling interval.
+
+        A category that fails is recorded in `failures` rather than raising,
+        so that the other categories, and later polls, go on.
+
+        Returns:
+            List of (category, cg_changes, ce_changes) for categories with changes,
+            where the change frames follow the long_results_cg/long_results_ce schemas
+        """
+        events = []
+        for category in self.categories:
+            try:
+                changes = self._poll_category(category)
+            except Exception as e:
+                self.failures[category] = e
+                continue
+            self.failures.pop(category, None)
+            if changes is not None:
+                events.append((category, *changes))
+
+        if events:
+            self.interval = self.min_interval
+        else:
+            self.interval = min(self.max_interval, self.interval * self.backoff)
+
+        return events
+
+    def watch(self, max_polls: Optional[int] = None) -> Iterator[Tuple[str, pd.DataFrame, pd.DataFrame]]:
+        """Poll repeatedly, yielding (category, cg_changes, ce_changes) events."""
+        polls = 0
+        while max_polls is None or polls < max_polls:
+            yield from self.poll()
+            polls += 1
+            if max_polls is None or polls < max_polls:
+                time.sleep(self.interval)
+
+    async def awatch(self, max_polls: Optional[int] = None) -> AsyncIterator[Tuple[str, pd.DataFrame, pd.DataFrame]]:
+        """Async flavour of watch(); each poll runs in a worker thread."""
+        polls = 0
+        while max_polls is None or polls < max_polls:
+            for event in await asyncio.to_thread(self.poll):
+                yield event
+            polls += 1
+            if max_polls is None or polls < max_polls:
+                await asyncio.sleep(self.interval)
@@ -0,0 +1,217 @@
+import threading
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import pandas as pd
+
+
+class _CategoryWithdrawals:
+    """Incremental state for one (year, category): poll state, processed entries and frames."""
+
+    __slots__ = ("poll_state", "entries", "frames")
+
+    def __init__(self):
+        self.poll_state: Optional[dict] = None
+        # Per stage, the (bib, reason) of each entry processed so far, in payload order
+        self.entries: Dict[Any, List[Tuple[Any, Any]]] = {}
+        self.frames: Optional[List[pd.DataFrame]] = None
+
+
+class WithdrawalTracker:
+    """
+    Track withdrawals incrementally, parsing only stage entries not seen before.
+
+    The withdrawal payload lists every stage so far, and a stage's entries only
+    grow as the rally goes on. For each (year, category) the tracker polls with
+    conditional requests, so an unchanged payload is not even decoded, and
+    otherwise compares each stage's (bib, reason) entries with those already
+    processed, parsing only the entries appended since. If a stage's
+    earlier entries have been edited rather than appended to, that stage is
+    parsed again and its rows replaced.
+
+    The cumulative withdrawals, withdrawn competitors and withdrawn teams frames
+    of each category are maintained as new rows arrive, and match those of
+    DakarAPIClient.get_withdrawals().
+    """
+
+    SORT_KEYS = (["stage", "bib", "reason"], ["bib"], ["team.bib"])
+
+    def __init__(self, client):
+        """
+        Args:
+            client: DakarAPIClient used to make the requests and build the frames
+        """
+        self.client = client
+        self._state: Dict[Tuple[int, str], _CategoryWithdrawals] = {}
+        self._lock = threading.RLock()
+
+    @classmethod
+    def _combine(cls, frames: List[Tuple[pd.DataFrame, ...]]) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+        """Concatenate per category frames and sort them as get_withdrawals() does."""
+        return tuple(
+            pd.concat(dfs, ignore_index=True).sort_values(keys, kind="stable").reset_index(drop=True)
+            for dfs, keys in zip(zip(*frames), cls.SORT_KEYS))
+
+    def _new_entries(self, state: _CategoryWithdrawals,
+                     records: List[dict]) -> Tuple[List[Any], List[dict], List[Any], Dict[Any, list]]:
+        """
+        Find the stage entries that have not been processed yet.
+
+        The state is not changed, so that nothing counts as processed until
+        the entries have been parsed.
+
+        Returns:
+            Tuple of (stages, entries, replaced stages, processed entries by stage)
+        """
+        stages, entries, replaced = [], [], []
+        processed_entries = dict(state.entries)
+        for record in records:
+            stage = record.get("stage")
+            items = record.get("list")
+            items = items if isinstance(items, list) else []
+            keys = [(item.get("bib"), item.get("reason")) if isinstance(item, dict) else (None, None)
+                    for item in items]
+
+            processed = state.entries.get(stage, [])
+            if keys[:len(processed)] == processed:
+                items = items[len(processed):]
+            else:
+                replaced.append(stage)
+            processed_entries[stage] = keys
+
+            stages.extend([stage] * len(items))
+            entries.extend(items)
+        return stages, entries, replaced, processed_entries
+
+    @staticmethod
+    def _drop_stages(frames: List[pd.DataFrame], stages: List[Any]) -> List[pd.DataFrame]:
+        """Drop the rows of stages about to be parsed again from cumulative frames."""
+        withdrawals_df, competitors_df, teams_df = frames
+        dropped = withdrawals_df["stage"].isin(stages)
+        bibs = withdrawals_df.loc[dropped, "bib"].unique()
+        return [
+            withdrawals_df[~dropped].reset_index(drop=True),
+            competitors_df[~competitors_df["bib"].isin(bibs)].reset_index(drop=True),
+            teams_df[~teams_df["team.bib"].isin(bibs)].reset_index(drop=True),
+        ]
+
+    def _poll_category(self, year: int, category: str,
+                       proxy) -> Optional[Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]]:
+        """
+        Poll a single category; returns the appended rows, or None.
+
+        The category's state is only updated once the new entries have been
+        parsed, so if parsing fails they are parsed again on the next poll.
+        """
+        client = self.client
+        url = client._get_url(client.WITHDRAWAL_TEMPLATE, year=year, category=category)
+
+        state = self._state.setdefault((year, category), _CategoryWithdrawals())
+        records, poll_state = client._poll(url, proxy, state.poll_state)
+        if records is None:
+            state.poll_state = poll_state
+            return None
+
+        stages, entries, replaced, processed = self._new_entries(state, records)
+        frames = state.frames
+        if frames is not None and replaced:
+            frames = self._drop_stages(frames, replaced)
+        appended = None
+        if entries:
+            appended = client._withdrawal_frames(
+                pd.Series(entries, index=stages, dtype=object), category)
+            if frames is None:
+                frames = [df.sort_values(keys, kind="stable").reset_index(drop=True)
+                          for df, keys in zip(appended, self.SORT_KEYS)]
+            else:
+                appended = list(appended)
+                # Entries repeated across polls only add their withdrawal summary row once
+                existing = pd.MultiIndex.from_frame(frames[0][["stage", "bib", "reason"]])
+                repeated = pd.MultiIndex.from_frame(
+                    appended[0][["stage", "bib", "reason"]]).isin(existing)
+                appended[0] = appended[0][~repeated].reset_index(drop=True)
+                frames = [pd.concat([frame, df], ignore_index=True)
+                          .sort_values(keys, kind="stable")
+                          .reset_index(drop=True)
+                          for frame, df, keys in zip(frames, appended, self.SORT_KEYS)]
+                appended = tuple(appended)
+
+        state.entries, state.poll_state, state.frames = processed, poll_state, frames
+        return appended
+
+    def poll(self, year: Optional[int] = None,
+             category: Optional[Union[str, List[str]]] = None,
+             proxy=None, failures: Optional[Dict[str, Exception]] = None
+             ) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+        """
+        Poll the withdrawals of one or more categories once.
+
+        Args:
+            year: Year to poll; defaults to the client year
+            category: Category or list of categories; defaults to the client category
+            proxy: Proxy to make the requests with; defaults to the client proxy
+            failures: If given, a category that fails to poll is recorded in it,
+                by category, and the other categories are still polled
+
+        Returns:
+            Tuple of (withdrawals_df, withdrawn_competitors_df, withdrawn_teams_df)
+            holding only the rows appended by this poll
+        """
+        year = year or self.client.year
+        category = category or self.client.category
+        proxy = proxy or self.client.proxy
+        categories = [category] if isinstance(category, str) else list(category)
+
+        appended = []
+        for cat in categories:
+            # Polls of a category are serialised, as they update its state in place
+            with self._lock:
+                try:
+                    rows = self._poll_category(year, cat, proxy)
+                except Exception as e:
+                    if failures is None:
+                        raise
+                    failures[cat] = e
+                    continue
+            if rows is not None:
+                appended.append(rows)
+        if not appended:
+            return self._empty_frames(year, categories)
+        return self._combine(appended)
+
+    def _empty_frames(self, year: int, categories: List[str]) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+        """Empty frames for a poll with no new rows, with the cumulative frames' columns where known."""
+        for category in categories:
+            state = self._state.get((year, category))
+            if state is not None and state.frames is not None:
+                return tuple(df.iloc[:0] for df in state.frames)
+        return pd.DataFrame(), pd.DataFrame(), pd.DataFrame()
+
+    def frames(self, year: Optional[int] = None,
+               category: Optional[Union[str, List[str]]] = None) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+        """
+        Get the cumulative frames of the categories polled so far.
+
+        Args:
+            year: Year; defaults to the client year
+            category: Category or list of categories (default: all polled categories)
+
+        Returns:
+            Tuple of (withdrawals_df, withdrawn_competitors_df, withdrawn_teams_df)
+        """
+        year = year or self.client.year
+        if isinstance(category, str):
+            category = [category]
+        with self._lock:
+            frames = [state.frames for (y, cat), state in self._state.items()
+                      if y == year and (category is None or cat in category)
+                      and state.frames is not None]
+        if not frames:
+            return pd.DataFrame(), pd.DataFrame(), pd.DataFrame()
+        return self._combine(frames)
+
+    def reset(self, year: Optional[int] = None, category: Optional[str] = None) -> None:
+        """Forget the processed stages and cumulative frames of a category, or of all categories."""
+        with self._lock:
+            for key in list(self._state):
+                if (year is None or key[0] == year) and (category is None or key[1] == category):
+                    del self._state[key]
@@ -0,0 +1,159 @@
+import json
+import os
+import random
+import sys
+from typing import Dict, Iterable, List
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "src"))
+
+from dakar_rallydj.fixtures import FixtureServer, record_fixture  # noqa: E402
+from dakar_rallydj.getter import DakarAPIClient  # noqa: E402
+
+YEAR = 2025
+CATEGORIES = ["A", "M"]
+STAGES = [1, 2]
+# Stages in the stages payloads, including the prologue
+ALL_STAGES = [0] + STAGES
+LOCALES = ["en", "fr", "es", "ar"]
+
+
+def _langs(variable: str, text: str) -> List[dict]:
+    return [{"variable": variable, "locale": locale, "text": f"{text} ({locale})"}
+            for locale in LOCALES]
+
+
+def build_payloads(year: int = YEAR, categories: Iterable[str] = CATEGORIES,
+                   stages: Iterable[int] = STAGES, crews: int = 6, seed: int = 1) -> Dict[str, list]:
+    """
+    Build a small season of API payloads, shaped like the live API's, by API path.
+
+    Every category starts with a prologue, stage 0, which has waypoints and
+    scores but no withdrawals. Some crews miss some waypoints, as they do live.
+    """
+    rng = random.Random(seed)
+    categories, stages = list(categories), list(stages)
+    payloads = {
+        f"category-{year}": [
+            {"_id": f"category-{year}-{category}", "reference": f"{year}-{category}",
+             "label": category, "shortLabel": f"cat.name.{category}", "position": i,
+             "updatedAt": "2025-01-06T12:11:14+01:00", "_bind": f"category-{year}",
+             "categoryLangs": _langs(f"cat.name.{category}", category)}
+            for i, category in enumerate(categories)],
+        f"allGroups-{year}": [
+            {"_id": f"group-{category}-{i}", "_origin": f"categoryGroup-{year}-{category}",
+             "reference": f"{year}-{category}-G{i}", "label": f"G{i}", "tinyLabel": f"G{i}",
+             "position": i, "shortLabel": f"cat.name.{category}_G{i}", "color": "#ffffff",
+             "categoryGroupLangs": _langs(f"cat.name.{category}_G{i}", f"Group {i}")}
+            for category in categories for i in range(2)],
+    }
+
+    for c, category in enumerate(categories):
+        bibs = [100 * (c + 1) + i for i in range(crews)]
+        payloads[f"allClazz-{year}-{category}"] = [
+            {"_id": f"clazz-{category}-{i}", "_origin": f"categoryClazz-{year}-{category}",
+             "reference": f"{year}-{category}-C{i}", "shortLabel": f"clazz.{category}.{i}",
+             "categoryClazzLangs": _langs(f"clazz.{category}.{i}", f"Class {i}")}
+            for i in range(2)]
+
+        stage_records, withdrawals = [], []
+        for stage in [0] + stages:
+            code = f"{stage:02d}000" if stage else "0P000"
+            sectors = []
+            for k in range(1, 4):
+                sector = {"code": f"{code[:2]}{k}00", "id": stage * 10 + k, "type": "SPE" if k == 2 else "LIA",
+                          "length": 10 * k, "powerStage": False, "startTime": f"0{k}:00",
+                          "arrivalTime": f"0{k + 1}:00"}
+                if k == 2:
+                    sector["grounds"] = [
+                        {"name": f"ground.name.{g}", "color": f"#{g}{g}{g}", "percentage": 20 + 10 * g,
+                         "groundLangs": [{"variable": f"ground.name.{g}", "locale": locale,
+                                          "text": ["Dirt Track", "Sand", "Dunes"][g] if locale == "en"
+                                          else f"ground {g} ({locale})"} for locale in LOCALES],
+                         "sections": [{"section": x, "start": 10 * x, "finish": 10 * x + 5}
+                                      for x in range(g, g + 2)]}
+                        for g in range(3)]
+                sectors.append(sector)
+            stage_records.append({
+                "stage": stage, "code": code, "date": f"2025-01-{stage + 3:02d}",
+                "startDate": f"2025-01-{stage + 3:02d}T08:00:00+03:00",
+                "endDate": f"2025-01-{stage + 3:02d}T18:00:00+03:00", "isCancelled": 0,
+                "generalDisplay": True, "isDelayed": 0, "marathon": False, "length": 300,
+                "type": "stage", "timezone": "Asia/Riyadh", "stageWithBonus": False,
+                "mapCategoryDisplay": category, "podiumDisplay": True,
+                "_bind": f"stage-{year}-{category}", "sectors": sectors,
+                "stageLangs": _langs(f"stage.name.{code}", f"Stage {stage}")})
+
+            waypoints = [{"code": f"{stage:02d}2{w:02d}", "id": w, "checkpoint": w,
+                          "kilometerPoint": 12.5 * w, "hidden": False, "isFirstDss": w == 1,
+                          "groups": []} for w in range(1, 5)]
+            payloads[f"waypoint-{year}-{category}-{stage}"] = [
+                {"_id": f"waypoint-{year}-{category}-{stage}", "_origin": f"{stage:02d}000",
+                 "waypoints": waypoints}]
+
+            scores = []
+            for bib in bibs:
+                record = {
+                    "_id": f"lastScore-{year}-{category}-{stage}-{bib}",
+                    "_updatedAt": 1737386238000 + bib,
+                    "team": {"bib": bib, "clazz": f"clazz.{category}.{bib % 2}", "brand": "BRAND",
+                             "model": f"Model {bib}", "vehicle": {"type": category},
+                             "competitors": [{"name": f"Driver {bib}-{k}", "role": "P" if k == 0 else "C",
+                                              "nationality": "fra"} for k in range(2)]},
+                    "dss": {"position": rng.randint(1, 50), "absolute": rng.randint(1, 9) * 10 ** 6},
+                    "cg": {}, "cs": {},
+                    "ce": {"position": [rng.randint(1, 50)] * 2,
+                           "absolute": [rng.randint(1, 9) * 10 ** 6] * 2,
+                           "relative": [rng.randint(0, 10 ** 5), 0],
+                           "bonus": rng.choice([0, 60000])},
+                }
+                for waypoint in waypoints:
+                    if rng.random() < 0.85:
+                        for section in ("cg", "cs"):
+                            record[section][waypoint["code"]] = {
+                                "position": [rng.randint(1, 50)] * 2,
+                                "absolute": [rng.randint(1, 10 ** 8)] * 2,
+                                "relative": [rng.randint(0, 10 ** 6), 0]}
+                scores.append(record)
+            payloads[f"lastScore-{year}-{category}-{stage}"] = scores
+            if stage == 0:
+                continue
+
+            withdrawn = bibs[-stage:]
+            withdrawals.append({
+                "_id": f"withdrawal-{year}-{category}-{stage}", "stage": stage,
+                "list": [{"bib": bib, "reason": f"Reason {stage}",
+                          "team": {"bib": bib, "brand": "BRAND",
+                                   "competitors": [{"name": f"Driver {bib}-{k}", "role": "P"}
+                                                   for k in range(2)]}}
+                         for bib in withdrawn]})
+
+        payloads[f"stage-{year}-{category}"] = stage_records
+        payloads[f"withdrawal-{year}-{category}"] = withdrawals
+    return payloads
+
+
+def write_payloads(root: str, payloads: Dict[str, list]) -> str:
+    """Write payloads to a fixture directory; returns the directory."""
+    for path, payload in payloads.items():
+        record_fixture(root, path, json.dumps(payload).encode())
+    return root
+
+
+@pytest.fixture
+def api_dir(tmp_path) -> str:
+    """Fixture directory holding a small season of payloads, which tests may modify."""
+    return write_payloads(str(tmp_path / "api"), build_payloads())
+
+
+@pytest.fixture
+def server(api_dir):
+    with FixtureServer(api_dir) as server:
+        yield server
+
+
+@pytest.fixture
+def client(server):
+    with DakarAPIClient(year=YEAR, api_template=server.api_template) as client:
+        yield client
@@ -0,0 +1,77 @@
+import asyncio
+import os
+
+import pandas as pd
+import pytest
+
+from dakar_rallydj.async_getter import AsyncDakarAPIClient
+
+from conftest import CATEGORIES, STAGES, YEAR
+
+
+def _run(server, test):
+    """Run a coroutine taking an AsyncDakarAPIClient pointed at the fixture server."""
+    async def main():
+        async with AsyncDakarAPIClient(year=YEAR, api_template=server.api_template) as client:
+            return await test(client)
+    return asyncio.run(main())
+
+
+def test_getters_match_the_sync_client(client, server):
+    async def test(async_client):
+        pd.testing.assert_frame_equal(await async_client.get_category(), client.get_category())
+        pd.testing.assert_frame_equal(await async_client.get_clazz(category=CATEGORIES),
+                                      client.get_clazz(category=CATEGORIES))
+        for df, expected in zip(await async_client.get_withdrawals(category=CATEGORIES),
+                                client.get_withdrawals(category=CATEGORIES)):
+            pd.testing.assert_frame_equal(df, expected)
+        stages = await async_client.get_stages(category="M")
+        assert len(stages.materialised()) == len(stages.NAMES)
+        for df, expected in zip(stages, client.get_stages(category="M")):
+            pd.testing.assert_frame_equal(df, expected)
+        pd.testing.assert_frame_equal(await async_client.get_waypoints_bulk(CATEGORIES, STAGES),
+                                      client.get_waypoints_bulk(CATEGORIES, STAGES))
+
+    _run(server, test)
+
+
+def test_scores_are_fetched_concurrently(client, server):
+    keys = [(category, stage) for category in CATEGORIES for stage in STAGES]
+
+    async def test(async_client):
+        return await asyncio.gather(*[async_client.get_scores(category=category, stage=stage)
+                                      for category, stage in keys])
+
+    for (category, stage), result in zip(keys, _run(server, test)):
+        pd.testing.assert_frame_equal(result.long_results_ce,
+                                      client.get_scores(category=category, stage=stage).long_results_ce)
+
+
+def test_failed_withdrawal_category_does_not_lose_the_others(client, server, api_dir):
+    expected = client.get_withdrawals(category="A")
+    os.remove(os.path.join(api_dir, f"withdrawal-{YEAR}-M.json"))
+
+    async def test(async_client):
+        frames, failures = await async_client.get_withdrawals(category=CATEGORIES,
+                                                              return_failures=True)
+        assert list(failures) == ["M"]
+        for df, single in zip(frames, expected):
+            pd.testing.assert_frame_equal(df, single)
+        with pytest.warns(RuntimeWarning, match="'M'"):
+            frames = await async_client.get_withdrawals(category=CATEGORIES)
+        pd.testing.assert_frame_equal(frames[0], expected[0])
+        with pytest.raises(Exception):
+            await async_client.get_withdrawals(category="M")
+
+    _run(server, test)
+
+
+def test_watch_scores(server):
+    async def test(async_client):
+        return [event async for event in async_client.watch_scores(CATEGORIES, stage=1, max_polls=2,
+                                                                    min_interval=0)]
+
+    events = _run(server, test)
+    # Everything is new on the first poll, and nothing changes after it
+    assert [category for category, _, _ in events] == CATEGORIES
+    assert all(not cg.empty and not ce.empty for _, cg, ce in events)
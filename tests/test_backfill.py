@@ -0,0 +1,61 @@
+import os
+
+from dakar_rallydj.backfill import Backfill
+from dakar_rallydj.getter import DakarAPIClient
+from dakar_rallydj.parquet import DakarParquetDataset
+
+from conftest import ALL_STAGES, CATEGORIES, YEAR
+
+
+def test_backfill_resumes_after_a_failed_slice(client, api_dir, tmp_path):
+    dataset = DakarParquetDataset(str(tmp_path / "archive"))
+    manifest_path = str(tmp_path / "archive" / "manifest.json")
+
+    # Make one scores slice fail
+    fixture = os.path.join(api_dir, f"lastScore-{YEAR}-M-2.json")
+    os.rename(fixture, fixture + ".missing")
+    summary = Backfill(client, dataset, manifest_path).run([YEAR], CATEGORIES)
+    assert summary == {"done": 2 + 1 + 2 * len(CATEGORIES) * len(ALL_STAGES) - 1, "failed": 1}
+    assert dataset.read("long_results_cg", category="M", stage=2).empty
+
+    os.rename(fixture + ".missing", fixture)
+    requests = client.metrics.get(DakarAPIClient.SCORE_TEMPLATE, "requests")
+    backfill = Backfill(client, dataset, manifest_path)
+    assert [key for key, _ in backfill.plan([YEAR], CATEGORIES)] == [f"scores/{YEAR}/M/2"]
+    summary = backfill.run([YEAR], CATEGORIES)
+    assert summary == {"done": 2 + 1 + 2 * len(CATEGORIES) * len(ALL_STAGES)}
+    # Only the failed slice is fetched again
+    assert client.metrics.get(DakarAPIClient.SCORE_TEMPLATE, "requests") == requests + 1
+    assert not dataset.read("long_results_cg", category="M", stage=2).empty
+
+
+def test_backfill_discovers_category_codes(client, tmp_path):
+    dataset = DakarParquetDataset(str(tmp_path / "archive"))
+    backfill = Backfill(client, dataset, str(tmp_path / "manifest.json"))
+    summary = backfill.run([YEAR])
+    # Category references are like "2025-A"; slices use the bare codes
+    assert backfill.manifest.slices[f"categories/{YEAR}"]["categories"] == CATEGORIES
+    assert summary == {"done": 1 + len(CATEGORIES) + 1 + 2 * len(CATEGORIES) * len(ALL_STAGES)}
+    assert sorted(dataset.read("long_results_cg")["category"].unique()) == CATEGORIES
+
+
+def test_backfill_retries_failed_stage_discovery(client, api_dir, tmp_path):
+    dataset = DakarParquetDataset(str(tmp_path / "archive"))
+    manifest_path = str(tmp_path / "manifest.json")
+
+    fixture = os.path.join(api_dir, f"stage-{YEAR}-M.json")
+    os.rename(fixture, fixture + ".missing")
+    backfill = Backfill(client, dataset, manifest_path)
+    backfill.run([YEAR])
+    assert backfill.manifest.slices[f"stages/{YEAR}/M"]["status"] == "failed"
+    # The withdrawals of every category are still archived
+    assert sorted(dataset.read("withdrawals")["_category"].unique()) == CATEGORIES
+
+    os.rename(fixture + ".missing", fixture)
+    backfill = Backfill(client, dataset, manifest_path)
+    planned = [key for key, _ in backfill.plan([YEAR])]
+    assert f"withdrawals/{YEAR}" not in planned
+    assert planned and all(key.split("/")[2] == "M" for key in planned)
+    assert backfill.run([YEAR]) == {
+        "done": 1 + len(CATEGORIES) + 1 + 2 * len(CATEGORIES) * len(ALL_STAGES)}
+    assert sorted(dataset.read("long_results_cg")["category"].unique()) == CATEGORIES
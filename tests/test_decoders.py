@@ -0,0 +1,93 @@
+import pandas as pd
+import pytest
+
+from dakar_rallydj.benchmarks import compact_memory
+from dakar_rallydj.decoders import (CategorySets, compact_long_results, concat_compact,
+                                    long_results_ce_from_records,
+                                    long_results_cg_from_records)
+from dakar_rallydj.entities import EntityRegistry
+from dakar_rallydj.getter import DakarAPIClient
+
+from conftest import CATEGORIES, STAGES, YEAR, build_payloads
+
+PAYLOADS = build_payloads()
+SCORE_KEYS = [(category, stage) for category in CATEGORIES for stage in STAGES]
+
+
+def _records(category, stage):
+    return PAYLOADS[f"lastScore-{YEAR}-{category}-{stage}"]
+
+
+def _legacy_frames(records):
+    """teams_df, competitors_df and results_df as the getters used to build them."""
+    return DakarAPIClient.normalize_team_competitors(pd.json_normalize(records), YEAR)
+
+
+@pytest.mark.parametrize("category,stage", SCORE_KEYS)
+def test_long_results_cg_matches_legacy(category, stage):
+    records = _records(category, stage)
+    expected = DakarAPIClient.long_results_cg(_legacy_frames(records)[2])
+    pd.testing.assert_frame_equal(long_results_cg_from_records(records, YEAR, category, stage),
+                                  expected)
+
+
+@pytest.mark.parametrize("category,stage", SCORE_KEYS)
+def test_long_results_ce_matches_legacy(category, stage):
+    records = _records(category, stage)
+    expected = DakarAPIClient.long_results_ce(_legacy_frames(records)[2])
+    pd.testing.assert_frame_equal(long_results_ce_from_records(records, YEAR, category, stage),
+                                  expected)
+
+
+def test_registry_frames_match_legacy():
+    records = _records("A", 1)
+    teams_df, competitors_df, _ = _legacy_frames(records)
+    teams, competitors = EntityRegistry().frames(records, YEAR)
+    pd.testing.assert_frame_equal(teams, teams_df.reset_index(drop=True))
+    pd.testing.assert_frame_equal(competitors, competitors_df)
+
+
+def test_compact_long_results_round_trip():
+    records = _records("M", 2)
+    df = long_results_cg_from_records(records, YEAR, "M", 2)
+    compact = compact_long_results(df)
+    assert compact.memory_usage(deep=True).sum() < df.memory_usage(deep=True).sum()
+    for col in ["type", "waypoint", "metric", "category"]:
+        assert isinstance(compact[col].dtype, pd.CategoricalDtype)
+        assert compact[col].astype(object).tolist() == df[col].tolist()
+    assert (compact["value_0"].astype("int64") == df["value_0"]).all()
+
+
+def test_concat_compact_keeps_categoricals():
+    frames = [compact_long_results(long_results_cg_from_records(_records(category, stage), YEAR,
+                                                                category, stage))
+              for category, stage in SCORE_KEYS]
+    combined = concat_compact(frames)
+    assert len(combined) == sum(len(df) for df in frames)
+    assert isinstance(combined["waypoint"].dtype, pd.CategoricalDtype)
+    assert isinstance(combined["_id"].dtype, pd.CategoricalDtype)
+    assert combined["_id"].astype(object).tolist() == [
+        value for df in frames for value in df["_id"].astype(object)]
+
+
+def test_category_sets_hold_no_ids_and_can_be_cleared():
+    category_sets = CategorySets()
+    df = long_results_cg_from_records(_records("A", 1), YEAR, "A", 1)
+    compact = compact_long_results(df, category_sets)
+    # Each frame's _id categories are its own, and do not grow the shared sets
+    assert set(compact["_id"].cat.categories) == set(df["_id"])
+    assert list(category_sets.dtype("_id").categories) == []
+    assert category_sets.memory_usage() > 0
+
+    category_sets.clear()
+    assert category_sets.memory_usage() == 0
+    assert list(category_sets.dtype("waypoint").categories) == []
+    assert compact["waypoint"].astype(object).tolist() == df["waypoint"].tolist()
+
+
+def test_compact_memory_counts_the_category_sets_once(client):
+    report = compact_memory(client, CATEGORIES, STAGES)
+    assert report["table"].tolist()[-1] == "category_sets"
+    assert report["compact_bytes"].iloc[-1] > 0
+    assert report["saved"].sum() == report["bytes"].sum() - report["compact_bytes"].sum()
+    assert report["saved"].sum() > 0
@@ -0,0 +1,82 @@
+import copy
+
+import pytest
+
+from dakar_rallydj.entities import EntityRegistry
+from dakar_rallydj.getter import DakarAPIClient
+from dakar_rallydj.snapshot import save_snapshot
+from dakar_rallydj.store import PayloadStore
+
+from conftest import YEAR, build_payloads
+
+PAYLOADS = build_payloads()
+
+
+def test_update_only_reports_new_or_changed_crews():
+    registry = EntityRegistry()
+    records = PAYLOADS[f"lastScore-{YEAR}-A-1"]
+    assert registry.update(records, YEAR) == [(YEAR, record["team"]["bib"]) for record in records]
+    # The same crews turn up again in the next stage
+    assert registry.update(PAYLOADS[f"lastScore-{YEAR}-A-2"], YEAR) == []
+
+    changed = copy.deepcopy(records)
+    changed[0]["team"]["model"] = "New model"
+    bib = changed[0]["team"]["bib"]
+    assert registry.update(changed, YEAR) == [(YEAR, bib)]
+    assert registry.revision(YEAR, bib) == 1
+    assert registry.teams(YEAR).set_index("team.bib").loc[bib, "team.model"] == "New model"
+
+
+def test_frames_do_not_update_the_registry():
+    # A memoised result's tables may be built from another client's registry
+    registry = EntityRegistry()
+    records = PAYLOADS[f"lastScore-{YEAR}-A-1"]
+    teams, _ = registry.frames(records, YEAR)
+    assert len(teams) == len(records)
+    assert len(registry) == 0
+
+
+def test_registry_is_keyed_by_year():
+    registry = EntityRegistry()
+    records = PAYLOADS[f"lastScore-{YEAR}-M-1"]
+    registry.update(records, YEAR)
+    registry.update(records, YEAR - 1)
+    assert len(registry) == 2 * len(records)
+    assert len(registry.competitors(YEAR)) == 2 * len(records)
+
+
+def test_get_scores_populates_client_registry(client):
+    # Crews are registered as the payloads are fetched, without building any table
+    client.get_scores(category="A", stage=1)
+    client.get_scores(category="M", stage=1)
+    assert len(client.entities.teams(YEAR)) == 12
+    assert (YEAR, 100) in client.entities and (YEAR, 200) in client.entities
+
+
+def test_memoised_scores_populate_each_client_registry(server):
+    store = PayloadStore()
+    with DakarAPIClient(year=YEAR, api_template=server.api_template, store=store) as first, \
+            DakarAPIClient(year=YEAR, api_template=server.api_template, store=store) as second:
+        first.get_scores(category="A", stage=1)
+        # The second client gets the first client's memoised result
+        teams = second.get_scores(category="A", stage=1).teams
+        assert len(teams) == 6
+        assert len(second.entities) == 6
+
+    # Payloads served from the store, unfetched, register their crews too
+    registry = EntityRegistry()
+    with DakarAPIClient(year=YEAR, api_template=server.api_template, store=store,
+                        prefer_store=True, entities=registry) as cached:
+        cached.get_scores(category="A", stage=1)
+        assert cached.metrics.to_frame().empty
+    assert len(registry) == 6
+
+
+def test_snapshot_scores_populate_registry(client, tmp_path):
+    pytest.importorskip("pyarrow")
+    path = str(tmp_path / "snapshot")
+    save_snapshot(client, path, "M", [2])
+    with DakarAPIClient.from_snapshot(path, replay_dir=str(tmp_path / "empty")) as served:
+        served.get_scores(category="M", stage=2)
+        assert len(served.entities) == 6
+        assert served.metrics.to_frame().empty
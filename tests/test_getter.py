@@ -0,0 +1,201 @@
+import json
+import os
+
+import pandas as pd
+import pytest
+from dakar_rallydj import watcher as watcher_module
+from dakar_rallydj.getter import DakarAPIClient
+from dakar_rallydj.results import ScoresResult, StagesResult
+from dakar_rallydj.watcher import ScoreWatcher
+
+from conftest import ALL_STAGES, CATEGORIES, STAGES, YEAR
+
+
+def _requests(client, template):
+    return client.metrics.get(template, "requests")
+
+
+def test_get_category(client):
+    category_df = client.get_category()
+    assert category_df["reference"].tolist() == [f"{YEAR}-{category}" for category in CATEGORIES]
+    assert {"ar", "en", "es", "fr"} <= set(category_df.columns)
+
+
+def test_get_groups_and_clazz(client):
+    assert len(client.get_groups()) == 2 * len(CATEGORIES)
+    clazz_df = client.get_clazz(category=CATEGORIES)
+    assert sorted(clazz_df["category"].unique()) == CATEGORIES
+
+
+def test_get_stages_is_lazy_and_unpacks(client):
+    result = client.get_stages(category="A")
+    assert isinstance(result, StagesResult)
+    assert result.materialised() == []
+    stages_df, sectors_df, stage_surfaces_df, section_surfaces_df, surfaces_df = result
+    assert stages_df["stage"].tolist() == ALL_STAGES
+    assert len(sectors_df) == 3 * len(stages_df)
+    assert not surfaces_df.empty
+
+
+def test_get_waypoints(client):
+    waypoint_df = client.get_waypoints(category="M", stage=2)
+    assert waypoint_df["checkpoint"].tolist() == [1, 2, 3, 4]
+    assert set(waypoint_df["stage"]) == {2}
+    assert "groups" not in waypoint_df.columns
+
+
+def test_get_waypoints_bulk_matches_get_waypoints(client):
+    bulk = client.get_waypoints_bulk(CATEGORIES, STAGES)
+    for category in CATEGORIES:
+        for stage in STAGES:
+            single = client.get_waypoints(category=category, stage=stage)
+            part = bulk.loc[(category, stage)].reset_index()
+            pd.testing.assert_series_equal(part["code"], single["code"].reset_index(drop=True))
+
+
+def test_get_waypoints_bulk_memoises_each_payload(client, server, monkeypatch):
+    expected = client.get_waypoints_bulk(CATEGORIES, STAGES)
+    parses = []
+    parse = client._parse_waypoint_items
+    monkeypatch.setattr(client, "_parse_waypoint_items", lambda content: parses.append(1) or parse(content))
+    pd.testing.assert_frame_equal(client.get_waypoints_bulk(CATEGORIES, STAGES + [0]),
+                                  pd.concat([expected, client.get_waypoints_bulk(CATEGORIES, [0])])
+                                  .sort_index(level=["category", "stage"], sort_remaining=False))
+    # Only the prologue payloads were decoded, once each
+    assert len(parses) == len(CATEGORIES)
+
+    with DakarAPIClient(year=YEAR, api_template=server.api_template, store=client.store,
+                        prefer_store=True) as cached:
+        pd.testing.assert_frame_equal(cached.get_waypoints_bulk(CATEGORIES, STAGES), expected)
+        assert cached.metrics.to_frame().empty
+    # pd.read_json() reads stage codes such as "01000" as numbers, as get_waypoints() does
+    with DakarAPIClient(year=YEAR, api_template=server.api_template, fast_decode=False) as slow:
+        pd.testing.assert_frame_equal(
+            slow.get_waypoints_bulk(CATEGORIES, STAGES).drop(columns="stage_code"),
+            expected.drop(columns="stage_code"))
+
+
+def test_get_waypoints_bulk_polars_backend(client, server):
+    pytest.importorskip("polars")
+    pytest.importorskip("pyarrow")
+    with DakarAPIClient(year=YEAR, api_template=server.api_template, backend="polars") as fast:
+        bulk = fast.get_waypoints_bulk(CATEGORIES, STAGES)
+        for category in CATEGORIES:
+            for stage in STAGES:
+                single = fast.get_waypoints(category=category, stage=stage)
+                assert bulk.loc[(category, stage)]["code"].tolist() == single["code"].tolist()
+
+
+def test_get_withdrawals(client):
+    withdrawals_df, competitors_df, teams_df = client.get_withdrawals(category=CATEGORIES)
+    # The fixture withdraws one crew per category at stage 1 and two at stage 2
+    assert len(withdrawals_df) == 3 * len(CATEGORIES)
+    assert sorted(withdrawals_df["_category"].unique()) == CATEGORIES
+    assert len(competitors_df) == 2 * len(teams_df)
+
+
+def test_get_scores(client):
+    result = client.get_scores(category="A", stage=1)
+    assert isinstance(result, ScoresResult)
+    assert result.materialised() == []
+    teams_df = result.teams
+    assert result.materialised() == ["teams"]
+    long_cg, long_ce, teams_df, competitors_df = result
+    assert len(teams_df) == 6
+    assert set(long_cg["category"]) == {"A"}
+    assert set(long_ce["stage"]) == {"1"}
+    assert (competitors_df["year"] == YEAR).all()
+
+
+def test_stage_zero_is_not_replaced_by_the_default_stage(client):
+    assert client.stage == 1
+    assert set(client.get_waypoints(category="A", stage=0)["stage"]) == {0}
+    assert set(client.get_scores(category="A", stage=0).long_results_ce["stage"]) == {"0"}
+
+
+def test_parse_results_are_memoised(client):
+    first = client.get_scores(category="A", stage=2).long_results_cg
+    requests = _requests(client, DakarAPIClient.SCORE_TEMPLATE)
+    second = client.get_scores(category="A", stage=2).long_results_cg
+    pd.testing.assert_frame_equal(first, second)
+    # The payload is requested again, but not parsed again, and callers get copies
+    assert _requests(client, DakarAPIClient.SCORE_TEMPLATE) == requests + 1
+    second.loc[second.index[0], "value_0"] = -1
+    assert client.get_scores(category="A", stage=2).long_results_cg.equals(first)
+
+
+def test_fetch_many_reports_failures(client):
+    results, failures = client.fetch_many(endpoints=["waypoints"], categories=CATEGORIES,
+                                          stages=STAGES + [9])
+    assert set(results) == {("waypoints", YEAR, category, stage)
+                            for category in CATEGORIES for stage in STAGES}
+    assert set(failures) == {("waypoints", YEAR, category, 9) for category in CATEGORIES}
+
+
+def test_record_and_replay(server, tmp_path):
+    record_dir = str(tmp_path / "recorded")
+    with DakarAPIClient(year=YEAR, api_template=server.api_template, record_dir=record_dir) as live:
+        expected = live.get_scores(category="M", stage=1).long_results_ce
+    with DakarAPIClient(year=YEAR, replay_dir=record_dir) as replay:
+        pd.testing.assert_frame_equal(replay.get_scores(category="M", stage=1).long_results_ce,
+                                      expected)
+
+
+def test_conditional_scores_reuse_frames(client):
+    first = client.get_scores(category="A", stage=1, conditional=True)
+    second = client.get_scores(category="A", stage=1, conditional=True)
+    assert second is first
+
+
+def _edit_scores(api_dir, category, stage, edit):
+    path = os.path.join(api_dir, f"lastScore-{YEAR}-{category}-{stage}.json")
+    with open(path) as f:
+        records = json.load(f)
+    edit(records)
+    with open(path, "w") as f:
+        json.dump(records, f)
+    return records
+
+
+def test_conditional_scores_see_edits_without_updated_at_moving(client, api_dir):
+    first = client.get_scores(category="A", stage=1, conditional=True)
+    records = _edit_scores(api_dir, "A", 1, lambda records: records[0]["ce"].update(position=[42, 42]))
+    second = client.get_scores(category="A", stage=1, conditional=True)
+    assert second is not first
+    ce = second.long_results_ce.set_index(["team.bib", "type", "metric"])
+    assert ce.loc[(records[0]["team"]["bib"], "ce", "position"), "value_0"] == 42
+
+
+def test_watcher_sees_edits_without_updated_at_moving(client, api_dir):
+    watcher = ScoreWatcher(client, "M", stage=2)
+    assert len(watcher.poll()) == 1
+    assert watcher.poll() == []
+
+    def edit(records):
+        records[1]["ce"]["position"] = [42, 42]
+        del records[2]["_updatedAt"]
+
+    records = _edit_scores(api_dir, "M", 2, edit)
+    [(category, cg_changes, ce_changes)] = watcher.poll()
+    assert cg_changes.empty
+    assert ce_changes[["team.bib", "metric", "value_0"]].values.tolist() == [
+        [records[1]["team"]["bib"], "position", 42]]
+
+
+def test_watcher_survives_failed_polls(client, api_dir, monkeypatch):
+    watcher = ScoreWatcher(client, CATEGORIES, stage=2, min_interval=0, max_interval=0)
+    path = os.path.join(api_dir, f"lastScore-{YEAR}-A-2.json")
+    os.rename(path, path + ".missing")
+    [(category, _, _)] = list(watcher.watch(max_polls=2))
+    assert category == "M" and list(watcher.failures) == ["A"]
+
+    os.rename(path + ".missing", path)
+    # A payload that fails to decode is decoded again by the next poll
+    decode = watcher_module.long_results_cg_from_records
+    monkeypatch.setattr(watcher_module, "long_results_cg_from_records",
+                        lambda *args: 1 / 0)
+    assert watcher.poll() == [] and list(watcher.failures) == ["A"]
+    monkeypatch.setattr(watcher_module, "long_results_cg_from_records", decode)
+    [(category, cg_changes, ce_changes)] = watcher.poll()
+    assert category == "A" and not cg_changes.empty and not ce_changes.empty
+    assert watcher.failures == {}
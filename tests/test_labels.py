@@ -0,0 +1,15 @@
+import pandas as pd
+
+from dakar_rallydj.labels import LabelDictionary, merge_lang_labels
+from dakar_utils_2025 import mergeInLangLabels
+
+from conftest import YEAR, build_payloads
+
+PAYLOADS = build_payloads()
+
+
+def test_merge_lang_labels_matches_the_tutorial_pivot_and_merge():
+    df = pd.json_normalize(PAYLOADS[f"category-{YEAR}"])
+    df.loc[len(df)] = {"shortLabel": "cat.name.X", "categoryLangs": []}
+    pd.testing.assert_frame_equal(merge_lang_labels(df, "categoryLangs", labels=LabelDictionary()),
+                                  mergeInLangLabels(df, "categoryLangs"), check_names=False)
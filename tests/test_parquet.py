@@ -0,0 +1,54 @@
+import pandas as pd
+import pytest
+
+from dakar_rallydj import parquet
+from dakar_rallydj.parquet import DakarParquetDataset
+
+from conftest import CATEGORIES, STAGES, YEAR
+
+
+@pytest.fixture
+def dataset(client, tmp_path):
+    pytest.importorskip("pyarrow")
+    dataset = DakarParquetDataset(str(tmp_path / "archive"), engine="pyarrow")
+    dataset.export(client, categories=CATEGORIES, stages=STAGES)
+    return dataset
+
+
+def test_read_round_trip(client, dataset):
+    expected = client.get_scores(category="M", stage=2).long_results_cg
+    df = dataset.read("long_results_cg", category="M", stage=2)
+    assert len(df) == len(expected)
+    assert set(df["year"]) == {YEAR} and set(df["stage"]) == {2}
+    assert sorted(dataset.read("long_results_cg", stage=[1, 2])["category"].unique()) == CATEGORIES
+
+
+def test_read_filters_rows(dataset):
+    df = dataset.read("long_results_cg", category="A",
+                      columns=["team.bib", "value_0"], filters=[("metric", "==", "position")])
+    everything = dataset.read("long_results_cg", category="A")
+    expected = everything[everything["metric"] == "position"]
+    assert list(df.columns) == ["team.bib", "value_0"]
+    assert df["value_0"].tolist() == expected["value_0"].tolist()
+
+    df = dataset.read("long_results_cg", filters=[("metric", "in", ["absolute", "relative"]),
+                                                  ("team.bib", ">", 200)])
+    assert set(df["metric"]) == {"absolute", "relative"}
+    assert (df["team.bib"] > 200).all() and set(df["category"]) == {"M"}
+
+
+def test_read_filters_rows_when_the_engine_only_filters_row_groups(dataset, monkeypatch):
+    # As fastparquet does: filters only select row groups, and each file is one row group
+    read_parquet = pd.read_parquet
+    monkeypatch.setattr(parquet.pd, "read_parquet",
+                        lambda path, filters=None, **kwargs: read_parquet(path, **kwargs))
+    df = dataset.read("long_results_cg", filters=[("metric", "==", "position")])
+    assert set(df["metric"]) == {"position"}
+
+
+def test_read_filters_rows_with_fastparquet(client, tmp_path):
+    pytest.importorskip("fastparquet")
+    dataset = DakarParquetDataset(str(tmp_path / "archive"), engine="fastparquet")
+    dataset.export(client, categories=CATEGORIES, stages=STAGES)
+    df = dataset.read("long_results_cg", filters=[("metric", "==", "position")])
+    assert set(df["metric"]) == {"position"}
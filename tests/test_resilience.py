@@ -0,0 +1,115 @@
+import pytest
+import requests
+
+from dakar_rallydj.fixtures import FixtureSession
+from dakar_rallydj.getter import DakarAPIClient
+from dakar_rallydj.resilience import RetryPolicy, TokenBucket
+
+from conftest import YEAR
+
+TEMPLATE = DakarAPIClient.WAYPOINT_TEMPLATE
+FAST_RETRIES = RetryPolicy(max_retries=3, backoff=0.001, max_backoff=0.01, jitter=0)
+
+
+@pytest.fixture
+def fail(monkeypatch):
+    """Make the fixture server answer an API path with an error status a number of times."""
+    failures = {}
+    get = FixtureSession.get
+
+    def flaky_get(session, url, headers=None, **kwargs):
+        for path, failure in failures.items():
+            if url.split("?")[0].endswith(f"/{path}") and failure["times"]:
+                failure["times"] -= 1
+                r = requests.Response()
+                r.url, r.status_code, r._content = url, failure["status"], b""
+                r.headers.update(failure["headers"])
+                return r
+        return get(session, url, headers=headers, **kwargs)
+
+    monkeypatch.setattr(FixtureSession, "get", flaky_get)
+
+    def fail(path, times, status=503, headers=None):
+        failures[path] = {"times": times, "status": status, "headers": headers or {}}
+    return fail
+
+
+def _metrics(client):
+    return {event: client.metrics.get(TEMPLATE, event)
+            for event in ("requests", "retries", "failures")}
+
+
+def test_retry_policy_delays():
+    policy = RetryPolicy(backoff=0.5, max_backoff=3.0, jitter=0)
+    assert [policy.delay(attempt) for attempt in range(4)] == [0.5, 1.0, 2.0, 3.0]
+
+    jittered = RetryPolicy(backoff=1.0, jitter=0.5)
+    assert all(0.5 <= jittered.delay(0) <= 1.0 for _ in range(20))
+
+    throttled = requests.Response()
+    throttled.status_code = 429
+    throttled.headers["Retry-After"] = "2"
+    assert policy.delay(0, throttled) == 2.0
+    throttled.headers["Retry-After"] = "60"
+    assert policy.delay(0, throttled) == 3.0
+
+
+def test_retries_until_the_server_recovers(server, fail):
+    fail(f"waypoint-{YEAR}-A-1", times=2)
+    with DakarAPIClient(year=YEAR, api_template=server.api_template,
+                        retry_policy=FAST_RETRIES) as client:
+        assert not client.get_waypoints(category="A", stage=1).empty
+        assert _metrics(client) == {"requests": 3, "retries": 2, "failures": 0}
+
+
+def test_retries_throttled_requests_after_retry_after(server, fail, monkeypatch):
+    fail(f"waypoint-{YEAR}-A-1", times=1, status=429, headers={"Retry-After": "1"})
+    delays = []
+    delay = RetryPolicy.delay
+    monkeypatch.setattr(RetryPolicy, "delay",
+                        lambda policy, attempt, r=None: delays.append(delay(policy, attempt, r)) or 0)
+    with DakarAPIClient(year=YEAR, api_template=server.api_template,
+                        retry_policy=RetryPolicy(backoff=0.001, jitter=0)) as client:
+        assert not client.get_waypoints(category="A", stage=1).empty
+        assert _metrics(client) == {"requests": 2, "retries": 1, "failures": 0}
+    assert delays == [1.0]
+
+
+def test_gives_up_after_max_retries(server, fail):
+    fail(f"waypoint-{YEAR}-A-1", times=10)
+    with DakarAPIClient(year=YEAR, api_template=server.api_template,
+                        retry_policy=FAST_RETRIES) as client:
+        with pytest.raises(requests.HTTPError):
+            client.get_waypoints(category="A", stage=1)
+        assert _metrics(client) == {"requests": 4, "retries": 3, "failures": 1}
+
+
+def test_does_not_retry_client_errors(server):
+    with DakarAPIClient(year=YEAR, api_template=server.api_template,
+                        retry_policy=FAST_RETRIES) as client:
+        with pytest.raises(requests.HTTPError):
+            client.get_waypoints(category="A", stage=9)
+        assert _metrics(client) == {"requests": 1, "retries": 0, "failures": 1}
+
+
+def test_retries_connection_errors():
+    with DakarAPIClient(year=YEAR, api_template="http://127.0.0.1:1/api/{path}",
+                        retry_policy=FAST_RETRIES) as client:
+        with pytest.raises(requests.ConnectionError):
+            client.get_waypoints(category="A", stage=1)
+        assert _metrics(client) == {"requests": 4, "retries": 3, "failures": 1}
+
+
+def test_token_bucket_limits_the_request_rate(server):
+    bucket = TokenBucket(rate=20, capacity=1)
+    assert bucket.acquire() == 0
+    assert bucket.acquire() > 0
+
+    with DakarAPIClient(year=YEAR, api_template=server.api_template,
+                        rate_limiter=TokenBucket(rate=5, capacity=1)) as client:
+        for stage in (0, 1, 2):
+            client.get_waypoints(category="A", stage=stage)
+        assert client.metrics.get(TEMPLATE, "requests") == 3
+        assert client.metrics.get(TEMPLATE, "throttled") == 2
+        # Two waits of nearly 1/5 s each, less the time taken by the requests
+        assert client.metrics.get(TEMPLATE, "throttled_seconds") >= 0.3
@@ -0,0 +1,70 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+import pytest
+
+from dakar_rallydj.fixtures import FixtureServer
+from dakar_rallydj.getter import DakarAPIClient
+from dakar_rallydj.singleflight import SingleFlight
+
+from conftest import YEAR
+
+THREADS = 10
+
+
+def _concurrently(func):
+    """Call func from several threads at once; returns the results."""
+    barrier = threading.Barrier(THREADS)
+
+    def call(_):
+        barrier.wait()
+        return func()
+
+    with ThreadPoolExecutor(max_workers=THREADS) as executor:
+        return list(executor.map(call, range(THREADS)))
+
+
+def test_single_flight_runs_one_call_per_key():
+    flight, calls = SingleFlight(), []
+
+    def slow():
+        calls.append(1)
+        time.sleep(0.2)
+        return object()
+
+    results = _concurrently(lambda: flight.do("key", slow))
+    assert len(calls) == 1
+    assert len({id(result) for result, _ in results}) == 1
+    assert sorted(shared for _, shared in results) == [False] + [True] * (THREADS - 1)
+    # Nothing is cached once the call completes
+    assert len(flight) == 0
+    flight.do("key", slow)
+    assert len(calls) == 2
+
+
+def test_single_flight_shares_exceptions():
+    flight = SingleFlight()
+
+    def fail():
+        time.sleep(0.2)
+        raise ValueError("upstream")
+
+    def call():
+        with pytest.raises(ValueError, match="upstream"):
+            flight.do("key", fail)
+
+    _concurrently(call)
+
+
+def test_concurrent_getters_make_one_upstream_request(api_dir):
+    with FixtureServer(api_dir, latency=0.2) as server:
+        with DakarAPIClient(year=YEAR, api_template=server.api_template) as client:
+            frames = _concurrently(
+                lambda: client.get_scores(category="A", stage=1).long_results_cg)
+            assert client.metrics.get(DakarAPIClient.SCORE_TEMPLATE, "requests") == 1
+            for df in frames[1:]:
+                pd.testing.assert_frame_equal(df, frames[0])
+            # Each caller still gets its own copy
+            assert len({id(df) for df in frames}) == THREADS
@@ -0,0 +1,89 @@
+import pandas as pd
+import pytest
+
+pytest.importorskip("pyarrow")
+
+from dakar_rallydj.getter import DakarAPIClient
+from dakar_rallydj.snapshot import save_snapshot
+
+from conftest import CATEGORIES, STAGES, YEAR
+
+
+def test_snapshot_round_trip(client, tmp_path):
+    path = str(tmp_path / "snapshot")
+    snapshot = save_snapshot(client, path, CATEGORIES, STAGES)
+    assert len(snapshot) == 2 + 3 * len(CATEGORIES) + 2 * len(CATEGORIES) * len(STAGES)
+
+    # Nothing is served from the (empty) replay directory, so every result comes from the snapshot
+    with DakarAPIClient.from_snapshot(path, replay_dir=str(tmp_path / "empty")) as served:
+        assert served.year == YEAR
+        pd.testing.assert_frame_equal(served.get_category(), client.get_category())
+        pd.testing.assert_frame_equal(served.get_clazz(category=CATEGORIES),
+                                      client.get_clazz(category=CATEGORIES))
+        for expected, df in zip(client.get_withdrawals(category=CATEGORIES),
+                                served.get_withdrawals(category=CATEGORIES)):
+            pd.testing.assert_frame_equal(df, expected)
+        for expected, df in zip(client.get_stages(category="M"), served.get_stages(category="M")):
+            pd.testing.assert_frame_equal(df, expected)
+        for expected, df in zip(client.get_scores(category="A", stage=2),
+                                served.get_scores(category="A", stage=2)):
+            pd.testing.assert_frame_equal(df, expected)
+        pd.testing.assert_frame_equal(served.get_waypoints_bulk(CATEGORIES, STAGES),
+                                      client.get_waypoints_bulk(CATEGORIES, STAGES))
+        assert served.metrics.to_frame().empty
+
+
+def test_snapshot_frames_can_be_modified(client, tmp_path):
+    path = str(tmp_path / "snapshot")
+    save_snapshot(client, path, "A", [1])
+    with DakarAPIClient.from_snapshot(path, replay_dir=str(tmp_path / "empty")) as served:
+        df = served.get_waypoints(category="A", stage=1)
+        df["kilometerPoint"] = 0.0
+        assert (served.get_waypoints(category="A", stage=1)["kilometerPoint"] > 0).all()
+
+        # In place edits too, which write to the mapped buffers unless the frames are copies
+        df = served.get_waypoints(category="A", stage=1)
+        df.loc[df.index[0], "kilometerPoint"] = -1
+        long_results_cg = served.get_scores(category="A", stage=1).long_results_cg
+        long_results_cg["value_0"] += 1
+        pd.testing.assert_frame_equal(served.get_waypoints(category="A", stage=1),
+                                      client.get_waypoints(category="A", stage=1))
+        pd.testing.assert_frame_equal(served.get_scores(category="A", stage=1).long_results_cg,
+                                      client.get_scores(category="A", stage=1).long_results_cg)
+
+
+def test_bulk_waypoints_use_snapshot_frames_per_payload(client, tmp_path):
+    path = str(tmp_path / "snapshot")
+    save_snapshot(client, path, "A", STAGES)
+    with DakarAPIClient.from_snapshot(path, api_template=client.DAKAR_API_TEMPLATE) as served:
+        pd.testing.assert_frame_equal(served.get_waypoints_bulk(CATEGORIES, STAGES),
+                                      client.get_waypoints_bulk(CATEGORIES, STAGES))
+        # Only the category missing from the snapshot is fetched
+        assert served.metrics.get(DakarAPIClient.WAYPOINT_TEMPLATE, "requests") == len(STAGES)
+
+
+@pytest.mark.parametrize("settings", [{"wide_labels": False}, {"backend": "polars"}])
+def test_snapshot_results_with_other_settings_are_missed(client, tmp_path, settings):
+    if settings.get("backend") == "polars":
+        pytest.importorskip("polars")
+    path = str(tmp_path / "snapshot")
+    save_snapshot(client, path, "A", [1])
+    with DakarAPIClient(year=YEAR, api_template=client.DAKAR_API_TEMPLATE, **settings) as direct, \
+            DakarAPIClient.from_snapshot(path, api_template=client.DAKAR_API_TEMPLATE,
+                                         **settings) as served:
+        pd.testing.assert_frame_equal(served.get_category(), direct.get_category())
+        for expected, df in zip(direct.get_stages(category="A"), served.get_stages(category="A")):
+            pd.testing.assert_frame_equal(df, expected)
+        assert served.metrics.get(DakarAPIClient.CATEGORY_TEMPLATE, "requests") == 1
+        assert served.metrics.get(DakarAPIClient.STAGE_TEMPLATE, "requests") == 1
+
+
+def test_snapshot_results_from_another_parser_version_are_missed(client, tmp_path):
+    path = str(tmp_path / "snapshot")
+    save_snapshot(client, path, "A", [1])
+    with DakarAPIClient.from_snapshot(path, api_template=client.DAKAR_API_TEMPLATE) as served:
+        served.get_scores(category="A", stage=1)
+        assert served.metrics.get(DakarAPIClient.SCORE_TEMPLATE, "requests") == 0
+        served.PARSER_VERSIONS = {**served.PARSER_VERSIONS, "scores": served.PARSER_VERSIONS["scores"] + 1}
+        served.get_scores(category="A", stage=1)
+        assert served.metrics.get(DakarAPIClient.SCORE_TEMPLATE, "requests") == 1
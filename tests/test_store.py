@@ -0,0 +1,29 @@
+import os
+
+import pandas as pd
+
+from dakar_rallydj.getter import DakarAPIClient
+from dakar_rallydj.store import PayloadStore
+
+from conftest import YEAR
+
+
+def test_persistent_store_keeps_results_lazy(server, tmp_path):
+    path = str(tmp_path / "store")
+    with DakarAPIClient(year=YEAR, api_template=server.api_template,
+                        store=PayloadStore(path)) as client:
+        result = client.get_scores(category="A", stage=1)
+        waypoint_df = client.get_waypoints(category="A", stage=1)
+        expected = result.long_results_ce
+        assert result.materialised() == ["long_results_ce"]
+
+    # Plain frames are persisted, lazy results are not, as pickling would build every table
+    assert len(os.listdir(os.path.join(path, "parsed"))) == 1
+
+    with DakarAPIClient(year=YEAR, replay_dir=str(tmp_path / "empty"),
+                        store=PayloadStore(path), prefer_store=True) as client:
+        pd.testing.assert_frame_equal(client.get_waypoints(category="A", stage=1), waypoint_df)
+        result = client.get_scores(category="A", stage=1)
+        assert result.materialised() == []
+        pd.testing.assert_frame_equal(result.long_results_ce, expected)
+        assert result.materialised() == ["long_results_ce"]
@@ -0,0 +1,64 @@
+import json
+import os
+
+from dakar_rallydj.warehouse import DakarWarehouse
+
+from conftest import CATEGORIES, STAGES, YEAR
+
+
+def _counts(warehouse):
+    return warehouse.query("SELECT tbl, SUM(rows) AS n FROM _partitions GROUP BY tbl") \
+        .set_index("tbl")["n"].to_dict()
+
+
+def test_refresh_is_idempotent(client, tmp_path):
+    with DakarWarehouse(str(tmp_path / "dakar.db")) as warehouse:
+        written = warehouse.refresh(client, CATEGORIES, STAGES)
+        assert written["long_results"] > 0 and written["waypoints"] > 0
+        counts = _counts(warehouse)
+
+        assert set(warehouse.refresh(client, CATEGORIES, STAGES).values()) == {0}
+        assert _counts(warehouse) == counts
+
+
+def test_refresh_only_writes_changed_rows(client, api_dir, tmp_path):
+    with DakarWarehouse(str(tmp_path / "dakar.db")) as warehouse:
+        warehouse.refresh(client, CATEGORIES, STAGES)
+
+        path = os.path.join(api_dir, f"lastScore-{YEAR}-A-2.json")
+        with open(path) as f:
+            records = json.load(f)
+        records[0]["ce"]["position"] = [99, 99]
+        with open(path, "w") as f:
+            json.dump(records, f)
+
+        written = warehouse.refresh(client, CATEGORIES, STAGES)
+        assert written["long_results2"] == 1
+        assert sum(written.values()) == 1
+        position = warehouse.query(
+            "SELECT value_0 FROM long_results2 WHERE year = ? AND category = 'A' AND stage = 2 "
+            "AND team_bib = ? AND type = 'ce' AND metric = 'position'",
+            [YEAR, records[0]["team"]["bib"]])
+        assert position["value_0"].tolist() == [99]
+
+
+def test_top_ranks_crews_without_a_position_last(client, api_dir, tmp_path):
+    path = os.path.join(api_dir, f"lastScore-{YEAR}-A-1.json")
+    with open(path) as f:
+        records = json.load(f)
+    # An arrival waypoint, at which the first crew has times but no position yet
+    for i, record in enumerate(records):
+        for section in ("cg", "cs"):
+            record[section]["01AS"] = {"absolute": [1000 * (i + 1)] * 2, "relative": [0, 0]}
+            if i:
+                record[section]["01AS"]["position"] = [i, i]
+    with open(path, "w") as f:
+        json.dump(records, f)
+
+    with DakarWarehouse(str(tmp_path / "dakar.db")) as warehouse:
+        warehouse.refresh(client, "A", [1])
+        bibs = [record["team"]["bib"] for record in records]
+        for overall in (False, True):
+            top = warehouse.top(YEAR, "A", 1, n=len(bibs), overall=overall)
+            assert top["team_bib"].tolist() == bibs[1:] + bibs[:1]
+            assert top["position"].isna().tolist() == [False] * (len(bibs) - 1) + [True]
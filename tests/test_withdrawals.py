@@ -0,0 +1,84 @@
+import json
+import os
+
+import pandas as pd
+import pytest
+
+from dakar_rallydj.getter import DakarAPIClient
+
+from conftest import CATEGORIES, YEAR
+
+
+def test_incremental_withdrawals(client, api_dir):
+    first = client.get_withdrawals(category=CATEGORIES, incremental=True)
+    for df, expected in zip(first, client.get_withdrawals(category=CATEGORIES)):
+        pd.testing.assert_frame_equal(df, expected)
+
+    # An unchanged payload is answered 304 Not Modified and adds no rows
+    requests = client.metrics.get(DakarAPIClient.WITHDRAWAL_TEMPLATE, "requests")
+    assert all(df.empty for df in client.get_withdrawals(category=CATEGORIES, incremental=True))
+    assert client.metrics.get(DakarAPIClient.WITHDRAWAL_TEMPLATE, "requests") == requests + 2
+
+    path = os.path.join(api_dir, f"withdrawal-{YEAR}-A.json")
+    with open(path) as f:
+        records = json.load(f)
+    records[-1]["list"].append({"bib": 100, "reason": "Engine",
+                                "team": {"bib": 100, "brand": "BRAND",
+                                         "competitors": [{"name": "Driver 100-0", "role": "P"}]}})
+    with open(path, "w") as f:
+        json.dump(records, f)
+
+    withdrawals_df, competitors_df, teams_df = client.get_withdrawals(category=CATEGORIES,
+                                                                      incremental=True)
+    assert withdrawals_df[["stage", "bib", "reason"]].values.tolist() == [[2, 100, "Engine"]]
+    assert teams_df["team.bib"].tolist() == [100]
+
+    # The tracker's cumulative frames match a full parse of the new payload
+    for df, expected in zip(client.withdrawal_tracker.frames(category=CATEGORIES),
+                            client.get_withdrawals(category=CATEGORIES)):
+        pd.testing.assert_frame_equal(df, expected)
+
+
+def test_failed_category_does_not_lose_the_others(client, server, api_dir):
+    expected = client.get_withdrawals(category="A")
+    os.remove(os.path.join(api_dir, f"withdrawal-{YEAR}-M.json"))
+    with DakarAPIClient(year=YEAR, api_template=server.api_template) as fresh:
+        frames, failures = fresh.get_withdrawals(category=CATEGORIES, return_failures=True)
+        assert list(failures) == ["M"]
+        for df, single in zip(frames, expected):
+            pd.testing.assert_frame_equal(df, single)
+
+        with pytest.warns(RuntimeWarning, match="'M'"):
+            frames = fresh.get_withdrawals(category=CATEGORIES)
+        pd.testing.assert_frame_equal(frames[0], expected[0])
+        with pytest.raises(Exception):
+            fresh.get_withdrawals(category="M")
+
+        frames, failures = fresh.get_withdrawals(category=CATEGORIES, incremental=True,
+                                                 return_failures=True)
+        assert list(failures) == ["M"]
+        pd.testing.assert_frame_equal(frames[0], expected[0])
+
+
+def test_entries_that_fail_to_parse_are_parsed_again(client, api_dir):
+    client.get_withdrawals(category="A", incremental=True)
+
+    path = os.path.join(api_dir, f"withdrawal-{YEAR}-A.json")
+    with open(path) as f:
+        records = json.load(f)
+    # An incomplete entry, without its team's competitors, which fails to parse
+    records[-1]["list"].append({"bib": 100, "reason": "Engine", "team": {"bib": 100}})
+    with open(path, "w") as f:
+        json.dump(records, f)
+    frames, failures = client.get_withdrawals(category="A", incremental=True, return_failures=True)
+    assert list(failures) == ["A"]
+
+    records[-1]["list"][-1]["team"] = {"bib": 100, "brand": "BRAND",
+                                       "competitors": [{"name": "Driver 100-0", "role": "P"}]}
+    with open(path, "w") as f:
+        json.dump(records, f)
+    withdrawals_df, _, _ = client.get_withdrawals(category="A", incremental=True)
+    assert withdrawals_df[["stage", "bib", "reason"]].values.tolist() == [[2, 100, "Engine"]]
+    for df, expected in zip(client.withdrawal_tracker.frames(category="A"),
+                            client.get_withdrawals(category="A")):
+        pd.testing.assert_frame_equal(df, expected)